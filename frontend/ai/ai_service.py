@@ -1,14 +1,20 @@
-import pandas as pd
-import numpy as np
 from .recommendation_engine import RecommendationEngine
 from .demand_forecasting import DemandForecaster
+from .product_index import DEFAULT_PRODUCT_ALIASES, ProductNameIndex
+from .order_lines import OrderLinesTable
 
 class AIService:
     def __init__(self, inventory_manager, order_manager):
         self.inventory_manager = inventory_manager
         self.order_manager = order_manager
-        self.recommendation_engine = RecommendationEngine(inventory_manager, order_manager)
-        self.demand_forecaster = DemandForecaster(order_manager, inventory_manager)
+        # One name index shared by every component, kept current by add_product;
+        # the aliases serve fuzzy lookups of Hinglish names
+        self.product_index = ProductNameIndex.from_inventory(inventory_manager, DEFAULT_PRODUCT_ALIASES)
+        # Orders parsed once into item rows, kept current by add_order
+        self.order_lines = OrderLinesTable.from_order_manager(order_manager)
+        self.recommendation_engine = RecommendationEngine(inventory_manager, order_manager, self.product_index,
+                                                          order_lines=self.order_lines)
+        self.demand_forecaster = DemandForecaster(order_manager, inventory_manager, self.product_index, self.order_lines)
     
     def get_product_recommendations(self, customer_name, recommendation_type="collaborative", top_n=5):
         """
@@ -35,11 +41,9 @@ class AIService:
                 items = first_order['Items']
                 item_name = items.split(', ')[0].split(' (')[0]
                 
-                inventory_df = self.inventory_manager.get_inventory_df()
-                product = inventory_df[inventory_df['Name'].str.contains(item_name, case=False, na=False)]
+                product_id = self.product_index.lookup(item_name)
                 
-                if not product.empty:
-                    product_id = product.iloc[0]['ID']
+                if product_id is not None:
                     return self.recommendation_engine.get_content_based_recommendations(product_id, top_n)
             
             # Fallback to popular products
@@ -49,6 +53,25 @@ class AIService:
         else:
             return self.recommendation_engine.get_collaborative_recommendations(customer_name, top_n)
     
+    def get_frequently_bought_together(self, product_name, top_n=5):
+        """
+        Get products customers order together with a product
+        
+        Args:
+            product_name (str): Product name (aliases and typos are resolved)
+            top_n (int): Number of products to return
+            
+        Returns:
+            list: Products with confidence and lift, highest lift first
+        """
+        product_id = self.product_index.lookup(product_name)
+        if product_id is None:
+            matches = self.product_index.fuzzy_search(product_name, limit=1)
+            if not matches:
+                return []
+            product_id = matches[0][0]
+        return self.recommendation_engine.get_frequently_bought_together(product_id, top_n)
+    
     def get_demand_forecast(self, product_name=None, days_ahead=7):
         """
         Get demand forecast for products
@@ -68,13 +91,13 @@ class AIService:
                 'total_demand': sum(forecast)
             }
         else:
-            # Forecast for all products
+            # Forecast for all products (batched, and parallel if configured)
             inventory_df = self.inventory_manager.get_inventory_df()
+            all_forecasts = self.demand_forecaster.forecast_all(inventory_df['Name'].tolist(), days_ahead)
             forecasts = {}
             
-            for _, product in inventory_df.iterrows():
-                product_name = product['Name']
-                forecast = self.demand_forecaster.forecast_demand(product_name, days_ahead)
+            for product_name in inventory_df['Name']:
+                forecast = all_forecasts[product_name]
                 forecasts[product_name] = {
                     'forecast': forecast,
                     'total_demand': sum(forecast)
@@ -114,7 +137,7 @@ class AIService:
             dict: Comprehensive AI insights
         """
         insights = {
-            'trending_products': self.recommendation_engine.get_popular_products(5),
+            'trending_products': self.recommendation_engine.get_trending_products(30, 5),
             'seasonal_trends': self.get_seasonal_trends(),
             'inventory_recommendations': self.get_inventory_recommendations(7)
         }
@@ -0,0 +1,210 @@
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf')]
+
+RETRY_STATUS_CODES = {502, 503, 504}
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while the backend is marked as down"""
+
+
+class CircuitBreaker:
+    """
+    Stop calling the backend after repeated failures and probe it again
+    once reset_timeout has passed.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow_request(self):
+        with self._lock:
+            state = self.state
+            if state == 'half_open':
+                # Let a single probe through; further calls wait for its result
+                self.opened_at = time.monotonic()
+                return True
+            return state == 'closed'
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LatencyHistogram:
+    """Per-endpoint request latency histogram"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self._counts = defaultdict(lambda: [0] * len(self.buckets))
+        self._totals = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, elapsed_ms):
+        with self._lock:
+            counts = self._counts[endpoint]
+            for i, bound in enumerate(self.buckets):
+                if elapsed_ms <= bound:
+                    counts[i] += 1
+                    break
+            self._totals[endpoint] += elapsed_ms
+
+    def snapshot(self):
+        """
+        Return a summary for every endpoint
+
+        Returns:
+            dict: endpoint -> count, mean_ms and bucket counts keyed by upper bound
+        """
+        with self._lock:
+            summary = {}
+            for endpoint, counts in self._counts.items():
+                count = sum(counts)
+                summary[endpoint] = {
+                    'count': count,
+                    'mean_ms': self._totals[endpoint] / count if count else 0.0,
+                    'buckets': dict(zip(self.buckets, counts))
+                }
+            return summary
+
+
+class BackendClient:
+    """
+    Shared HTTP client for the Express backend.
+
+    Keeps connections alive in a pooled session, retries idempotent calls with
+    jittered exponential backoff, fails fast through a circuit breaker while the
+    backend is down, and records per-endpoint latency.
+    """
+
+    def __init__(self, base_url=None, timeout=5, retries=2, backoff=0.2, pool_size=10,
+                 failure_threshold=5, reset_timeout=30):
+        self.base_url = (base_url or os.getenv('BACKEND_URL', 'http://localhost:3001/api')).rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.latency = LatencyHistogram()
+
+    @staticmethod
+    def endpoint_name(method, path):
+        """Collapse numeric IDs so /products/7/deduct-stock and /products/8/... share a histogram"""
+        return f"{method} {_ID_SEGMENT.sub('/:id', path)}"
+
+    def request(self, method, path, retry=None, **kwargs):
+        """
+        Send a request to the backend
+
+        Args:
+            method (str): HTTP method
+            path (str): Path relative to the API base URL, e.g. '/inventory/products'
+            retry (bool, optional): Retry on failure. Defaults to True for GET only,
+                so stock deductions are never sent twice.
+
+        Returns:
+            requests.Response: The final response
+        """
+        if retry is None:
+            retry = method.upper() == 'GET'
+        attempts = self.retries + 1 if retry else 1
+        kwargs.setdefault('timeout', self.timeout)
+        endpoint = self.endpoint_name(method.upper(), path)
+
+        for attempt in range(attempts):
+            if not self.breaker.allow_request():
+                raise CircuitOpenError(f"Backend circuit is open; skipping {endpoint}")
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self.latency.record(endpoint, (time.perf_counter() - started) * 1000)
+                self.breaker.record_failure()
+                if attempt == attempts - 1:
+                    raise
+            else:
+                self.latency.record(endpoint, (time.perf_counter() - started) * 1000)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if attempt == attempts - 1:
+                    return response
+
+            # Full jitter keeps concurrent callers from retrying in lockstep
+            time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+    def latency_stats(self):
+        """Return the per-endpoint latency histograms"""
+        return self.latency.snapshot()
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncBackendClient:
+    """
+    asyncio counterpart of BackendClient.
+
+    Calls run on worker threads against the wrapped client, so both share the
+    connection pool, circuit breaker and latency histograms.
+    """
+
+    def __init__(self, client=None, **kwargs):
+        self.client = client if client is not None else BackendClient(**kwargs)
+
+    async def request(self, method, path, **kwargs):
+        return await asyncio.to_thread(self.client.request, method, path, **kwargs)
+
+    async def get(self, path, **kwargs):
+        return await self.request('GET', path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request('POST', path, **kwargs)
+
+    def latency_stats(self):
+        return self.client.latency_stats()
@@ -0,0 +1,177 @@
+import time
+import tracemalloc
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+from .demand_forecasting import DemandForecaster
+from .order_lines import OrderLinesTable
+
+# Forecasting modes compared by default: label -> DemandForecaster keyword arguments
+DEFAULT_MODES = {
+    'polynomial': {'backend': 'polynomial'},
+    'ses': {'backend': 'ses'},
+    'holt': {'backend': 'holt'},
+    'croston': {'backend': 'croston'},
+    'sba': {'backend': 'sba'},
+    'auto': {'backend': 'auto'},
+    'global': {'backend': 'global'}
+}
+
+
+class ForecastBacktester:
+    """
+    Rolling-origin evaluation of DemandForecaster modes.
+
+    For each origin (a cut-off date), every mode forecasts all products at
+    once from the history up to that day, and the forecasts are compared with
+    the demand actually ordered over the following `horizon` days. Origins
+    step back from the end of the order history.
+    """
+
+    def __init__(self, order_manager, inventory_manager, horizon=7, n_origins=4, step=7, order_lines=None):
+        self.order_manager = order_manager
+        self.inventory_manager = inventory_manager
+        self.horizon = horizon
+        self.n_origins = n_origins
+        self.step = step
+
+        if order_lines is None:
+            order_lines = OrderLinesTable(order_manager.orders_data)
+        self.order_lines = order_lines
+
+    def origins(self, product_names=None):
+        """
+        Cut-off dates, oldest first; each leaves a full horizon of known demand after it
+
+        Args:
+            product_names (list, optional): Products whose demand, imported history
+                included, sets the latest date; defaults to the whole inventory
+
+        Returns:
+            list: Origin timestamps
+        """
+        if product_names is None:
+            product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        self.order_lines.track_products(product_names)
+        daily = self.order_lines.daily_demand()
+        if daily.empty:
+            return []
+        last_date = daily.index.get_level_values('date').max()
+        latest = last_date - timedelta(days=self.horizon)
+        return [latest - timedelta(days=self.step * i) for i in reversed(range(self.n_origins))]
+
+    def actuals(self, product_names, origin):
+        """
+        Demand ordered in the `horizon` days after the origin
+
+        Returns:
+            np.ndarray: Quantities with shape (n_products, horizon), zero on days without orders
+        """
+        self.order_lines.track_products(product_names)
+        daily = self.order_lines.daily_demand().reset_index()
+        offsets = (daily['date'] - origin).dt.days
+        daily = daily[daily['product'].isin(product_names) & (offsets >= 1) & (offsets <= self.horizon)]
+
+        actual = np.zeros((len(product_names), self.horizon))
+        rows = pd.Categorical(daily['product'], categories=product_names).codes
+        actual[rows, (daily['date'] - origin).dt.days.to_numpy() - 1] = daily['quantity'].to_numpy()
+        return actual
+
+    def _run_origin(self, forecaster, product_names, origin):
+        forecaster.models = {}
+        forecaster.reference_date = origin
+
+        started = time.perf_counter()
+        forecaster.fit(product_names)
+        fitted = time.perf_counter()
+        forecasts = forecaster.forecast_all(product_names, self.horizon)
+        predicted = time.perf_counter()
+
+        predictions = np.array([forecasts[name] for name in product_names], dtype=np.float64)
+        return predictions, fitted - started, predicted - fitted
+
+    def evaluate(self, label='auto', product_names=None, measure_memory=True, **forecaster_kwargs):
+        """
+        Backtest one forecasting mode
+
+        Args:
+            label (str): Name to report; also the backend when no kwargs are given
+            product_names (list, optional): Products to evaluate; defaults to the whole inventory
+            measure_memory (bool): Re-run the first origin under tracemalloc to record peak memory
+            **forecaster_kwargs: DemandForecaster options, e.g. backend='sba' or batch_training=False
+
+        Returns:
+            dict: Accuracy (mae, mape, bias) and cost (fit_s, predict_s, peak_mb) for the mode
+        """
+        if product_names is None:
+            product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        product_names = list(dict.fromkeys(product_names))
+        if not forecaster_kwargs:
+            forecaster_kwargs = dict(DEFAULT_MODES.get(label, {'backend': label}))
+        forecaster_kwargs.setdefault('workers', 1)
+
+        forecaster = DemandForecaster(self.order_manager, self.inventory_manager,
+                                      order_lines=self.order_lines, online_updates=False,
+                                      **forecaster_kwargs)
+        origins = self.origins(product_names)
+
+        errors = []
+        actual_totals = []
+        fit_s = predict_s = 0.0
+        peak_mb = None
+        try:
+            for origin in origins:
+                predictions, fit_time, predict_time = self._run_origin(forecaster, product_names, origin)
+                actual = self.actuals(product_names, origin)
+                errors.append(predictions - actual)
+                actual_totals.append(actual)
+                fit_s += fit_time
+                predict_s += predict_time
+
+            if measure_memory and origins:
+                tracemalloc.start()
+                try:
+                    self._run_origin(forecaster, product_names, origins[0])
+                    peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                finally:
+                    tracemalloc.stop()
+        finally:
+            forecaster.close()
+
+        result = {
+            'mode': label,
+            'products': len(product_names),
+            'origins': len(origins),
+            'mae': None,
+            'mape': None,
+            'bias': None,
+            'fit_s': fit_s,
+            'predict_s': predict_s,
+            'peak_mb': peak_mb
+        }
+        if errors:
+            errors = np.concatenate(errors)
+            actual = np.concatenate(actual_totals)
+            # MAPE over days with demand only; intermittent series are mostly zeros
+            ordered = actual > 0
+            result['mae'] = float(np.abs(errors).mean())
+            result['mape'] = float((np.abs(errors[ordered]) / actual[ordered]).mean() * 100) if ordered.any() else None
+            result['bias'] = float(errors.mean())
+        return result
+
+    def run(self, modes=None, product_names=None, measure_memory=True):
+        """
+        Backtest several modes on the same origins and products
+
+        Args:
+            modes (dict or list, optional): Labels, or label -> DemandForecaster kwargs; defaults to DEFAULT_MODES
+
+        Returns:
+            list: One result dict per mode (see evaluate)
+        """
+        if modes is None:
+            modes = DEFAULT_MODES
+        if not isinstance(modes, dict):
+            modes = {label: DEFAULT_MODES.get(label, {'backend': label}) for label in modes}
+
+        return [self.evaluate(label, product_names, measure_memory, **kwargs) for label, kwargs in modes.items()]
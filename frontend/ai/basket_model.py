@@ -0,0 +1,159 @@
+import os
+from collections import Counter, defaultdict
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from .order_lines import parse_items
+
+
+class CoOccurrenceModel:
+    """
+    Items ordered together ("customers who order atta also order oil").
+
+    Pair counts for the existing history come from one sparse product of
+    the order × item matrix with itself; later orders add their pairs to a
+    small update table. Each item's top_k partners by lift are ranked on its
+    first lookup and again only after an order containing it; other lookups
+    read at most top_k stored partners, with lift from the current counts.
+
+    For items a and b over N orders:
+        confidence(a -> b) = orders(a, b) / orders(a)
+        lift(a, b) = orders(a, b) * N / (orders(a) * orders(b))
+    """
+
+    def __init__(self, top_k=None, min_support=2):
+        """
+        Args:
+            top_k (int, optional): Partners kept per item; defaults to BASKET_TOP_K
+            min_support (int): Orders a pair needs before it is suggested
+        """
+        self.top_k = int(top_k or os.getenv('BASKET_TOP_K', 20))
+        self.min_support = min_support
+        self.n_orders = 0
+        self.items = {}
+        self.item_names = []
+        self.counts = np.zeros(0)
+
+        self._pairs = sparse.csr_matrix((0, 0))
+        self._pair_updates = defaultdict(Counter)
+        self._top = {}
+        self._dirty = set()
+
+    @classmethod
+    def from_order_manager(cls, order_manager, order_lines=None, **kwargs):
+        """
+        Build from the current orders and keep the model updated on add_order
+
+        Args:
+            order_lines (OrderLinesTable, optional): Already parsed lines of the same orders
+        """
+        model = cls(**kwargs)
+        if order_lines is not None:
+            model.fit(order_lines.frame)
+        else:
+            model.fit(pd.DataFrame(
+                [(order['Order ID'], name) for order in order_manager.orders_data
+                 for name, _, _ in parse_items(order['Items'])],
+                columns=['order_id', 'item']
+            ))
+        order_manager.add_listener(model.add_order)
+        return model
+
+    def fit(self, lines):
+        """
+        Count items and pairs over all orders in one pass
+
+        Args:
+            lines (pd.DataFrame): order_id and item columns, one row per order line
+        """
+        lines = lines[['order_id', 'item']].drop_duplicates()
+        order_codes, orders = pd.factorize(lines['order_id'])
+        item_codes, items = pd.factorize(lines['item'])
+
+        baskets = sparse.csr_matrix((np.ones(len(lines)), (order_codes, item_codes)),
+                                    shape=(len(orders), len(items)))
+        pairs = (baskets.T @ baskets).tocsr()
+        self.counts = pairs.diagonal().astype(np.float64)
+        pairs.setdiag(0)
+        pairs.eliminate_zeros()
+
+        self.n_orders = len(orders)
+        self.item_names = list(items)
+        self.items = {name: i for i, name in enumerate(self.item_names)}
+        self._pairs = pairs
+        self._pair_updates = defaultdict(Counter)
+        self._top = {}
+        self._dirty = set(range(len(self.item_names)))
+        return self
+
+    def add_order(self, order):
+        """Count the items of one new order and their pairs"""
+        names = list(dict.fromkeys(name for name, _, _ in parse_items(order['Items'])))
+        if not names:
+            return
+
+        for name in names:
+            if name not in self.items:
+                self.items[name] = len(self.item_names)
+                self.item_names.append(name)
+        if len(self.counts) < len(self.item_names):
+            self.counts = np.concatenate([self.counts, np.zeros(len(self.item_names) - len(self.counts))])
+
+        codes = [self.items[name] for name in names]
+        self.n_orders += 1
+        self.counts[codes] += 1
+        for a in codes:
+            for b in codes:
+                if a != b:
+                    self._pair_updates[a][b] += 1
+        self._dirty.update(codes)
+
+    def _partners(self, a):
+        """Partner items of item a and the number of orders they share"""
+        partners, together = np.zeros(0, dtype=np.int64), np.zeros(0)
+        if a < self._pairs.shape[0]:
+            start, end = self._pairs.indptr[a], self._pairs.indptr[a + 1]
+            partners, together = self._pairs.indices[start:end].astype(np.int64), self._pairs.data[start:end]
+        updates = self._pair_updates.get(a)
+        if updates:
+            partners = np.concatenate([partners, np.fromiter(updates.keys(), dtype=np.int64, count=len(updates))])
+            together = np.concatenate([together, np.fromiter(updates.values(), dtype=np.float64, count=len(updates))])
+            partners, inverse = np.unique(partners, return_inverse=True)
+            together = np.bincount(inverse, weights=together)
+        return partners, together
+
+    def _rank(self, a):
+        partners, together = self._partners(a)
+        keep = together >= self.min_support
+        partners, together = partners[keep], together[keep]
+        lift = together / self.counts[partners]
+        if len(partners) > self.top_k:
+            best = np.argpartition(-lift, self.top_k - 1)[:self.top_k]
+            partners, together, lift = partners[best], together[best], lift[best]
+        order = np.lexsort((-together, -lift))
+        self._top[a] = (partners[order], together[order])
+        self._dirty.discard(a)
+
+    def frequently_bought_with(self, item, top_n=5):
+        """
+        Items most often ordered together with an item, by lift
+
+        Returns:
+            list: dicts with item, orders_together, confidence and lift, best first
+        """
+        a = self.items.get(item)
+        if a is None:
+            return []
+        if a in self._dirty or a not in self._top:
+            self._rank(a)
+
+        partners, together = self._top[a]
+        return [
+            {
+                'item': self.item_names[b],
+                'orders_together': int(n),
+                'confidence': float(n / self.counts[a]),
+                'lift': float(n * self.n_orders / (self.counts[a] * self.counts[b]))
+            }
+            for b, n in zip(partners[:top_n].tolist(), together[:top_n].tolist())
+        ]
@@ -0,0 +1,209 @@
+from itertools import combinations_with_replacement
+import math
+import numpy as np
+
+
+def polynomial_features(X, degree=2):
+    """
+    Expand features the way sklearn's PolynomialFeatures does: a bias column,
+    then every monomial up to `degree` in the same column order
+
+    Args:
+        X (array): Features with shape (..., n_features)
+        degree (int): Maximum monomial degree
+
+    Returns:
+        np.ndarray: Expanded features with shape (..., n_output_features)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    columns = [np.ones(X.shape[:-1])]
+    for d in range(1, degree + 1):
+        for combination in combinations_with_replacement(range(X.shape[-1]), d):
+            columns.append(np.prod(X[..., list(combination)], axis=-1))
+    return np.stack(columns, axis=-1)
+
+
+def pad_groups(values, codes, n_groups):
+    """
+    Scatter rows into one zero-padded block per group, keeping their order
+
+    Args:
+        values (array): Rows with shape (n_rows, ...)
+        codes (array): Group number of each row, in range(n_groups)
+        n_groups (int): Number of groups
+
+    Returns:
+        tuple: (padded array of shape (n_groups, max_rows, ...), row count per group)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.asarray(codes, dtype=np.int64)
+    counts = np.bincount(codes, minlength=n_groups)
+
+    order = np.argsort(codes, kind='stable')
+    starts = np.cumsum(counts) - counts
+    positions = np.empty(len(codes), dtype=np.int64)
+    positions[order] = np.arange(len(codes)) - np.repeat(starts, counts)
+
+    padded = np.zeros((n_groups, counts.max(initial=0)) + values.shape[1:])
+    padded[codes, positions] = values
+    return padded, counts
+
+
+def fit_least_squares_batch(X, y, counts):
+    """
+    Solve many independent least-squares problems (with intercept) at once
+
+    Each problem is centered and solved for the minimum-norm coefficients,
+    as LinearRegression does, so rank-deficient products (fewer days of
+    history than features) get the same fit. Padding rows must be zero.
+
+    Args:
+        X (np.ndarray): Design matrices with shape (n_problems, max_rows, n_features)
+        y (np.ndarray): Targets with shape (n_problems, max_rows)
+        counts (np.ndarray): Number of real rows in each problem
+
+    Returns:
+        tuple: (coefficients of shape (n_problems, n_features), intercepts of shape (n_problems,))
+    """
+    mask = np.arange(X.shape[1]) < counts[:, None]
+    n = np.maximum(counts, 1)
+
+    x_mean = X.sum(axis=1) / n[:, None]
+    y_mean = y.sum(axis=1) / n
+    X_centered = (X - x_mean[:, None, :]) * mask[..., None]
+    y_centered = (y - y_mean[:, None]) * mask
+
+    # Singular values at rounding-noise level (numpy lstsq's default cutoff) are
+    # treated as zero; keeping them lets noise swing the extrapolated forecast
+    rcond = np.finfo(np.float64).eps * np.maximum(counts, X.shape[2])
+    pinv = np.linalg.pinv(X_centered, rcond=rcond)
+    coef = np.einsum('pkn,pn->pk', pinv, y_centered)
+    intercept = y_mean - np.einsum('pk,pk->p', x_mean, coef)
+    return coef, intercept
+
+
+class PolynomialModel:
+    """
+    Fitted polynomial regression for one series; a lightweight stand-in for
+    Pipeline(PolynomialFeatures, LinearRegression) produced by a batched fit
+    """
+
+    def __init__(self, coef, intercept, degree=2):
+        self.coef = coef
+        self.intercept = intercept
+        self.degree = degree
+
+    def predict(self, X):
+        return polynomial_features(X, self.degree) @ self.coef + self.intercept
+
+
+def predict_batch(X, coef, intercept, degree=2):
+    """
+    Predict the same feature rows for many fitted models in one call
+
+    Args:
+        X (array): Features with shape (n_rows, n_features)
+        coef (np.ndarray): Coefficients with shape (n_models, n_output_features)
+        intercept (np.ndarray): Intercepts with shape (n_models,)
+
+    Returns:
+        np.ndarray: Predictions with shape (n_models, n_rows)
+    """
+    return coef @ polynomial_features(X, degree).T + intercept[:, None]
+
+
+
+def _rotate_in(R, row):
+    """Fold a row into an upper-triangular R factor with Givens rotations, in place"""
+    # Plain floats: at this size per-element numpy calls cost more than the arithmetic
+    rows = R.tolist()
+    row = list(row)
+    for i in range(len(row)):
+        b = row[i]
+        if b == 0.0:
+            continue
+        top = rows[i]
+        radius = math.hypot(top[i], b)
+        c, s = top[i] / radius, b / radius
+        for j in range(i, len(row)):
+            upper, lower = top[j], row[j]
+            top[j] = c * upper + s * lower
+            row[j] = c * lower - s * upper
+    R[:] = rows
+
+
+class OnlineLeastSquares:
+    """
+    Least squares with intercept, kept current as rows arrive.
+
+    Keeps only the R factor of the QR decomposition of [features | target].
+    Adding a row is one sweep of Givens rotations, O(k²) for k features,
+    and solving never revisits old rows. The newest row is held back until
+    the next one arrives so its target can still grow, e.g. when more
+    orders come in on the same day. Features must start with a bias column.
+    """
+
+    def __init__(self, n_features):
+        self.R = np.zeros((n_features + 1, n_features + 1))
+        self.pending = None
+        self.n = 0
+
+    @classmethod
+    def from_padded(cls, X, y, counts):
+        """
+        Start one instance per problem from zero-padded rows, factoring all of them in one call
+
+        Args:
+            X (np.ndarray): Features with shape (n_problems, max_rows, n_features), bias column first
+            y (np.ndarray): Targets with shape (n_problems, max_rows)
+            counts (np.ndarray): Number of real rows in each problem (at least one)
+
+        Returns:
+            list: OnlineLeastSquares instances
+        """
+        n_problems, _, n_features = X.shape
+        augmented = np.concatenate([X, y[..., None]], axis=2)
+        last = augmented[np.arange(n_problems), counts - 1].copy()
+        augmented[np.arange(n_problems), counts - 1] = 0.0
+
+        factors = np.linalg.qr(augmented, mode='r')
+        instances = []
+        for i in range(n_problems):
+            instance = cls(n_features)
+            instance.R[:factors.shape[1]] = factors[i]
+            instance.pending = last[i]
+            instance.n = int(counts[i])
+            instances.append(instance)
+        return instances
+
+    def add_row(self, x, y):
+        """Add an observation"""
+        if self.pending is not None:
+            _rotate_in(self.R, self.pending)
+        self.pending = np.append(np.asarray(x, dtype=np.float64), y)
+        self.n += 1
+
+    def add_to_target(self, delta):
+        """Increase the target of the most recently added row"""
+        self.pending[-1] += delta
+
+    def solve(self):
+        """
+        Solve for the same coefficients LinearRegression would find: the
+        intercept is left unpenalized and the remaining coefficients take
+        the minimum-norm solution, with the bias column's coefficient at zero
+
+        Returns:
+            tuple: (coefficients, intercept)
+        """
+        R = self.R.copy()
+        if self.pending is not None:
+            _rotate_in(R, self.pending)
+
+        k = R.shape[0] - 1
+        # Rows 1.. of R factor the design with the bias direction projected out,
+        # i.e. the centered problem, so its singular values match fit_least_squares_batch
+        rcond = np.finfo(np.float64).eps * max(self.n, k)
+        coef = np.linalg.pinv(R[1:k, 1:k], rcond=rcond) @ R[1:k, k]
+        intercept = (R[0, k] - R[0, 1:k] @ coef) / R[0, 0]
+        return np.concatenate(([0.0], coef)), float(intercept)
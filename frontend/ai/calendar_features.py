@@ -0,0 +1,114 @@
+import threading
+import warnings
+import numpy as np
+import pandas as pd
+
+# Main festival day per year. Eid al-Fitr depends on the moon sighting, so
+# its dates may shift by a day. Years outside these lists get no festival flags.
+FESTIVAL_DATES = {
+    'diwali': ['2020-11-14', '2021-11-04', '2022-10-24', '2023-11-12', '2024-10-31', '2025-10-20', '2026-11-08',
+               '2027-10-29', '2028-10-17', '2029-11-05', '2030-10-26'],
+    'holi': ['2020-03-10', '2021-03-29', '2022-03-18', '2023-03-08', '2024-03-25', '2025-03-14', '2026-03-04',
+             '2027-03-22', '2028-03-11', '2029-03-01', '2030-03-20'],
+    'eid': ['2020-05-25', '2021-05-14', '2022-05-03', '2023-04-22', '2024-04-11', '2025-03-31', '2026-03-21',
+            '2027-03-10', '2028-02-27', '2029-02-15', '2030-02-05']
+}
+
+# Shopping starts about a week ahead of a festival and ends on the day after
+FESTIVAL_WINDOW = (-7, 1)
+
+# Salaries land on the last day of the month; spending stays high for the first few days
+PAYDAY_FIRST_DAYS = 5
+
+
+class CalendarFeatures:
+    """
+    Day-level calendar features, computed once for a range of years and
+    looked up by position (days since the table's first date).
+
+    Columns: day_of_week, day_of_month, month, payday, one window flag per
+    festival and 'festival' (inside any festival's window). The table grows
+    to whole years when a date outside it is looked up, so a single instance
+    can be shared by every product model. Building years that a festival has
+    no dates for raises a warning, since those years would get no flags.
+    """
+
+    def __init__(self, start_year=2020, end_year=2030, festivals=None):
+        self.festivals = {name: pd.to_datetime(dates) for name, dates in (festivals or FESTIVAL_DATES).items()}
+        self.columns = ['day_of_week', 'day_of_month', 'month', 'payday'] + list(self.festivals) + ['festival']
+        self._lock = threading.Lock()
+        # (first date, last date, values) swapped as one tuple so lookups never mix two builds
+        self._data = self._build(start_year, end_year)
+
+    def _build(self, start_year, end_year):
+        for name, festival_dates in self.festivals.items():
+            missing = sorted(set(range(start_year, end_year + 1)) - set(festival_dates.year))
+            if missing:
+                years = f"{missing[0]}" if len(missing) == 1 else f"{missing[0]}-{missing[-1]}"
+                warnings.warn(f"No {name} dates for {years}; those days get no {name} flag", stacklevel=3)
+
+        dates = pd.date_range(f'{start_year}-01-01', f'{end_year}-12-31', freq='D')
+        table = pd.DataFrame(index=dates)
+        table['day_of_week'] = dates.dayofweek
+        table['day_of_month'] = dates.day
+        table['month'] = dates.month
+        table['payday'] = ((dates.day <= PAYDAY_FIRST_DAYS) | dates.is_month_end).astype(int)
+
+        days = dates.values.astype('datetime64[D]').astype(np.int64)
+        before, after = FESTIVAL_WINDOW
+        for name, festival_dates in self.festivals.items():
+            festival_days = np.sort(festival_dates.values.astype('datetime64[D]').astype(np.int64))
+            in_window = np.zeros(len(dates), dtype=bool)
+            if len(festival_days):
+                # Latest possible festival for each day is the first one on or after day - after
+                next_index = np.searchsorted(festival_days, days - after, side='left')
+                offset = days - festival_days[np.minimum(next_index, len(festival_days) - 1)]
+                in_window = (next_index < len(festival_days)) & (offset >= before) & (offset <= after)
+            table[name] = in_window.astype(int)
+        table['festival'] = table[list(self.festivals)].max(axis=1) if self.festivals else 0
+
+        first, last = days[[0, -1]].astype('datetime64[D]')
+        return first, last, table[self.columns].to_numpy(dtype=np.float64)
+
+    @property
+    def table(self):
+        """The whole feature table as a DataFrame indexed by date"""
+        first, last, values = self._data
+        return pd.DataFrame(values, index=pd.date_range(first, last, freq='D'), columns=self.columns)
+
+    def lookup(self, dates):
+        """
+        Calendar features for each date
+
+        Args:
+            dates: Dates (datetime64 values, Timestamps or ISO strings); times of day are ignored
+
+        Returns:
+            np.ndarray: One row per date, columns in self.columns order
+        """
+        days = np.asarray(dates, dtype='datetime64[D]')
+        if len(days) == 0:
+            return np.empty((0, len(self.columns)))
+
+        first, last, values = self._data
+        if days.min() < first or days.max() > last:
+            with self._lock:
+                first, last, values = self._data
+                if days.min() < first or days.max() > last:
+                    start_year = min(pd.Timestamp(days.min()).year, pd.Timestamp(first).year)
+                    end_year = max(pd.Timestamp(days.max()).year, pd.Timestamp(last).year)
+                    self._data = self._build(start_year, end_year)
+                first, last, values = self._data
+
+        return values[(days - first).astype(np.int64)]
+
+
+_calendar = None
+
+
+def get_calendar():
+    """The calendar feature table shared by every forecaster in the process"""
+    global _calendar
+    if _calendar is None:
+        _calendar = CalendarFeatures()
+    return _calendar
@@ -0,0 +1,127 @@
+import os
+import time
+from .product_index import ProductNameIndex
+
+
+class CatalogCache:
+    """
+    Local replica of the backend product catalog (/inventory/products).
+
+    The list is served from memory while it is younger than the TTL. Once it
+    expires it is revalidated with the ETag the backend sent, so an unchanged
+    catalog costs a 304 instead of a full download. Stock deductions made by
+    the chat are applied in place from the deduct-stock responses; any other
+    change reaches the cache on the next revalidation.
+    """
+
+    def __init__(self, client, ttl=None, on_reload=None):
+        self.client = client
+        self.ttl = float(ttl if ttl is not None else os.getenv('CATALOG_TTL_SECONDS', 30))
+        self.on_reload = on_reload
+
+        self.product_index = ProductNameIndex()
+        self.version = 0
+        self._products = {}
+        self._etag = None
+        self._fetched_at = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.updates = 0
+
+    @property
+    def age(self):
+        """Seconds since the catalog was last fetched or revalidated, or None"""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def is_fresh(self):
+        age = self.age
+        return age is not None and age < self.ttl
+
+    def invalidate(self):
+        """Force the next read to go back to the backend"""
+        self._fetched_at = None
+
+    def products(self):
+        """
+        Get the product list, fetching or revalidating it only when the TTL has expired
+
+        Returns:
+            list: Product dicts in backend order, or None if the backend returned an error
+        """
+        if self.is_fresh():
+            self.hits += 1
+            return list(self._products.values())
+
+        headers = {}
+        if self._fetched_at is not None:
+            self.stale += 1
+        else:
+            self.misses += 1
+        if self._etag and self._products:
+            headers['If-None-Match'] = self._etag
+
+        response = self.client.get('/inventory/products', headers=headers)
+
+        if response.status_code == 304:
+            self.revalidated += 1
+            self._fetched_at = time.monotonic()
+            return list(self._products.values())
+
+        if response.status_code != 200:
+            return None
+
+        self._load(response.json().get('data', []))
+        self._etag = response.headers.get('ETag')
+        self._fetched_at = time.monotonic()
+        return list(self._products.values())
+
+    def _load(self, products):
+        self._products = {product['id']: product for product in products}
+        self.product_index.sync((product['id'], product['name']) for product in products)
+        self.version += 1
+
+        if self.on_reload is not None:
+            self.on_reload(products)
+
+    def get(self, product_id):
+        """Return a cached product by ID, or None"""
+        return self._products.get(product_id)
+
+    def find(self, product_name):
+        """Resolve a product name against the cached catalog"""
+        product_id = self.product_index.lookup(product_name)
+        return self._products.get(product_id) if product_id is not None else None
+
+    def apply_update(self, product):
+        """
+        Apply a product row returned by the backend (the chat only sends deduct-stock).
+        The ETag no longer describes our copy, so the next revalidation is a full fetch.
+        """
+        if not product or 'id' not in product:
+            return
+
+        self._products[product['id']] = product
+        if 'name' in product:
+            self.product_index.add(product['id'], product['name'])
+        self._etag = None
+        self.version += 1
+        self.updates += 1
+
+    def stats(self):
+        """Return cache counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'revalidated': self.revalidated,
+            'updates': self.updates,
+            'products': len(self._products),
+            'age': self.age,
+            'version': self.version
+        }
@@ -5,75 +5,208 @@ from sklearn.preprocessing import PolynomialFeatures
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import mean_absolute_error
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import json
+import os
+from .product_index import ProductNameIndex
+from .order_lines import OrderLinesTable, parse_items
+from .history_import import import_order_history
+from .calendar_features import get_calendar
+from .global_model import GlobalDemandModel
+from .batch_regression import (OnlineLeastSquares, PolynomialModel, fit_least_squares_batch,
+                               pad_groups, polynomial_features, predict_batch)
+from .forecast_backends import FORECAST_BACKENDS, PATTERN_BACKENDS, demand_patterns
+
+# Looked up in the shared calendar table; days_since_start is per product
+CALENDAR_FEATURES = ['day_of_week', 'day_of_month', 'month', 'payday', 'festival']
+FEATURE_COLUMNS = CALENDAR_FEATURES + ['days_since_start']
+
+
+class _InventorySnapshot:
+    """Read-only stand-in for InventoryManager inside forecast worker processes"""
+    
+    def __init__(self, inventory_data):
+        self.inventory_data = inventory_data
+        self._products_by_id = {item['ID']: item for item in inventory_data}
+    
+    def add_listener(self, callback):
+        pass
+    
+    def remove_listener(self, callback):
+        pass
+    
+    def get_inventory_df(self):
+        return pd.DataFrame(self.inventory_data)
+    
+    def get_product(self, product_id):
+        product = self._products_by_id.get(product_id)
+        return dict(product) if product is not None else None
+
+
+class _OrderSnapshot:
+    """Stand-in for OrderManager; workers read orders from the shipped order-lines table"""
+    
+    orders_data = []
+    
+    def add_listener(self, callback):
+        pass
+    
+    def remove_listener(self, callback):
+        pass
+
+
+# Forecaster rebuilt once per worker process from the state the parent ships
+_worker_forecaster = None
+
+def _init_forecast_worker(state):
+    global _worker_forecaster
+    _worker_forecaster = DemandForecaster(
+        _OrderSnapshot(), _InventorySnapshot(state['inventory_data']),
+        order_lines=state['order_lines'], batch_training=state['batch_training'],
+        online_updates=False, workers=1, backend=state['backend']
+    )
+    _worker_forecaster.models = state['models']
+    _worker_forecaster.reference_date = state['reference_date']
+
+def _forecast_worker_chunk(product_names, days_ahead):
+    trained_before = set(_worker_forecaster.models)
+    forecasts = _worker_forecaster._forecast_chunk(product_names, days_ahead)
+    models = {name: info for name, info in _worker_forecaster.models.items()
+              if name not in trained_before and name in forecasts}
+    return forecasts, models
+
 
 class DemandForecaster:
-    def __init__(self, order_manager, inventory_manager):
+    def __init__(self, order_manager, inventory_manager, product_index=None, order_lines=None,
+                 batch_training=True, online_updates=True, workers=None, chunk_size=None, backend=None):
         self.order_manager = order_manager
         self.inventory_manager = inventory_manager
         self.models = {}
+        # Fit all products with one vectorized solve instead of a sklearn pipeline each
+        self.batch_training = batch_training
+        # Forecast start date; None means now
+        self.reference_date = None
+        self._seasonal_cache = None
+        
+        # Calendar and festival features, precomputed once per process
+        self.calendar = get_calendar()
+        self._calendar_positions = [self.calendar.columns.index(column) for column in CALENDAR_FEATURES]
+        
+        # 'polynomial' (regression on calendar features), a FORECAST_BACKENDS name,
+        # 'auto' to pick a statistical backend per product from its demand pattern,
+        # or 'global' for one model pooled across products (see GlobalDemandModel)
+        self.backend = backend or os.getenv('FORECAST_BACKEND', 'polynomial')
+        if self.backend not in ('polynomial', 'auto', 'global') and self.backend not in FORECAST_BACKENDS:
+            raise ValueError(f"Unknown forecast backend {self.backend!r}; expected 'polynomial', 'auto', "
+                             f"'global' or one of {tuple(FORECAST_BACKENDS)}")
+        self._global_model = None
+        self._global_key = None
+        
+        # Spread forecast_all over a process pool when more than one worker is configured
+        self.workers = int(workers if workers is not None else os.getenv('FORECAST_WORKERS', 1))
+        self.chunk_size = int(chunk_size if chunk_size is not None else os.getenv('FORECAST_CHUNK_SIZE', 256))
+        
+        # (manager, callback) pairs registered by this forecaster; close() removes them
+        self._listeners = []
+        
+        if product_index is None:
+            product_index = ProductNameIndex.from_inventory(inventory_manager)
+            self._listeners.append((inventory_manager, product_index.add_record))
+        self.product_index = product_index
+        
+        if order_lines is None:
+            order_lines = OrderLinesTable.from_order_manager(order_manager)
+            self._listeners.append((order_manager, order_lines.add_order))
+        self.order_lines = order_lines
+        # Aggregate demand for every catalog product in one pass
+        self.order_lines.track_products(item['Name'] for item in inventory_manager.inventory_data)
+        self._listen(inventory_manager, self._track_product)
+        
+        # Refresh the models of ordered products as orders come in
+        self.online_updates = online_updates
+        if online_updates:
+            self._listen(order_manager, self.update_models)
+    
+    def _listen(self, manager, callback):
+        manager.add_listener(callback)
+        self._listeners.append((manager, callback))
+    
+    def _track_product(self, product):
+        self.order_lines.track_products([product['Name']])
+    
+    def close(self):
+        """
+        Detach from the order and inventory managers. Short-lived forecasters
+        (e.g. one per backtest run) should be closed so the managers do not
+        keep them, and their listeners, alive.
+        """
+        for manager, callback in self._listeners:
+            manager.remove_listener(callback)
+        self._listeners = []
         
     def _prepare_time_series_data(self, product_name):
         """Prepare time series data for a specific product"""
-        orders_df = self.order_manager.get_orders_df()
-        
-        # Parse orders to extract product quantities
-        product_orders = []
+        # Daily totals come from the shared order-lines table; orders are not re-parsed
+        series = self.order_lines.product_series(product_name)
+        if self.reference_date is not None and not series.empty:
+            # Only history known on the forecast start date
+            series = series[series['date'] <= self._history_end()].reset_index(drop=True)
+        return series
+    
+    def _history_end(self):
+        """Last day of history a forecast may use"""
+        return pd.Timestamp(self.reference_date or datetime.now()).normalize()
+    
+    def import_history(self, path, chunk_rows=None, file_format=None):
+        """
+        Load a large order history file as daily demand without keeping its lines
         
-        for _, order in orders_df.iterrows():
-            order_date = datetime.strptime(order['Order Date'], '%Y-%m-%d')
-            items = order['Items']
+        Args:
+            path (str): CSV or Parquet file (orders or order-lines layout)
+            chunk_rows (int, optional): Rows read at a time; defaults to HISTORY_CHUNK_ROWS
+            file_format (str, optional): 'csv' or 'parquet'; guessed from the extension
             
-            # Parse items to find the product
-            item_list = items.split(', ')
-            for item in item_list:
-                if product_name in item:
-                    # Extract quantity (simplified)
-                    quantity = 1  # Default quantity
-                    if '(' in item and ')' in item:
-                        try:
-                            quantity_str = item.split('(')[1].split(')')[0]
-                            if quantity_str.endswith('kg'):
-                                quantity = float(quantity_str.replace('kg', ''))
-                            elif quantity_str.endswith('L'):
-                                quantity = float(quantity_str.replace('L', ''))
-                            elif quantity_str.endswith('pack'):
-                                quantity = 1
-                            else:
-                                quantity = float(quantity_str)
-                        except:
-                            quantity = 1
-                    
-                    product_orders.append({
-                        'date': order_date,
-                        'quantity': quantity
-                    })
-        
-        # Convert to DataFrame and group by date
-        if product_orders:
-            df = pd.DataFrame(product_orders)
-            df = df.groupby('date').agg({'quantity': 'sum'}).reset_index()
-            df = df.sort_values('date')
-            return df
-        else:
-            return pd.DataFrame(columns=['date', 'quantity'])
+        Returns:
+            int: Number of (product, day) totals imported
+        """
+        self.order_lines.track_products(item['Name'] for item in self.inventory_manager.inventory_data)
+        daily = import_order_history(path, self.order_lines, chunk_rows, file_format)
+        # Trained models predate the imported history
+        self.models = {}
+        return len(daily)
     
-    def _create_features(self, df):
-        """Create features for the forecasting model"""
+    def _create_features(self, df, by=None):
+        """Create features for the forecasting model (per `by` group if given)"""
         if df.empty:
             return pd.DataFrame()
         
-        # Create time-based features
+        # Time-based features come from the precomputed calendar table
         df = df.copy()
-        df['day_of_week'] = df['date'].dt.dayofweek
-        df['day_of_month'] = df['date'].dt.day
-        df['month'] = df['date'].dt.month
-        df['days_since_start'] = (df['date'] - df['date'].min()).dt.days
+        df[CALENDAR_FEATURES] = self._calendar_features(df['date'])
+        start = df['date'].min() if by is None else df.groupby(by)['date'].transform('min')
+        df['days_since_start'] = (df['date'] - start).dt.days
         
         return df
     
+    def _calendar_features(self, dates):
+        """CALENDAR_FEATURES values for each date, one row per date"""
+        return self.calendar.lookup(dates)[:, self._calendar_positions]
+    
+    def _future_features(self, days_ahead):
+        """Features for the next N days, shared by every product's forecast"""
+        last_date = self.reference_date or datetime.now()
+        future_dates = [(last_date + timedelta(days=i)) for i in range(1, days_ahead + 1)]
+        return self._create_features(pd.DataFrame({'date': future_dates}))[FEATURE_COLUMNS]
+    
     def train_forecast_model(self, product_name):
         """Train a forecasting model for a specific product"""
+        if self.batch_training:
+            # A batch of one goes through the same solver as train_all_models
+            if product_name not in self.train_all_models([product_name]):
+                return None
+            return self.models[product_name]['model']
+        
         # Prepare data
         ts_data = self._prepare_time_series_data(product_name)
         
@@ -88,7 +221,7 @@ class DemandForecaster:
             return None
         
         # Prepare features and target
-        feature_cols = ['day_of_week', 'day_of_month', 'month', 'days_since_start']
+        feature_cols = FEATURE_COLUMNS
         X = df[feature_cols]
         y = df['quantity']
         
@@ -111,28 +244,248 @@ class DemandForecaster:
         
         return model
     
+    def train_all_models(self, product_names=None):
+        """
+        Train forecasting models for many products with one batched least-squares solve
+        
+        Args:
+            product_names (list, optional): Products to train; defaults to the whole inventory
+            
+        Returns:
+            list: Products that had enough history to get a model
+        """
+        if product_names is None:
+            product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        product_names = list(dict.fromkeys(product_names))
+        self.order_lines.track_products(product_names)
+        
+        daily = self.order_lines.daily_demand().reset_index()
+        daily = daily[daily['product'].isin(product_names) & (daily['date'] <= self._history_end())]
+        sizes = daily['product'].value_counts()
+        trained = [name for name in product_names if sizes.get(name, 0) >= 2]
+        if not trained:
+            # Not enough data to train any model
+            return []
+        
+        df = self._create_features(daily[daily['product'].isin(trained)], by='product')
+        codes = pd.Categorical(df['product'], categories=trained).codes
+        X, counts = pad_groups(polynomial_features(df[FEATURE_COLUMNS].to_numpy()), codes, len(trained))
+        y, _ = pad_groups(df['quantity'].to_numpy(), codes, len(trained))
+        coef, intercept = fit_least_squares_batch(X, y, counts)
+        online = OnlineLeastSquares.from_padded(X, y, counts)
+        
+        # In-sample MAE over each product's real (unpadded) rows
+        mask = np.arange(X.shape[1]) < counts[:, None]
+        errors = np.abs(np.einsum('pnk,pk->pn', X, coef) + intercept[:, None] - y) * mask
+        mae = errors.sum(axis=1) / counts
+        dates = df.groupby('product')['date'].agg(['min', 'max'])
+        
+        for i, product_name in enumerate(trained):
+            self.models[product_name] = {
+                'model': PolynomialModel(coef[i], intercept[i]),
+                'feature_cols': FEATURE_COLUMNS,
+                'start_date': dates.at[product_name, 'min'],
+                'last_date': dates.at[product_name, 'max'],
+                'online': online[i],
+                'mae': mae[i]
+            }
+        
+        return trained
+    
+    def fit(self, product_names=None):
+        """
+        Train whatever the configured backend needs ahead of forecasting: the
+        pooled model for 'global', per-product models for 'polynomial', and
+        nothing for the statistical backends (they fit at forecast time)
+        
+        Args:
+            product_names (list, optional): Products to train; defaults to the whole inventory
+                (the global model always covers the whole inventory)
+        """
+        if self.backend == 'global':
+            self._fit_global_model()
+        elif self.backend == 'polynomial':
+            if self.batch_training:
+                self.train_all_models(product_names)
+            else:
+                if product_names is None:
+                    product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+                for product_name in product_names:
+                    self.train_forecast_model(product_name)
+    
+    def update_models(self, order):
+        """
+        Fold a new order into the models of the products it contains
+        
+        Batch-trained models carry running least-squares state, so each order
+        line costs O(features²) and only the ordered products are re-solved.
+        Other models (per-product sklearn fits, or orders dated before a
+        model's last day) are dropped and retrained on next use.
+        """
+        order_date = pd.Timestamp(datetime.strptime(order['Order Date'], '%Y-%m-%d'))
+        calendar_row = list(self._calendar_features([order_date])[0])
+        refreshed = set()
+        
+        for item, quantity, _ in parse_items(order['Items']):
+            for product_name in self.order_lines.products_for_item(item):
+                model_info = self.models.get(product_name)
+                if model_info is None:
+                    continue
+                
+                online = model_info.get('online')
+                if online is None or order_date < model_info['last_date']:
+                    del self.models[product_name]
+                    refreshed.discard(product_name)
+                elif order_date == model_info['last_date']:
+                    # Another order on the product's latest day
+                    online.add_to_target(quantity)
+                    refreshed.add(product_name)
+                else:
+                    features = calendar_row + [(order_date - model_info['start_date']).days]
+                    online.add_row(polynomial_features(features), quantity)
+                    model_info['last_date'] = order_date
+                    refreshed.add(product_name)
+        
+        for product_name in refreshed:
+            model = self.models[product_name]['model']
+            model.coef, model.intercept = self.models[product_name]['online'].solve()
+        
+        return sorted(refreshed)
+    
+    def _default_forecast(self, product_name, days_ahead):
+        """Forecast for a product without order history"""
+        product_id = self.product_index.lookup(product_name)
+        if product_id is not None:
+            # Return a fraction of current stock as default forecast
+            current_stock = self.inventory_manager.get_product(product_id)['Quantity']
+            return [current_stock * 0.1] * days_ahead
+        else:
+            return [10] * days_ahead  # Default value
+    
+    def _untrained_forecast(self, product_name, days_ahead):
+        """Forecast for a product with too little history for a model"""
+        # If we can't train a model, return average demand
+        ts_data = self._prepare_time_series_data(product_name)
+        if not ts_data.empty:
+            avg_demand = ts_data['quantity'].mean()
+            return [avg_demand] * days_ahead
+        else:
+            # If no data, return a default value
+            return self._default_forecast(product_name, days_ahead)
+    
+    def _demand_matrix(self, product_names):
+        """
+        Dense daily demand (zero on days without orders) for the products with
+        order history, from the first order up to the forecast start date
+        
+        Returns:
+            tuple: (product names, matrix with one row per product, column of each product's first order)
+        """
+        self.order_lines.track_products(product_names)
+        end = self._history_end()
+        
+        daily = self.order_lines.daily_demand().reset_index()
+        daily = daily[daily['product'].isin(product_names) & (daily['date'] <= end)]
+        present = set(daily['product'])
+        names = [name for name in product_names if name in present]
+        if not names:
+            return [], np.zeros((0, 0)), np.zeros(0, dtype=np.int64)
+        
+        first = daily['date'].min()
+        codes = pd.Categorical(daily['product'], categories=names).codes
+        offsets = (daily['date'] - first).dt.days.to_numpy()
+        Y = np.zeros((len(names), (end - first).days + 1))
+        Y[codes, offsets] = daily['quantity'].to_numpy()
+        
+        starts = np.full(len(names), Y.shape[1], dtype=np.int64)
+        np.minimum.at(starts, codes, offsets)
+        return names, Y, starts
+    
+    def _backend_choices(self, Y, starts):
+        """Backend name for each row of the demand matrix"""
+        if self.backend == 'auto':
+            _, _, patterns = demand_patterns(Y, starts)
+            return np.array([PATTERN_BACKENDS[pattern] for pattern in patterns], dtype=object)
+        return np.full(len(Y), self.backend, dtype=object)
+    
+    def _statistical_forecast(self, product_names, days_ahead):
+        """Forecast products with the vectorized statistical backends"""
+        names, Y, starts = self._demand_matrix(product_names)
+        forecasts = {}
+        
+        if names:
+            choices = self._backend_choices(Y, starts)
+            for backend_name in dict.fromkeys(choices):
+                rows = np.flatnonzero(choices == backend_name)
+                predictions = FORECAST_BACKENDS[backend_name].forecast(Y[rows], starts[rows], days_ahead)
+                # Ensure non-negative predictions
+                forecasts.update(zip([names[i] for i in rows], np.maximum(predictions, 0).tolist()))
+        
+        for name in product_names:
+            if name not in forecasts:
+                forecasts[name] = self._default_forecast(name, days_ahead)
+        return forecasts
+    
+    def _fit_global_model(self):
+        """Fit the pooled model on the whole inventory, once per history and catalog version"""
+        key = (self.order_lines.demand_version, self._history_end(), len(self.inventory_manager.inventory_data))
+        if self._global_key != key:
+            product_names = list(dict.fromkeys(item['Name'] for item in self.inventory_manager.inventory_data))
+            names, Y, starts = self._demand_matrix(product_names)
+            dates = pd.date_range(end=self._history_end(), periods=Y.shape[1], freq='D')
+            self._global_model = GlobalDemandModel(self.calendar).fit(names, Y, starts, dates, self._categories())
+            self._global_key = key
+        return self._global_model
+    
+    def _categories(self):
+        """Product name -> inventory category"""
+        return {item['Name']: item.get('Category') for item in self.inventory_manager.inventory_data}
+    
+    def _global_forecast(self, product_names, days_ahead):
+        """Forecast products from the pooled model; products without history get their category's level"""
+        model = self._fit_global_model()
+        future_dates = pd.date_range(self._history_end() + timedelta(days=1), periods=days_ahead, freq='D')
+        predictions = model.predict(product_names, future_dates, self._categories())
+        # Ensure non-negative predictions
+        return dict(zip(product_names, np.maximum(predictions, 0).tolist()))
+    
+    def get_demand_patterns(self, product_names=None):
+        """
+        Classify each product's demand and report the backend 'auto' mode would use
+        
+        Returns:
+            dict: Product name -> adi, cv2, pattern and backend
+        """
+        if product_names is None:
+            product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        names, Y, starts = self._demand_matrix(list(dict.fromkeys(product_names)))
+        if not names:
+            return {}
+        
+        adi, cv2, patterns = demand_patterns(Y, starts)
+        return {
+            name: {
+                'adi': float(adi[i]),
+                'cv2': float(cv2[i]),
+                'pattern': str(patterns[i]),
+                'backend': PATTERN_BACKENDS[str(patterns[i])]
+            }
+            for i, name in enumerate(names)
+        }
+    
     def forecast_demand(self, product_name, days_ahead=7):
         """Forecast demand for a product for the next N days"""
+        if self.backend == 'global':
+            return self._global_forecast([product_name], days_ahead)[product_name]
+        if self.backend != 'polynomial':
+            return self._statistical_forecast([product_name], days_ahead)[product_name]
+        
         # Check if we have a trained model
         if product_name not in self.models:
             # Try to train a model
             model = self.train_forecast_model(product_name)
             if model is None:
-                # If we can't train a model, return average demand
-                ts_data = self._prepare_time_series_data(product_name)
-                if not ts_data.empty:
-                    avg_demand = ts_data['quantity'].mean()
-                    return [avg_demand] * days_ahead
-                else:
-                    # If no data, return a default value
-                    inventory_df = self.inventory_manager.get_inventory_df()
-                    product = inventory_df[inventory_df['Name'].str.contains(product_name, case=False, na=False)]
-                    if not product.empty:
-                        # Return a fraction of current stock as default forecast
-                        current_stock = product.iloc[0]['Quantity']
-                        return [current_stock * 0.1] * days_ahead
-                    else:
-                        return [10] * days_ahead  # Default value
+                return self._untrained_forecast(product_name, days_ahead)
         
         # Get the trained model
         model_info = self.models[product_name]
@@ -140,16 +493,10 @@ class DemandForecaster:
         feature_cols = model_info['feature_cols']
         start_date = model_info['start_date']
         
-        # Generate future dates
-        last_date = datetime.now()
-        future_dates = [(last_date + timedelta(days=i)) for i in range(1, days_ahead + 1)]
-        
         # Create features for future dates
-        future_df = pd.DataFrame({'date': future_dates})
-        future_df = self._create_features(future_df)
+        X_future = self._future_features(days_ahead)[feature_cols]
         
         # Make predictions
-        X_future = future_df[feature_cols]
         predictions = model.predict(X_future)
         
         # Ensure non-negative predictions
@@ -157,17 +504,114 @@ class DemandForecaster:
         
         return predictions.tolist()
     
+    def forecast_all(self, product_names=None, days_ahead=7):
+        """
+        Forecast demand for many products
+        
+        Products are processed in chunks of chunk_size, one after another or
+        across a process pool when workers > 1; both see the same chunks, so
+        they return identical results.
+        
+        Returns:
+            dict: Product name -> list of daily forecasts
+        """
+        if product_names is None:
+            product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        product_names = list(dict.fromkeys(product_names))
+        if self.backend == 'global':
+            # One fit covers every product; only prediction would be left to split up
+            return self._global_forecast(product_names, days_ahead)
+        chunks = [product_names[i:i + self.chunk_size] for i in range(0, len(product_names), self.chunk_size)]
+        
+        if self.workers > 1 and len(chunks) > 1:
+            return self._forecast_parallel(chunks, days_ahead)
+        
+        forecasts = {}
+        for chunk in chunks:
+            forecasts.update(self._forecast_chunk(chunk, days_ahead))
+        return forecasts
+    
+    def _forecast_chunk(self, product_names, days_ahead):
+        """
+        Forecast one chunk of products
+        
+        In batch mode, missing models are trained together and every
+        batch-trained model is predicted in a single matrix product. Products
+        without a model fall back to forecast_demand. Statistical backends
+        forecast the whole chunk from one dense demand matrix.
+        """
+        if self.backend == 'global':
+            return self._global_forecast(product_names, days_ahead)
+        if self.backend != 'polynomial':
+            return self._statistical_forecast(product_names, days_ahead)
+        
+        if self.batch_training:
+            untrained = [name for name in product_names if name not in self.models]
+            if untrained:
+                self.train_all_models(untrained)
+        
+        forecasts = {}
+        batched = [name for name in product_names
+                   if name in self.models and isinstance(self.models[name]['model'], PolynomialModel)]
+        if batched:
+            coef = np.stack([self.models[name]['model'].coef for name in batched])
+            intercept = np.array([self.models[name]['model'].intercept for name in batched])
+            predictions = predict_batch(self._future_features(days_ahead), coef, intercept)
+            # Ensure non-negative predictions
+            forecasts.update(zip(batched, np.maximum(predictions, 0).tolist()))
+        
+        for name in product_names:
+            if name not in forecasts:
+                if self.batch_training and name not in self.models:
+                    # Batch training above already found too little history
+                    forecasts[name] = self._untrained_forecast(name, days_ahead)
+                else:
+                    forecasts[name] = self.forecast_demand(name, days_ahead)
+        return forecasts
+    
+    def _forecast_parallel(self, chunks, days_ahead):
+        """
+        Forecast chunks of products in a process pool
+        
+        The parsed order history, inventory and already trained models are
+        shipped to each worker once, when it starts; tasks only carry product
+        names. Workers run the serial chunk code on the same data and start
+        date. Models they train are merged back so later calls can reuse them.
+        """
+        # Aggregate once here so workers receive the cached daily totals
+        self.order_lines.track_products(name for chunk in chunks for name in chunk)
+        self.order_lines.daily_demand()
+        
+        state = {
+            'order_lines': self.order_lines,
+            'inventory_data': list(self.inventory_manager.inventory_data),
+            'models': self.models,
+            'batch_training': self.batch_training,
+            'backend': self.backend,
+            'reference_date': self.reference_date or datetime.now()
+        }
+        
+        forecasts = {}
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks)),
+                                 initializer=_init_forecast_worker, initargs=(state,)) as pool:
+            for chunk_forecasts, models in pool.map(_forecast_worker_chunk, chunks, repeat(days_ahead)):
+                forecasts.update(chunk_forecasts)
+                for name, model_info in models.items():
+                    self.models.setdefault(name, model_info)
+        return forecasts
+    
     def get_inventory_recommendations(self, days_ahead=7):
         """Get inventory recommendations for all products"""
         inventory_df = self.inventory_manager.get_inventory_df()
         recommendations = []
+        forecasts = self.forecast_all(inventory_df['Name'].tolist(), days_ahead)
         
         for _, product in inventory_df.iterrows():
             product_name = product['Name']
             current_stock = product['Quantity']
             
             # Forecast demand
-            forecast = self.forecast_demand(product_name, days_ahead)
+            forecast = forecasts[product_name]
             total_forecast = sum(forecast)
             
             # Calculate recommended restocking
@@ -186,25 +630,51 @@ class DemandForecaster:
         return recommendations
     
     def get_seasonal_trends(self):
-        """Analyze seasonal trends in product demand"""
-        inventory_df = self.inventory_manager.get_inventory_df()
-        seasonal_analysis = {}
+        """
+        Analyze seasonal trends in product demand
         
-        for _, product in inventory_df.iterrows():
-            product_name = product['Name']
-            ts_data = self._prepare_time_series_data(product_name)
-            
-            if not ts_data.empty and len(ts_data) > 2:
-                # Group by month to see seasonal patterns
-                ts_data['month'] = ts_data['date'].dt.month
-                monthly_avg = ts_data.groupby('month')['quantity'].mean()
-                
-                seasonal_analysis[product_name] = {
-                    'monthly_avg': monthly_avg.to_dict(),
-                    'peak_month': monthly_avg.idxmax(),
-                    'low_month': monthly_avg.idxmin()
-                }
+        Monthly averages, peak and low months and a seasonality index (each
+        month's average over the mean of the product's monthly averages) are
+        computed for every product from one pivot of the daily demand table.
+        The result is cached until orders or products change; treat it as read-only.
+        """
+        product_names = [item['Name'] for item in self.inventory_manager.inventory_data]
+        self.order_lines.track_products(product_names)
+        key = (self.order_lines.demand_version, tuple(product_names), self.reference_date)
+        if self._seasonal_cache is not None and self._seasonal_cache[0] == key:
+            return self._seasonal_cache[1]
+        
+        daily = self.order_lines.daily_demand().reset_index()
+        daily = daily[daily['product'].isin(product_names)]
+        if self.reference_date is not None:
+            daily = daily[daily['date'] <= self._history_end()]
+        # Same threshold as before: more than two days with orders
+        days_ordered = daily['product'].map(daily['product'].value_counts())
+        daily = daily[days_ordered > 2]
+        
+        monthly = (daily.groupby(['product', daily['date'].dt.month.rename('month')])['quantity']
+                   .mean()
+                   .unstack('month'))
+        peak_months = monthly.idxmax(axis=1)
+        low_months = monthly.idxmin(axis=1)
+        seasonality = monthly.div(monthly.mean(axis=1), axis=0)
+        monthly_records = monthly.to_dict('index')
+        seasonality_records = seasonality.to_dict('index')
+        
+        seasonal_analysis = {}
+        for product_name in product_names:
+            if product_name not in monthly_records:
+                continue
+            seasonal_analysis[product_name] = {
+                'monthly_avg': {int(month): value for month, value in monthly_records[product_name].items()
+                                if not pd.isna(value)},
+                'peak_month': int(peak_months[product_name]),
+                'low_month': int(low_months[product_name]),
+                'seasonality_index': {int(month): value for month, value in seasonality_records[product_name].items()
+                                      if not pd.isna(value)}
+            }
         
+        self._seasonal_cache = (key, seasonal_analysis)
         return seasonal_analysis
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+import numpy as np
+
+# Syntetos-Boylan cut-offs between smooth, erratic, intermittent and lumpy demand
+ADI_THRESHOLD = 1.32
+CV2_THRESHOLD = 0.49
+
+
+class ForecastBackend:
+    """
+    Forecasts many products at once from a dense daily demand matrix.
+
+    Subclasses implement forecast(Y, starts, horizon), where Y has one row
+    per product and one column per day (zero on days without orders) and
+    starts holds the column of each product's first order; earlier columns
+    are ignored.
+    """
+
+    name = None
+
+    def forecast(self, Y, starts, horizon):
+        """
+        Returns:
+            np.ndarray: Forecasts with shape (n_products, horizon)
+        """
+        raise NotImplementedError
+
+
+class SimpleExponentialSmoothing(ForecastBackend):
+    """Flat forecast from an exponentially weighted level"""
+
+    name = 'ses'
+
+    def __init__(self, alpha=0.3):
+        self.alpha = alpha
+
+    def forecast(self, Y, starts, horizon):
+        level = np.zeros(len(Y))
+        for t in range(starts.min(initial=0), Y.shape[1]):
+            y = Y[:, t]
+            level = np.where(starts == t, y,
+                             np.where(starts < t, level + self.alpha * (y - level), level))
+        return np.repeat(level[:, None], horizon, axis=1)
+
+
+class HoltLinear(ForecastBackend):
+    """Holt's linear trend method: smoothed level and trend, extrapolated linearly"""
+
+    name = 'holt'
+
+    def __init__(self, alpha=0.3, beta=0.1):
+        self.alpha = alpha
+        self.beta = beta
+
+    def forecast(self, Y, starts, horizon):
+        level = np.zeros(len(Y))
+        trend = np.zeros(len(Y))
+        for t in range(starts.min(initial=0), Y.shape[1]):
+            y = Y[:, t]
+            active = starts < t
+            new_level = self.alpha * y + (1 - self.alpha) * (level + trend)
+            new_trend = self.beta * (new_level - level) + (1 - self.beta) * trend
+            level = np.where(starts == t, y, np.where(active, new_level, level))
+            trend = np.where(active, new_trend, trend)
+        steps = np.arange(1, horizon + 1)
+        return level[:, None] + trend[:, None] * steps
+
+
+class Croston(ForecastBackend):
+    """
+    Croston's method for intermittent demand: demand size and the interval
+    between demands are smoothed separately and forecast as size / interval
+    """
+
+    name = 'croston'
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+
+    def _rate(self, Y, starts):
+        size = np.zeros(len(Y))
+        interval = np.ones(len(Y))
+        since_demand = np.ones(len(Y))
+        for t in range(starts.min(initial=0), Y.shape[1]):
+            y = Y[:, t]
+            first = starts == t
+            demand = (starts < t) & (y > 0)
+            size = np.where(first, y, np.where(demand, size + self.alpha * (y - size), size))
+            interval = np.where(demand, interval + self.alpha * (since_demand - interval), interval)
+            since_demand = np.where(first | demand, 1, np.where(starts < t, since_demand + 1, since_demand))
+        return size / interval
+
+    def forecast(self, Y, starts, horizon):
+        return np.repeat(self._rate(Y, starts)[:, None], horizon, axis=1)
+
+
+class SyntetosBoylan(Croston):
+    """Croston with the Syntetos-Boylan approximation, which removes its upward bias"""
+
+    name = 'sba'
+
+    def forecast(self, Y, starts, horizon):
+        rate = self._rate(Y, starts) * (1 - self.alpha / 2)
+        return np.repeat(rate[:, None], horizon, axis=1)
+
+
+FORECAST_BACKENDS = {
+    'ses': SimpleExponentialSmoothing(),
+    'holt': HoltLinear(),
+    'croston': Croston(),
+    'sba': SyntetosBoylan()
+}
+
+# Backend used for each demand pattern in 'auto' mode
+PATTERN_BACKENDS = {
+    'smooth': 'holt',
+    'erratic': 'ses',
+    'intermittent': 'croston',
+    'lumpy': 'sba'
+}
+
+
+def register_backend(backend):
+    """Make a ForecastBackend instance selectable by its name"""
+    FORECAST_BACKENDS[backend.name] = backend
+
+
+def demand_patterns(Y, starts):
+    """
+    Classify each product's demand by average inter-demand interval (ADI)
+    and squared coefficient of variation of demand sizes (CV²)
+
+    Returns:
+        tuple: (adi, cv2, pattern) arrays, one entry per product
+    """
+    active = np.arange(Y.shape[1]) >= starts[:, None]
+    days = active.sum(axis=1)
+    occurrences = (Y > 0).sum(axis=1)
+
+    adi = days / np.maximum(occurrences, 1)
+    mean = Y.sum(axis=1) / np.maximum(occurrences, 1)
+    mean_square = (Y ** 2).sum(axis=1) / np.maximum(occurrences, 1)
+    cv2 = np.where(mean > 0, (mean_square - mean ** 2) / np.maximum(mean ** 2, 1e-12), 0.0)
+
+    pattern = np.where(
+        adi < ADI_THRESHOLD,
+        np.where(cv2 < CV2_THRESHOLD, 'smooth', 'erratic'),
+        np.where(cv2 < CV2_THRESHOLD, 'intermittent', 'lumpy')
+    )
+    return adi, cv2, pattern
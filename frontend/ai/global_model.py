@@ -0,0 +1,107 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
+
+# Calendar columns used as effects; day of week and month are one-hot encoded
+CALENDAR_DUMMIES = {'day_of_week': range(1, 7), 'month': range(2, 13)}
+CALENDAR_FLAGS = ['payday', 'diwali', 'holi', 'eid']
+
+
+class GlobalDemandModel:
+    """
+    One linear model of daily demand pooled across all products:
+
+        demand = intercept + calendar effects + category effect + product effect
+
+    Category and product effects are ridge-penalized, so a product with little
+    history is pulled towards its category and a product without any history
+    is forecast from its category alone. Fitting is a single sparse least-squares
+    solve over every (product, day) cell, zeros included.
+    """
+
+    def __init__(self, calendar, regularization=7.0):
+        """
+        Args:
+            calendar (CalendarFeatures): Shared calendar table
+            regularization (float): Ridge penalty on product and category effects,
+                roughly the days of history at which a product's own level
+                counts as much as its category's
+        """
+        self.calendar = calendar
+        self.regularization = regularization
+        self.intercept = 0.0
+        self.calendar_effects = None
+        self.category_effects = {}
+        self.product_effects = {}
+
+    def _calendar_matrix(self, dates):
+        """Calendar effect columns for each date (reference levels dropped)"""
+        values = self.calendar.lookup(dates)
+        columns = []
+        for name, levels in CALENDAR_DUMMIES.items():
+            column = values[:, self.calendar.columns.index(name)]
+            columns.extend(column == level for level in levels)
+        for name in CALENDAR_FLAGS:
+            if name in self.calendar.columns:
+                columns.append(values[:, self.calendar.columns.index(name)])
+        return np.stack(columns, axis=1).astype(np.float64)
+
+    def fit(self, product_names, Y, starts, dates, categories):
+        """
+        Args:
+            product_names (list): Name of each row of Y
+            Y (np.ndarray): Daily demand, one row per product, zero on days without orders
+            starts (np.ndarray): Column of each product's first order; earlier columns are ignored
+            dates: Date of each column of Y
+            categories (dict): Product name -> category
+
+        Returns:
+            GlobalDemandModel: self
+        """
+        active = np.arange(Y.shape[1]) >= np.asarray(starts)[:, None]
+        rows, days = np.nonzero(active)
+        if len(rows) == 0:
+            return self
+        n = len(rows)
+
+        category_names = sorted({categories.get(name) for name in product_names} - {None})
+        category_codes = {category: i for i, category in enumerate(category_names)}
+        product_category = np.array([category_codes.get(categories.get(name), -1) for name in product_names])
+
+        calendar = self._calendar_matrix(dates)
+        n_calendar = calendar.shape[1] + 1
+        n_categories = len(category_names)
+        n_products = len(product_names)
+
+        dense = sparse.csr_matrix(np.column_stack([np.ones(n), calendar[days]]))
+        row_category = product_category[rows]
+        known = row_category >= 0
+        category_part = sparse.csr_matrix((np.ones(known.sum()), (np.flatnonzero(known), row_category[known])),
+                                          shape=(n, n_categories))
+        product_part = sparse.csr_matrix((np.ones(n), (np.arange(n), rows)), shape=(n, n_products))
+
+        # Ridge penalty as extra rows with zero target, on the category and product columns only
+        n_penalized = n_categories + n_products
+        penalty = sparse.hstack([sparse.csr_matrix((n_penalized, n_calendar)),
+                                 sparse.identity(n_penalized, format='csr') * np.sqrt(self.regularization)])
+        X = sparse.vstack([sparse.hstack([dense, category_part, product_part]), penalty]).tocsr()
+        y = np.concatenate([Y[rows, days], np.zeros(n_penalized)])
+
+        weights = lsqr(X, y, atol=1e-10, btol=1e-10, iter_lim=10 * X.shape[1])[0]
+        self.intercept = float(weights[0])
+        self.calendar_effects = weights[1:n_calendar]
+        self.category_effects = dict(zip(category_names, weights[n_calendar:n_calendar + n_categories].tolist()))
+        self.product_effects = dict(zip(product_names, weights[n_calendar + n_categories:].tolist()))
+        return self
+
+    def predict(self, product_names, dates, categories):
+        """
+        Returns:
+            np.ndarray: Forecasts with shape (len(product_names), len(dates))
+        """
+        base = np.full(len(dates), self.intercept)
+        if self.calendar_effects is not None:
+            base += self._calendar_matrix(dates) @ self.calendar_effects
+        offsets = np.array([self.category_effects.get(categories.get(name), 0.0) + self.product_effects.get(name, 0.0)
+                            for name in product_names])
+        return offsets.reshape(-1, 1) + base
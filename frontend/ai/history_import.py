@@ -0,0 +1,137 @@
+import os
+import numpy as np
+import pandas as pd
+from .order_lines import parse_items
+
+# Accepted layouts: an orders export (one row per order, as in OrderManager)
+# or order lines (one row per item, as in OrderLinesTable)
+ORDER_COLUMNS = ['Order Date', 'Items']
+LINE_COLUMNS = ['date', 'item', 'quantity']
+
+
+def _file_format(path, file_format):
+    if file_format:
+        return file_format
+    return 'parquet' if str(path).lower().endswith(('.parquet', '.pq')) else 'csv'
+
+
+def _history_columns(names):
+    """Pick the layout a file uses from its column names"""
+    for columns in (ORDER_COLUMNS, LINE_COLUMNS):
+        if all(column in names for column in columns):
+            return columns
+    raise ValueError(f"Order history needs columns {ORDER_COLUMNS} or {LINE_COLUMNS}; found {list(names)}")
+
+
+def iter_history_chunks(path, chunk_rows=None, file_format=None):
+    """
+    Read an order history file a chunk at a time
+
+    Args:
+        path (str): CSV or Parquet file
+        chunk_rows (int, optional): Rows per chunk; defaults to HISTORY_CHUNK_ROWS
+        file_format (str, optional): 'csv' or 'parquet'; guessed from the extension
+
+    Yields:
+        pd.DataFrame: The layout's columns for up to chunk_rows rows
+    """
+    chunk_rows = int(chunk_rows or os.getenv('HISTORY_CHUNK_ROWS', 100000))
+
+    if _file_format(path, file_format) == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet order history requires pyarrow (pip install pyarrow)") from e
+
+        parquet_file = pq.ParquetFile(path)
+        columns = _history_columns(parquet_file.schema_arrow.names)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        columns = _history_columns(pd.read_csv(path, nrows=0).columns)
+        yield from pd.read_csv(path, usecols=columns, dtype=str, chunksize=chunk_rows)
+
+
+def _chunk_lines(chunk):
+    """
+    Turn a chunk of either layout into date, item and quantity columns
+
+    Orders are split into items as parse_items does; each distinct item text
+    (e.g. 'Rice (2kg)') is parsed once per chunk.
+    """
+    if 'Items' not in chunk.columns:
+        lines = chunk[LINE_COLUMNS].copy()
+        lines['quantity'] = pd.to_numeric(lines['quantity'], errors='coerce').fillna(1.0)
+        return lines
+
+    dates, texts = [], []
+    for date, items in zip(chunk['Order Date'], chunk['Items'].astype(str)):
+        for text in items.split(', '):
+            dates.append(date)
+            texts.append(text)
+
+    codes, uniques = pd.factorize(pd.Series(texts, dtype=object))
+    parsed = [(parse_items(text) or [('', 1.0, None)])[0] for text in uniques]
+    names = pd.Series([name for name, _, _ in parsed], dtype=object)
+    quantities = np.array([quantity for _, quantity, _ in parsed], dtype=float)
+
+    lines = pd.DataFrame({'date': dates, 'item': names.to_numpy()[codes], 'quantity': quantities[codes]})
+    return lines[lines['item'] != '']
+
+
+def _chunk_demand(lines, order_lines):
+    """Sum a chunk's lines per tracked product and date string"""
+    links = pd.DataFrame(
+        [(item, product) for item in lines['item'].unique() for product in order_lines.products_for_item(item)],
+        columns=['item', 'product']
+    )
+    return lines.merge(links, on='item').groupby(['product', 'date'])['quantity'].sum()
+
+
+def import_order_history(path, order_lines, chunk_rows=None, file_format=None):
+    """
+    Stream an order history file into an OrderLinesTable as daily demand
+
+    Only the running (product, date) totals are kept between chunks, so memory
+    is bounded by one chunk plus products × days, whatever the file size.
+    Items are matched to the table's tracked products; track the catalog
+    before importing, as lines of untracked products are not kept.
+
+    Args:
+        path (str): CSV or Parquet file with an orders or order-lines layout
+        order_lines (OrderLinesTable): Table that receives the daily totals
+        chunk_rows (int, optional): Rows read at a time; defaults to HISTORY_CHUNK_ROWS
+        file_format (str, optional): 'csv' or 'parquet'; guessed from the extension
+
+    Returns:
+        pd.Series: Imported quantities indexed by (product, date)
+    """
+    totals = None
+    pending = []
+    pending_rows = 0
+
+    for chunk in iter_history_chunks(path, chunk_rows, file_format):
+        demand = _chunk_demand(_chunk_lines(chunk), order_lines)
+        pending.append(demand)
+        pending_rows += len(demand)
+
+        # Fold partial sums in once they outgrow the running totals
+        if pending_rows > max(len(chunk), 0 if totals is None else len(totals)):
+            totals = pd.concat(([] if totals is None else [totals]) + pending).groupby(level=[0, 1]).sum()
+            pending = []
+            pending_rows = 0
+
+    parts = ([] if totals is None else [totals]) + pending
+    if not parts:
+        daily = pd.Series([], dtype=float,
+                          index=pd.MultiIndex.from_arrays([[], pd.DatetimeIndex([])], names=['product', 'date']),
+                          name='quantity')
+    else:
+        daily = pd.concat(parts).groupby(level=[0, 1]).sum()
+        # Dates are grouped as text while streaming and parsed once at the end
+        dates = pd.to_datetime(daily.index.get_level_values(1)).normalize()
+        daily.index = pd.MultiIndex.from_arrays([daily.index.get_level_values(0), dates], names=['product', 'date'])
+        daily = daily.groupby(level=['product', 'date']).sum()
+
+    order_lines.add_daily_demand(daily)
+    return daily
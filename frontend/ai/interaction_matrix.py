@@ -0,0 +1,150 @@
+import numpy as np
+from scipy import sparse
+from .order_lines import parse_items
+
+
+def _top_indices(scores, top_n):
+    """Indices of the top_n positive scores, highest first (ties by lower index)"""
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > top_n:
+        candidates = candidates[np.argpartition(-scores[candidates], top_n - 1)[:top_n]]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def _resized(matrix, shape):
+    """A CSR matrix padded with empty rows and columns to shape, sharing the data"""
+    indptr = np.concatenate([matrix.indptr, np.full(shape[0] - matrix.shape[0], matrix.indptr[-1])])
+    return sparse.csr_matrix((matrix.data, matrix.indices, indptr), shape=shape)
+
+
+class CustomerProductMatrix:
+    """
+    Customer × item purchase counts as a scipy.sparse matrix.
+
+    Orders are parsed once and appended as pending (customer, item) entries;
+    the first read after a change adds them to the CSR matrix as a small
+    delta matrix, so earlier orders are not rebuilt. Similar customers come
+    from one sparse product against the whole matrix, and the best customers
+    and items are picked with argpartition instead of full sorts.
+    """
+
+    def __init__(self, orders=None):
+        self.customers = {}
+        self.customer_names = []
+        self.items = {}
+        self.item_names = []
+        self._rows = []
+        self._columns = []
+        self._matrix = None
+        self._bought = None
+        self.version = 0
+
+        self.add_orders(orders or [])
+
+    @classmethod
+    def from_order_manager(cls, order_manager):
+        """Build a matrix over an OrderManager and keep it updated on add_order"""
+        matrix = cls(order_manager.orders_data)
+        order_manager.add_listener(matrix.add_order)
+        return matrix
+
+    def add_order(self, order):
+        """Count the items of a single order"""
+        self.add_orders([order])
+
+    def add_orders(self, orders):
+        """Count the items of several orders"""
+        added = False
+        for order in orders:
+            row = self.customers.setdefault(order['Customer'], len(self.customers))
+            if row == len(self.customer_names):
+                self.customer_names.append(order['Customer'])
+            for name, _, _ in parse_items(order['Items']):
+                column = self.items.setdefault(name, len(self.items))
+                if column == len(self.item_names):
+                    self.item_names.append(name)
+                self._rows.append(row)
+                self._columns.append(column)
+                added = True
+
+        if added:
+            self.version += 1
+
+    def _apply_pending(self):
+        """Add the entries counted since the last read to the CSR matrices"""
+        if self._matrix is not None and not self._rows:
+            return
+
+        shape = (len(self.customer_names), len(self.item_names))
+        delta = sparse.csr_matrix((np.ones(len(self._rows)), (self._rows, self._columns)), shape=shape)
+        delta.sum_duplicates()
+        if self._matrix is None:
+            self._matrix = delta
+            self._bought = (delta > 0).astype(np.float64)
+        else:
+            self._matrix = _resized(self._matrix, shape) + delta
+            self._bought = _resized(self._bought, shape).maximum((delta > 0).astype(np.float64))
+        self._rows = []
+        self._columns = []
+
+    @property
+    def matrix(self):
+        """Order counts with shape (customers, items), as CSR"""
+        self._apply_pending()
+        return self._matrix
+
+    @property
+    def bought_matrix(self):
+        """1.0 where a customer has ordered an item, as CSR"""
+        self._apply_pending()
+        return self._bought
+
+    def bought(self, customer):
+        """Names of the items a customer has ordered"""
+        row = self.customers.get(customer)
+        if row is None:
+            return []
+        return [self.item_names[column] for column in self.matrix[row].indices]
+
+    def similar_customers(self, customer, top_n=3):
+        """
+        Customers with the most overlapping item sets (Jaccard similarity)
+
+        Returns:
+            list: (customer, similarity) pairs, most similar first
+        """
+        row = self.customers.get(customer)
+        if row is None:
+            return []
+        similarity = self._jaccard(row)
+        return [(self.customer_names[i], float(similarity[i])) for i in _top_indices(similarity, top_n)]
+
+    def _jaccard(self, row):
+        bought = self.bought_matrix
+        shared = (bought @ bought[row].T).toarray().ravel()
+        sizes = np.diff(bought.indptr)
+        union = sizes + sizes[row] - shared
+        similarity = np.divide(shared, union, out=np.zeros(len(union)), where=union > 0)
+        similarity[row] = 0.0
+        return similarity
+
+    def recommend(self, customer, top_n=5, n_neighbors=3):
+        """
+        Items the most similar customers ordered and this customer has not
+
+        Each item scores the summed similarity of the neighbors who ordered it.
+
+        Returns:
+            list: (item name, score) pairs, best first
+        """
+        row = self.customers.get(customer)
+        if row is None:
+            return []
+        similarity = self._jaccard(row)
+        neighbors = _top_indices(similarity, n_neighbors)
+        if len(neighbors) == 0:
+            return []
+
+        scores = self.bought_matrix[neighbors].T @ similarity[neighbors]
+        scores[self.matrix[row].indices] = 0.0
+        return [(self.item_names[i], float(scores[i])) for i in _top_indices(scores, top_n)]
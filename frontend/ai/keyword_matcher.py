@@ -0,0 +1,195 @@
+import threading
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that finds every occurrence of a set of
+    keywords in a single pass over the text.
+
+    Each keyword is stored with a label (e.g. 'INTENT' or 'PRODUCT') and an
+    optional value (e.g. the intent name), so one automaton can serve both
+    intent classification and entity extraction.
+
+    add and remove only touch the keyword's own trie path (remove prunes
+    branches left empty and reuses their nodes). Failure links are not
+    maintained incrementally: the first scan after any change rebuilds all
+    of them with one BFS, so a batch of changes costs a single rebuild.
+
+    Changes, link rebuilds and scans hold one lock, so a matcher can be
+    shared by threads (e.g. every Streamlit session) while keywords change.
+    """
+
+    def __init__(self, keywords=None):
+        # Trie stored as parallel lists indexed by node id; node 0 is the root
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [{}]
+        # Nearest node on the failure chain that has outputs (or None)
+        self._dict_link = [None]
+        # Node ids of pruned branches, reused by add
+        self._free = []
+        self._dirty = False
+        self._lock = threading.RLock()
+
+        for keyword, label, value in keywords or []:
+            self.add(keyword, label, value)
+
+    def __getstate__(self):
+        # Locks do not pickle (matchers travel to forecast worker processes)
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(outputs) for outputs in self._outputs)
+
+    def __contains__(self, item):
+        keyword, label = item
+        with self._lock:
+            node = self._find_node(keyword.lower())
+            return node is not None and any(key[0] == label for key in self._outputs[node])
+
+    def _find_node(self, keyword):
+        node = 0
+        for char in keyword:
+            node = self._goto[node].get(char)
+            if node is None:
+                return None
+        return node
+
+    def add(self, keyword, label, value=None):
+        """Add a keyword to the automaton"""
+        with self._lock:
+            self._add(keyword, label, value)
+
+    def _add(self, keyword, label, value):
+        keyword = keyword.lower()
+        if not keyword:
+            return
+
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = self._new_node()
+                self._goto[node][char] = next_node
+            node = next_node
+
+        self._outputs[node][(label, value)] = keyword
+        # Failure links are rebuilt on the next scan
+        self._dirty = True
+
+    def _new_node(self):
+        if self._free:
+            node = self._free.pop()
+            self._goto[node] = {}
+            self._fail[node] = 0
+            self._outputs[node] = {}
+            self._dict_link[node] = None
+            return node
+
+        self._goto.append({})
+        self._fail.append(0)
+        self._outputs.append({})
+        self._dict_link.append(None)
+        return len(self._goto) - 1
+
+    def remove(self, keyword, label, value=None):
+        """Remove a keyword from the automaton, returning True if it was present"""
+        with self._lock:
+            return self._remove(keyword, label, value)
+
+    def _remove(self, keyword, label, value):
+        keyword = keyword.lower()
+        path = [0]
+        for char in keyword:
+            node = self._goto[path[-1]].get(char)
+            if node is None:
+                return False
+            path.append(node)
+        if (label, value) not in self._outputs[path[-1]]:
+            return False
+
+        del self._outputs[path[-1]][(label, value)]
+        # Prune the branch back to the last node still used by another keyword
+        for depth in range(len(keyword), 0, -1):
+            node = path[depth]
+            if self._goto[node] or self._outputs[node]:
+                break
+            del self._goto[path[depth - 1]][keyword[depth - 1]]
+            self._free.append(node)
+
+        self._dirty = True
+        return True
+
+    def _build_links(self):
+        """Recompute every failure and dictionary link with a BFS over the trie"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = None
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                if fail == child:
+                    fail = 0
+
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._outputs[fail] else self._dict_link[fail]
+                queue.append(child)
+
+        self._dirty = False
+
+    def find_all(self, text):
+        """
+        Find every keyword occurrence in the text
+
+        Returns:
+            list: Matches as dicts with text, label, value, start and end,
+            ordered by start offset (longest match first)
+        """
+        with self._lock:
+            if self._dirty:
+                self._build_links()
+            return self._scan(text)
+
+    def _scan(self, text):
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        dict_link = self._dict_link
+
+        matches = []
+        node = 0
+        for position, char in enumerate(text.lower()):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            match_node = node if outputs[node] else dict_link[node]
+            while match_node is not None:
+                for (label, value), keyword in outputs[match_node].items():
+                    end = position + 1
+                    matches.append({
+                        'text': keyword,
+                        'label': label,
+                        'value': value,
+                        'start': end - len(keyword),
+                        'end': end
+                    })
+                match_node = dict_link[match_node]
+
+        matches.sort(key=lambda match: (match['start'], -match['end']))
+        return matches
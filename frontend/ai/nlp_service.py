@@ -1,31 +1,55 @@
-import nltk
-import requests
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import json
 import re
 import os
+import threading
+from .keyword_matcher import KeywordMatcher
+from .lru_cache import LRUCache
+from .stopwords import COMMON_CHAT_WORDS, ENGLISH_STOP_WORDS
 
-# Download required NLTK data (this would typically be done during setup)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# nltk, requests and asyncio are imported on first use so that importing this
+# module stays cheap and never touches the network.
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+# Regex tokenizer that keeps domain tokens such as "5kg", "2.5l" and "₹120" whole
+REGEX_TOKEN_PATTERN = re.compile(r"""
+    ₹\s?\d[\d,]*(?:\.\d+)?            # rupee amounts: ₹120, ₹1,200.50
+  | \d+(?:\.\d+)?[^\W\d_]+            # quantities with units: 5kg, 2l, 2.5kg
+  | \d+(?:[.,]\d+)*                   # plain numbers
+  | [\w\u0900-\u0DFF]+(?:'\w+)?       # words (incl. Indic vowel signs), keeping contractions
+  | [^\w\s\u0900-\u0DFF]              # punctuation
+""", re.VERBOSE)
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+TOKENIZERS = ('nltk', 'regex')
+
+def _is_whole_word(text, start, end):
+    """
+    True if text[start:end] is not part of a longer word (a plural 's' may follow)
+    """
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    if end < len(text) and text[end] == 's':
+        end += 1
+    return end >= len(text) or not text[end].isalnum()
+
+def normalize_message(text):
+    """
+    Canonical form of a message used as the cache key
+    """
+    return ' '.join(text.lower().split())
 
 class NLPService:
-    def __init__(self):
-        # Load NLTK stopwords
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, tokenizer=None, aliases=None):
+        # Tokenizer backend: the precompiled 'regex' (default, no NLTK import) or 'nltk'
+        self.tokenizer = tokenizer or os.getenv('NLP_TOKENIZER', 'regex')
+        if self.tokenizer not in TOKENIZERS:
+            raise ValueError(f"Unknown tokenizer {self.tokenizer!r}; expected one of {TOKENIZERS}")
+        
+        # Bundled copy of the NLTK English stopwords (no corpus download)
+        self.stop_words = set(ENGLISH_STOP_WORDS)
+        
+        # Created on first tokenization
+        self._word_tokenizer = None
         
         # Backend API URL
         self.backend_url = os.getenv('BACKEND_URL', 'http://localhost:3001/api')
@@ -45,50 +69,175 @@ class NLPService:
             'QUANTITY': ['kg', 'kilogram', 'gram', 'g', 'liter', 'l', 'pack', 'box', 'unit'],
             'NUMBER': [str(i) for i in range(1, 100)]
         }
+        
+        # Memoized pipeline: normalized message -> (intent, entities), and
+        # inventory replies tagged with the catalog version they were built from
+        cache_size = int(os.getenv('NLP_CACHE_SIZE', 1024))
+        self.analysis_cache = LRUCache(cache_size)
+        self.response_cache = LRUCache(cache_size)
+        
+        # Compile intent keywords and product names into a single automaton
+        self.matcher = KeywordMatcher()
+        for intent, patterns in self.intent_patterns.items():
+            for pattern in patterns:
+                self.matcher.add(pattern, 'INTENT', intent)
+        
+        # Words that are never looked up fuzzily as product names
+        self.non_product_words = set(self.stop_words) | COMMON_CHAT_WORDS
+        self.non_product_words.update(self.entity_types['QUANTITY'])
+        for patterns in self.intent_patterns.values():
+            for pattern in patterns:
+                self.non_product_words.update(pattern.split())
+        
+        from .backend_client import AsyncBackendClient, BackendClient
+        from .catalog_cache import CatalogCache
+        from .product_index import DEFAULT_PRODUCT_ALIASES, ProductNameIndex
+        
+        # Fuzzy/alias index over the product vocabulary for misspelled and Hinglish names
+        if aliases is None:
+            aliases = dict(DEFAULT_PRODUCT_ALIASES)
+            aliases_file = os.getenv('NLP_PRODUCT_ALIASES_FILE')
+            if aliases_file:
+                with open(aliases_file, encoding='utf-8') as f:
+                    aliases.update(json.load(f))
+        self.product_terms = ProductNameIndex(aliases=aliases)
+        self.fuzzy_threshold = float(os.getenv('NLP_FUZZY_THRESHOLD', 0.8))
+        
+        self.product_vocabulary = set()
+        # Guards the matcher vocabulary and product_terms against concurrent catalog reloads
+        self._vocabulary_lock = threading.RLock()
+        self.update_product_vocabulary([])
+        
+        # Pooled client shared by every backend call
+        self.client = BackendClient(self.backend_url)
+        self.async_client = AsyncBackendClient(self.client)
+        
+        # Local replica of the backend catalog, indexed by name for product lookups
+        self.catalog = CatalogCache(self.client, on_reload=self._on_catalog_reload)
+    
+    def update_product_vocabulary(self, product_names):
+        """
+        Sync the product keywords in the matcher with the catalog names.
+        Only names that were added or removed are touched.
+        """
+        vocabulary = set(self.entity_types['PRODUCT'])
+        vocabulary.update(name.lower() for name in product_names if name)
+        with self._vocabulary_lock:
+            if vocabulary == self.product_vocabulary:
+                return
+            
+            # Cached analyses may have missed (or matched) products that changed
+            self.analysis_cache.clear()
+            
+            for name in self.product_vocabulary - vocabulary:
+                self.matcher.remove(name, 'PRODUCT', name)
+                self.product_terms.remove(name)
+            for name in vocabulary - self.product_vocabulary:
+                self.matcher.add(name, 'PRODUCT', name)
+                self.product_terms.add(name, name)
+            
+            self.product_vocabulary = vocabulary
+    
+    def _on_catalog_reload(self, products):
+        """
+        Keep the matcher vocabulary in step with a freshly downloaded catalog
+        """
+        self.update_product_vocabulary(product['name'] for product in products)
+    
+    def scan(self, text):
+        """
+        Find every intent keyword and product mention in one pass over the text
+        """
+        return self.matcher.find_all(text)
     
     def process_text(self, text):
         """
-        Process text with NLTK tokenization
+        Tokenize text with the configured tokenizer backend
         """
+        if self.tokenizer == 'regex':
+            return REGEX_TOKEN_PATTERN.findall(text.lower())
+        
         try:
-            tokens = word_tokenize(text.lower())
+            if self._word_tokenizer is None:
+                # NLTK's word tokenizer without punkt sentence splitting needs no data files
+                from nltk.tokenize.destructive import NLTKWordTokenizer
+                self._word_tokenizer = NLTKWordTokenizer()
+            tokens = self._word_tokenizer.tokenize(text.lower())
             return tokens
         except Exception as e:
             print(f"Error in tokenization: {e}")
             # Fallback to simple split if NLTK fails
             return text.lower().split()
     
-    def extract_entities(self, text):
+    def extract_entities(self, text, matches=None, tokens=None):
         """
         Extract entities from text using custom rules
         """
-        tokens = self.process_text(text)
+        if tokens is None:
+            tokens = self.process_text(text)
         
         # Extract custom entities
-        custom_entities = self._extract_custom_entities(text)
+        custom_entities = self._extract_custom_entities(text, matches)
         
         return {
             'custom_entities': custom_entities,
             'tokens': tokens
         }
     
-    def _extract_custom_entities(self, text):
+    def _extract_custom_entities(self, text, matches=None):
         """
         Extract custom entities using rule-based approach
         """
         entities = []
         text_lower = text.lower()
         
-        # Extract product entities
-        for product in self.entity_types['PRODUCT']:
-            if product in text_lower:
-                start = text_lower.find(product)
+        if matches is None:
+            matches = self.scan(text)
+        
+        # Extract product entities, keeping the longest mention where they overlap
+        covered_until = -1
+        covered = []
+        for match in matches:
+            # Intent keywords inside other words ('hi' in "chini") must not block the fuzzy lookup
+            if match['label'] == 'INTENT':
+                if _is_whole_word(text_lower, match['start'], match['end']):
+                    covered.append((match['start'], match['end']))
+            elif (match['label'] == 'PRODUCT' and match['start'] >= covered_until
+                    and _is_whole_word(text_lower, match['start'], match['end'])):
+                entities.append({
+                    'text': match['text'],
+                    'label': 'PRODUCT',
+                    'start': match['start'],
+                    'end': match['end'],
+                    'confidence': 1.0,
+                    'match': 'exact'
+                })
+                covered.append((match['start'], match['end']))
+                covered_until = match['end']
+        
+        # Fall back to fuzzy/alias lookup for the remaining words ("chawal", "suger"),
+        # skipping everyday and intent words that sit close to product names
+        for word in re.finditer(r'[^\W\d_]+', text_lower):
+            if (len(word.group(0)) < 3 or word.group(0) in self.non_product_words
+                    or any(start < word.end() and word.start() < end for start, end in covered)):
+                continue
+            
+            candidates = self.product_terms.fuzzy_search(word.group(0), limit=1, min_score=self.fuzzy_threshold)
+            if candidates:
+                name, confidence = candidates[0]
+                if word.group(0) in self.product_terms.aliases:
+                    match_kind = 'alias'
+                else:
+                    match_kind = 'exact' if confidence >= 1.0 else 'fuzzy'
                 entities.append({
-                    'text': product,
+                    'text': name,
                     'label': 'PRODUCT',
-                    'start': start,
-                    'end': start + len(product)
+                    'start': word.start(),
+                    'end': word.end(),
+                    'confidence': confidence,
+                    'match': match_kind
                 })
+        entities.sort(key=lambda entity: entity['start'])
         
         # Extract quantity entities
         quantity_pattern = r'(\d+)\s*(kg|kilogram|gram|g|liter|l|pack|box|unit)s?'
@@ -103,20 +252,22 @@ class NLPService:
         
         return entities
     
-    def classify_intent(self, text):
+    def classify_intent(self, text, matches=None, tokens=None):
         """
         Classify the intent of the user input
         """
-        text_lower = text.lower()
+        if matches is None:
+            matches = self.scan(text)
         
         # Check for exact matches first
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    return intent
+        matched_intents = {match['value'] for match in matches if match['label'] == 'INTENT'}
+        for intent in self.intent_patterns:
+            if intent in matched_intents:
+                return intent
         
         # Use NLTK for more sophisticated analysis
-        tokens = self.process_text(text)
+        if tokens is None:
+            tokens = self.process_text(text)
         
         # Extract keywords (excluding stopwords)
         keywords = [token.lower() for token in tokens 
@@ -139,13 +290,50 @@ class NLPService:
         # Default intent
         return 'general_query'
     
+    def _analyze(self, text):
+        """
+        Classify the intent and extract entities from a single scan and a
+        single tokenization of the text. Results are memoized on the
+        normalized message, and entity offsets refer to that normalized text.
+        """
+        # Catalog product names must be in the matcher before the message is scanned
+        self._refresh_vocabulary()
+        
+        text = normalize_message(text)
+        with self._vocabulary_lock:
+            analysis = self.analysis_cache.get(text)
+            if analysis is None:
+                matches = self.scan(text)
+                tokens = self.process_text(text)
+                intent = self.classify_intent(text, matches, tokens)
+                entities = self.extract_entities(text, matches, tokens)
+                analysis = (intent, entities)
+                self.analysis_cache.put(text, analysis)
+        return analysis
+    
+    def _refresh_vocabulary(self):
+        """
+        Reload the catalog if its TTL expired, so new product names are matched.
+        Backend errors are left to the reply, which reports them.
+        """
+        if self.catalog.is_fresh():
+            return
+        try:
+            self.catalog.products()
+        except Exception:
+            pass
+    
     def generate_response(self, text):
         """
         Generate a response based on the intent and entities
         """
-        intent = self.classify_intent(text)
-        entities = self.extract_entities(text)
-        
+        intent, entities = self._analyze(text)
+        return self._respond(intent, entities)
+    
+    def _respond(self, intent, entities):
+        """
+        Build the reply for an analyzed message
+        """
         # Generate response based on intent
         if intent == 'greeting':
             return "Hello! Welcome to Mini Bharat AI Store. How can I help you with your Kirana store operations today?"
@@ -163,17 +351,14 @@ class NLPService:
                 return all_products
         
         elif intent == 'order_request':
-            product_entities = [ent for ent in entities['custom_entities'] if ent['label'] == 'PRODUCT']
-            quantity_entities = [ent for ent in entities['custom_entities'] if ent['label'] == 'QUANTITY']
+            lines = self._order_lines(entities)
             
-            if product_entities and quantity_entities:
-                product = product_entities[0]['text']
-                quantity = quantity_entities[0]['text']
-                # Place order through backend
-                order_result = self._place_order(product, quantity)
+            if any(quantity for _, quantity in lines):
+                # Place every order line through backend
+                order_result = self._place_orders(lines)
                 return order_result
-            elif product_entities:
-                product = product_entities[0]['text']
+            elif lines:
+                product = lines[0][0]
                 return f"How much {product} would you like to order?"
             else:
                 return "What product would you like to order and how much?"
@@ -197,94 +382,438 @@ class NLPService:
         else:
             return "I understand. Let me help you with that. For Kirana store operations, I recommend checking your stock levels first. What specific information do you need?"
     
+    def generate_responses(self, texts):
+        """
+        Generate responses for a burst of messages
+        
+        All messages are classified first, catalog lookups share a single
+        catalog read, and stock deductions for different products are sent
+        concurrently. Deductions for the same product keep their input order.
+        
+        Args:
+            texts (list): Incoming messages
+            
+        Returns:
+            list: Responses in the same order as the input
+        """
+        responses, orders = self._batch_responses(texts)
+        if orders:
+            # Order lines from all messages go out in a single concurrent round
+            replies = self._run_orders([lines for _, lines in orders])
+            for (i, _), reply in zip(orders, replies):
+                responses[i] = reply
+        return responses
+    
+    async def generate_responses_async(self, texts):
+        """
+        Coroutine version of generate_responses for callers already running an
+        event loop. The catalog read runs on a worker thread and stock
+        deductions are awaited instead of blocking the loop.
+        
+        Args:
+            texts (list): Incoming messages
+            
+        Returns:
+            list: Responses in the same order as the input
+        """
+        import asyncio
+        
+        responses, orders = await asyncio.to_thread(self._batch_responses, texts)
+        if orders:
+            results, deductions = self._resolve_orders([lines for _, lines in orders])
+            outcomes = await self._deduct_concurrently_async([order for _, _, order in deductions])
+            replies = self._finish_orders(results, deductions, outcomes)
+            for (i, _), reply in zip(orders, replies):
+                responses[i] = reply
+        return responses
+    
+    def _batch_responses(self, texts):
+        """
+        Answer every message that needs no stock deduction, with one catalog read
+        
+        Returns:
+            tuple: (responses with None for order messages, (index, order lines) per order message)
+        """
+        analyses = [self._analyze(text) for text in texts]
+        responses = [None] * len(texts)
+        
+        catalog_requests = []
+        for i, (intent, entities) in enumerate(analyses):
+            request = self._catalog_request(intent, entities)
+            if request is None:
+                responses[i] = self._respond(intent, entities)
+            else:
+                catalog_requests.append((i, request))
+        
+        if not catalog_requests:
+            return responses, []
+        
+        # One catalog read serves every lookup in the batch
+        try:
+            products = self.catalog.products()
+        except Exception as e:
+            for i, _ in catalog_requests:
+                responses[i] = self._backend_error_message(e, "fetching inventory")
+            return responses, []
+        
+        if products is None:
+            for i, _ in catalog_requests:
+                responses[i] = "Unable to fetch inventory information at the moment. Backend may be down."
+            return responses, []
+        
+        orders = []
+        for i, (kind, payload) in catalog_requests:
+            if kind == 'stock':
+                responses[i] = self._remember_response(('stock', payload), self._format_product_stock(payload))
+            elif kind == 'inventory':
+                responses[i] = self._remember_response(('inventory', None), self._format_inventory(products))
+            else:
+                orders.append((i, payload))
+        
+        return responses, orders
+    
+    def _catalog_request(self, intent, entities):
+        """
+        Describe the catalog work a message needs as (kind, payload), or None
+        """
+        if intent == 'inventory_query':
+            product_entities = [ent for ent in entities['custom_entities'] if ent['label'] == 'PRODUCT']
+            if product_entities:
+                return ('stock', product_entities[0]['text'])
+            return ('inventory', None)
+        if intent == 'order_request':
+            lines = self._order_lines(entities)
+            if any(quantity for _, quantity in lines):
+                return ('order', lines)
+        return None
+    
+    def _order_lines(self, entities):
+        """
+        Pair every product mentioned in an order with its quantity
+        
+        When there are as many quantities as products they are paired in the
+        order they appear ("5kg rice, 2kg sugar and 1L oil"). Otherwise each
+        quantity goes to the closest product, so "rice, 2kg sugar" leaves
+        rice without a quantity. Fuzzy (misspelt) matches left without a
+        quantity are dropped rather than asked about, since they are the
+        likeliest to be a misread word.
+        
+        Returns:
+            list: (product, quantity or None) pairs in the order products were mentioned
+        """
+        product_entities = [ent for ent in entities['custom_entities'] if ent['label'] == 'PRODUCT']
+        quantity_entities = [ent for ent in entities['custom_entities'] if ent['label'] == 'QUANTITY']
+        
+        if len(product_entities) == len(quantity_entities):
+            return [(product['text'], quantity['text'])
+                    for product, quantity in zip(product_entities, quantity_entities)]
+        
+        # Greedily pair the closest (product, quantity) spans first
+        distances = sorted(
+            (max(product['start'] - quantity['end'], quantity['start'] - product['end'], 0), i, j)
+            for i, product in enumerate(product_entities)
+            for j, quantity in enumerate(quantity_entities)
+        )
+        paired = {}
+        used = set()
+        for _, i, j in distances:
+            if i not in paired and j not in used:
+                paired[i] = quantity_entities[j]['text']
+                used.add(j)
+        
+        return [(product['text'], paired.get(i)) for i, product in enumerate(product_entities)
+                if i in paired or product.get('match') != 'fuzzy']
+    
+    def _backend_error_message(self, error, action):
+        """
+        Turn a backend exception into a chat reply
+        """
+        import requests
+        
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "Cannot connect to backend server. Please make sure the API is running on port 3001."
+        if isinstance(error, requests.exceptions.Timeout):
+            return "Request timed out. Please try again."
+        return f"Error {action}: {str(error)}"
+    
+    def _format_product_stock(self, product_name):
+        """
+        Describe the stock of a product from the local catalog
+        """
+        product = self.catalog.find(product_name)
+        if product is not None:
+            return f"{product['name']}: {product['quantity']} units available (₹{product['price']} each)"
+        
+        return f"I couldn't find {product_name} in your inventory. Would you like to add it?"
+    
+    def _format_inventory(self, products):
+        """
+        List the first products of the catalog
+        """
+        if products:
+            product_list = "\n".join([f"• {p['name']}: {p['quantity']} units (₹{p['price']})" for p in products[:10]])
+            return f"Your inventory:\n{product_list}\n\nTotal items: {len(products)}"
+        else:
+            return "Your inventory is empty. Would you like to add some products?"
+    
+    def _cached_response(self, key):
+        """
+        Return a cached inventory reply if the catalog it was built from is still current
+        """
+        if not self.catalog.is_fresh():
+            return None
+        entry = self.response_cache.get(key)
+        if entry is not None and entry[0] == self.catalog.version:
+            return entry[1]
+        return None
+    
+    def _remember_response(self, key, response):
+        """
+        Cache an inventory reply against the current catalog version
+        """
+        self.response_cache.put(key, (self.catalog.version, response))
+        return response
+    
     def _get_product_stock(self, product_name):
         """
         Get product stock information from backend API
         """
+        cached = self._cached_response(('stock', product_name))
+        if cached is not None:
+            return cached
+        
         try:
-            # First, get all products to find the matching product
-            response = requests.get(f"{self.backend_url}/inventory/products", timeout=5)
-            if response.status_code == 200:
-                products = response.json().get('data', [])
-                # Find product that matches the name
-                for product in products:
-                    if product_name.lower() in product['name'].lower():
-                        return f"{product['name']}: {product['quantity']} units available (₹{product['price']} each)"
-                
-                return f"I couldn't find {product_name} in your inventory. Would you like to add it?"
+            # Make sure the local catalog is current (served from memory while fresh)
+            products = self.catalog.products()
+            if products is not None:
+                return self._remember_response(('stock', product_name), self._format_product_stock(product_name))
             else:
                 return "Unable to fetch inventory information at the moment. Backend may be down."
-        except requests.exceptions.ConnectionError:
-            return "Cannot connect to backend server. Please make sure the API is running on port 3001."
-        except requests.exceptions.Timeout:
-            return "Request timed out. Please try again."
         except Exception as e:
-            return f"Error fetching inventory: {str(e)}"
+            return self._backend_error_message(e, "fetching inventory")
     
     def _get_all_products(self):
         """
         Get all products from backend API
         """
+        cached = self._cached_response(('inventory', None))
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get(f"{self.backend_url}/inventory/products", timeout=5)
-            if response.status_code == 200:
-                products = response.json().get('data', [])
-                if products:
-                    product_list = "\n".join([f"• {p['name']}: {p['quantity']} units (₹{p['price']})" for p in products[:10]])
-                    return f"Your inventory:\n{product_list}\n\nTotal items: {len(products)}"
-                else:
-                    return "Your inventory is empty. Would you like to add some products?"
+            products = self.catalog.products()
+            if products is not None:
+                return self._remember_response(('inventory', None), self._format_inventory(products))
             else:
                 return "Unable to fetch inventory information at the moment. Backend may be down."
-        except requests.exceptions.ConnectionError:
-            return "Cannot connect to backend server. Please make sure the API is running on port 3001."
-        except requests.exceptions.Timeout:
-            return "Request timed out. Please try again."
         except Exception as e:
-            return f"Error fetching inventory: {str(e)}"
+            return self._backend_error_message(e, "fetching inventory")
+    
+    def _resolve_order(self, product_name, quantity):
+        """
+        Match an order line against the local catalog
+        
+        Returns:
+            tuple or str: (product, quantity text, numeric quantity), or a reply explaining the problem
+        """
+        # Find product that matches the name
+        product = self.catalog.find(product_name)
+        if product is None:
+            return f"I couldn't find {product_name} in your inventory. Would you like to add it first?"
+        
+        # Extract numeric quantity
+        quantity_num = re.findall(r'\d+', quantity)
+        if not quantity_num:
+            return f"Invalid quantity specified for {product['name']}."
+        
+        return product, quantity, int(quantity_num[0])
+    
+    def _order_result_message(self, product, quantity, deduct_response):
+        """
+        Apply a deduct-stock response to the catalog and describe the outcome
+        
+        Returns:
+            tuple: (success, reply)
+        """
+        if deduct_response.status_code == 200:
+            # Keep the local catalog in step with the new stock level
+            self.catalog.apply_update(deduct_response.json().get('data'))
+            return True, f"Successfully placed order for {quantity} of {product['name']}. Stock updated!"
+        else:
+            return False, f"Failed to place order for {product['name']}. Error: {deduct_response.json().get('message', 'Unknown error')}"
+    
+    def _format_order_reply(self, results):
+        """
+        Combine the outcome of each order line into one reply
+        """
+        if len(results) == 1:
+            return results[0][1]
+        
+        placed = sum(1 for success, _ in results if success)
+        line_list = "\n".join(f"• {reply}" for _, reply in results)
+        return f"Placed {placed} of {len(results)} order lines:\n{line_list}"
+    
+    def _run_orders(self, orders):
+        """
+        Resolve and place the order lines of one or more messages against the
+        current catalog. All deductions are sent as one bulk round: a single
+        line goes out directly, several run concurrently on worker threads.
+        
+        Args:
+            orders (list): One list of (product, quantity or None) lines per message
+            
+        Returns:
+            list: Reply for each message
+        """
+        results, deductions = self._resolve_orders(orders)
+        outcomes = self._deduct_concurrently([order for _, _, order in deductions])
+        return self._finish_orders(results, deductions, outcomes)
+    
+    def _resolve_orders(self, orders):
+        """
+        Match every order line against the catalog
+        
+        Returns:
+            tuple: (per-message line results with None where a deduction is pending,
+            (line results, position, resolved order) for each pending deduction)
+        """
+        results = []
+        deductions = []
+        for lines in orders:
+            line_results = []
+            for product_name, quantity in lines:
+                if quantity is None:
+                    line_results.append((False, f"How much {product_name} would you like to order?"))
+                    continue
+                order = self._resolve_order(product_name, quantity)
+                if isinstance(order, str):
+                    line_results.append((False, order))
+                else:
+                    deductions.append((line_results, len(line_results), order))
+                    line_results.append(None)
+            results.append(line_results)
+        return results, deductions
+    
+    def _finish_orders(self, results, deductions, outcomes):
+        """
+        Fill in the deduction outcomes and build the reply for each message
+        """
+        for (line_results, position, _), outcome in zip(deductions, outcomes):
+            line_results[position] = outcome
+        
+        return [self._format_order_reply(line_results) for line_results in results]
     
-    def _place_order(self, product_name, quantity):
+    def _place_orders(self, lines):
         """
-        Place an order through the backend API
+        Place an order with one or more lines through the backend API
         """
         try:
-            # First, get all products to find the matching product
-            response = requests.get(f"{self.backend_url}/inventory/products", timeout=5)
-            if response.status_code == 200:
-                products = response.json().get('data', [])
-                # Find product that matches the name
-                for product in products:
-                    if product_name.lower() in product['name'].lower():
-                        # Extract numeric quantity
-                        quantity_num = re.findall(r'\d+', quantity)
-                        if quantity_num:
-                            quantity_num = int(quantity_num[0])
-                            # Deduct stock from inventory
-                            deduct_response = requests.post(
-                                f"{self.backend_url}/inventory/products/{product['id']}/deduct-stock",
-                                json={"quantity": quantity_num},
-                                timeout=5
-                            )
-                            if deduct_response.status_code == 200:
-                                return f"Successfully placed order for {quantity} of {product['name']}. Stock updated!"
-                            else:
-                                return f"Failed to place order for {product['name']}. Error: {deduct_response.json().get('message', 'Unknown error')}"
-                        else:
-                            return f"Invalid quantity specified for {product['name']}."
-                
-                return f"I couldn't find {product_name} in your inventory. Would you like to add it first?"
-            else:
+            # Make sure the local catalog is current (served from memory while fresh)
+            products = self.catalog.products()
+            if products is None:
                 return "Unable to fetch inventory information at the moment. Backend may be down."
-        except requests.exceptions.ConnectionError:
-            return "Cannot connect to backend server. Please make sure the API is running on port 3001."
-        except requests.exceptions.Timeout:
-            return "Request timed out. Please try again."
         except Exception as e:
-            return f"Error placing order: {str(e)}"
+            return self._backend_error_message(e, "placing order")
+        
+        return self._run_orders([lines])[0]
+    
+    def _deduct(self, order):
+        """
+        Deduct stock for a single resolved order line
+        
+        Returns:
+            tuple: (success, reply)
+        """
+        product, quantity, quantity_num = order
+        try:
+            deduct_response = self.client.post(
+                f"/inventory/products/{product['id']}/deduct-stock",
+                json={"quantity": quantity_num}
+            )
+            return self._order_result_message(product, quantity, deduct_response)
+        except Exception as e:
+            return False, self._backend_error_message(e, "placing order")
+    
+    @staticmethod
+    def _deduction_chains(orders):
+        """
+        Group order positions by product; deductions for one product stay in input order
+        """
+        chains = {}
+        for position, order in enumerate(orders):
+            chains.setdefault(order[0]['id'], []).append(position)
+        return list(chains.values())
+    
+    def _deduct_concurrently(self, orders):
+        """
+        Send stock deductions on worker threads, one sequential chain per product.
+        Safe to call from inside a running event loop.
+        
+        Returns:
+            list: (success, reply) for each order, in input order
+        """
+        chains = self._deduction_chains(orders)
+        if len(chains) <= 1:
+            return [self._deduct(order) for order in orders]
+        
+        results = [None] * len(orders)
+        
+        def run_chain(positions):
+            for position in positions:
+                results[position] = self._deduct(orders[position])
+        
+        with ThreadPoolExecutor(max_workers=min(len(chains), self.client.pool_size)) as executor:
+            # list() re-raises anything a chain raised
+            list(executor.map(run_chain, chains))
+        return results
+    
+    async def _deduct_concurrently_async(self, orders):
+        """
+        Coroutine version of _deduct_concurrently for generate_responses_async
+        
+        Returns:
+            list: (success, reply) for each order, in input order
+        """
+        results = [None] * len(orders)
+        
+        async def run_chain(positions):
+            for position in positions:
+                product, quantity, quantity_num = orders[position]
+                try:
+                    deduct_response = await self.async_client.post(
+                        f"/inventory/products/{product['id']}/deduct-stock",
+                        json={"quantity": quantity_num}
+                    )
+                    results[position] = self._order_result_message(product, quantity, deduct_response)
+                except Exception as e:
+                    results[position] = (False, self._backend_error_message(e, "placing order"))
+        
+        import asyncio
+        await asyncio.gather(*(run_chain(positions) for positions in self._deduction_chains(orders)))
+        return results
+
+# Shared NLP service, created on first use
+_nlp_service = None
+_nlp_service_lock = threading.Lock()
+
+def get_nlp_service():
+    """
+    Return the shared NLPService, creating it on first use
+    """
+    global _nlp_service
+    if _nlp_service is None:
+        with _nlp_service_lock:
+            if _nlp_service is None:
+                _nlp_service = NLPService()
+    return _nlp_service
 
-# Initialize NLP service
-nlp_service = NLPService()
+def __getattr__(name):
+    # Keeps `from ai.nlp_service import nlp_service` working without building it at import time
+    if name == 'nlp_service':
+        return get_nlp_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Test the NLP service
+    get_nlp_service()
     print("NLP Service initialized successfully")
\ No newline at end of file
@@ -0,0 +1,246 @@
+from collections import defaultdict
+import pandas as pd
+from .keyword_matcher import KeywordMatcher
+
+ORDER_LINE_COLUMNS = ['order_id', 'customer', 'date', 'item', 'quantity', 'unit']
+
+
+def parse_quantity(text):
+    """
+    Parse the text inside an item's parentheses, e.g. '5kg', '2L' or '1 pack'
+
+    Returns:
+        tuple: (quantity, unit); anything unparseable counts as one unit
+    """
+    text = text.strip()
+    try:
+        if text.endswith('kg'):
+            return float(text[:-2]), 'kg'
+        if text.endswith('L'):
+            return float(text[:-1]), 'L'
+        if text.endswith('pack'):
+            return 1.0, 'pack'
+        return float(text), None
+    except ValueError:
+        return 1.0, None
+
+
+def parse_items(items):
+    """
+    Split an order's Items string into its lines
+
+    Args:
+        items (str): e.g. 'Wheat Flour (5kg), Rice (2kg)'
+
+    Returns:
+        list: (name, quantity, unit) tuples
+    """
+    lines = []
+    for item in str(items).split(', '):
+        name = item.split('(')[0].strip()
+        if not name:
+            continue
+        if '(' in item and ')' in item:
+            quantity, unit = parse_quantity(item.split('(')[1].split(')')[0])
+        else:
+            quantity, unit = 1.0, None
+        lines.append((name, quantity, unit))
+    return lines
+
+
+class OrderLinesTable:
+    """
+    Orders flattened into one row per item: order_id, customer, date, item,
+    quantity and unit.
+
+    Each order's Items string is parsed once, when the order is first seen;
+    orders added later are appended without touching the existing rows, and
+    the DataFrame view only converts the rows added since it was last built.
+    Running totals per (item, day) are updated with each order, and the
+    per-(product, day) demand of every tracked product is kept from them:
+    a new order only touches the products its items mention, and a newly
+    tracked product is summed from the item totals, never from the rows.
+    Daily totals imported without their lines are added on top.
+    """
+
+    def __init__(self, orders=None):
+        self._rows = []
+        # Rows already converted to DataFrame chunks
+        self._chunks = []
+        self._chunked_rows = 0
+        self.version = 0
+
+        # Product names are matched inside item names, as the per-order parser did
+        self._matcher = KeywordMatcher()
+        self._products = set()
+        self._products_version = 0
+        self._item_products = {}
+
+        # Running totals: item -> {date: quantity} and product -> {date: quantity}
+        self._item_daily = defaultdict(lambda: defaultdict(float))
+        self._product_daily = {}
+        # Daily totals loaded without their order lines (see add_daily_demand)
+        self._imported = None
+
+        self._daily = None
+        self._daily_key = None
+
+        self.add_orders(orders or [])
+
+    @classmethod
+    def from_order_manager(cls, order_manager):
+        """Build a table over an OrderManager and keep it updated on add_order"""
+        table = cls(order_manager.orders_data)
+        order_manager.add_listener(table.add_order)
+        return table
+
+    def __getstate__(self):
+        # defaultdicts with lambdas do not pickle (forecast workers get a copy)
+        state = self.__dict__.copy()
+        state['_item_daily'] = {item: dict(days) for item, days in self._item_daily.items()}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        item_daily = defaultdict(lambda: defaultdict(float))
+        for item, days in state['_item_daily'].items():
+            item_daily[item].update(days)
+        self._item_daily = item_daily
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add_order(self, order):
+        """Append the lines of a single order"""
+        self.add_orders([order])
+
+    def add_orders(self, orders):
+        """Append the lines of several orders"""
+        rows = []
+        for order in orders:
+            for name, quantity, unit in parse_items(order['Items']):
+                rows.append((order['Order ID'], order['Customer'], order['Order Date'], name, quantity, unit))
+
+        if not rows:
+            return
+        self._rows.extend(rows)
+
+        item_daily = self._item_daily
+        product_daily = self._product_daily
+        for _, _, date, item, quantity, _ in rows:
+            item_daily[item][date] += quantity
+            if product_daily:
+                for product in self.products_for_item(item):
+                    totals = product_daily[product]
+                    totals[date] = totals.get(date, 0.0) + quantity
+        self.version += 1
+
+    @property
+    def frame(self):
+        """All order lines as a DataFrame (shared; copy before modifying)"""
+        if self._chunked_rows < len(self._rows) or not self._chunks:
+            chunk = pd.DataFrame(self._rows[self._chunked_rows:], columns=ORDER_LINE_COLUMNS)
+            chunk['date'] = pd.to_datetime(chunk['date'], format='%Y-%m-%d')
+            chunk['quantity'] = chunk['quantity'].astype(float)
+            self._chunks.append(chunk)
+            self._chunked_rows = len(self._rows)
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks, ignore_index=True)]
+        return self._chunks[0]
+
+    def track_products(self, product_names):
+        """Register product names whose demand should be aggregated"""
+        added = []
+        for name in product_names:
+            if name not in self._products:
+                self._products.add(name)
+                self._matcher.add(name, 'PRODUCT', name)
+                added.append(name)
+
+        if added:
+            # A new name can appear inside items that were already mapped
+            self._item_products = {}
+            for name in added:
+                self._product_daily[name] = {}
+            for item, days in self._item_daily.items():
+                for product in self.products_for_item(item):
+                    if product in added:
+                        totals = self._product_daily[product]
+                        for date, quantity in days.items():
+                            totals[date] = totals.get(date, 0.0) + quantity
+            self._products_version += 1
+
+    def add_daily_demand(self, daily):
+        """
+        Add pre-aggregated demand, e.g. a history imported from file
+
+        Args:
+            daily (pd.Series): Quantities indexed by (product, date)
+        """
+        daily = daily.rename_axis(['product', 'date']).astype(float).rename('quantity')
+        if self._imported is not None:
+            daily = pd.concat([self._imported, daily]).groupby(level=['product', 'date']).sum()
+        self._imported = daily.sort_index()
+        self.version += 1
+
+    @property
+    def demand_version(self):
+        """Changes whenever orders or tracked products change, i.e. when daily_demand would"""
+        return (self.version, self._products_version)
+
+    def products_for_item(self, item):
+        """Return the tracked product names mentioned in an item name"""
+        products = self._item_products.get(item)
+        if products is None:
+            products = tuple(sorted({match['value'] for match in self._matcher.find_all(item)
+                                     if match['label'] == 'PRODUCT'}))
+            self._item_products[item] = products
+        return products
+
+    def daily_demand(self):
+        """
+        Total ordered quantity per tracked product and order date
+
+        Returns:
+            pd.Series: Quantities indexed by (product, date), sorted
+        """
+        key = self.demand_version
+        if self._daily_key == key:
+            return self._daily
+
+        products, dates, quantities = [], [], []
+        for product, totals in self._product_daily.items():
+            products.extend([product] * len(totals))
+            dates.extend(totals.keys())
+            quantities.extend(totals.values())
+
+        index = pd.MultiIndex.from_arrays(
+            [pd.Index(products, dtype=object), pd.to_datetime(pd.Index(dates, dtype=object), format='%Y-%m-%d')],
+            names=['product', 'date']
+        )
+        daily = pd.Series(quantities, index=index, dtype=float, name='quantity')
+        if self._imported is not None:
+            daily = pd.concat([daily, self._imported]).groupby(level=['product', 'date']).sum()
+        daily = daily.sort_index()
+
+        self._daily = daily
+        self._daily_key = key
+        return daily
+
+    def product_series(self, product_name):
+        """
+        Daily demand for one product
+
+        Returns:
+            pd.DataFrame: date and quantity columns sorted by date (empty if never ordered)
+        """
+        self.track_products([product_name])
+        totals = self._product_daily[product_name]
+        series = pd.Series(list(totals.values()), index=pd.to_datetime(list(totals.keys()), format='%Y-%m-%d'),
+                           dtype=float)
+        if self._imported is not None and product_name in self._imported.index.levels[0]:
+            series = pd.concat([series, self._imported.xs(product_name, level='product')])
+            series = series.groupby(level=0).sum()
+        if series.empty:
+            return pd.DataFrame(columns=['date', 'quantity'])
+        return series.sort_index().rename_axis('date').rename('quantity').reset_index()
@@ -0,0 +1,149 @@
+import heapq
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+from .order_lines import parse_items
+
+# Rebase decayed scores before their exponent grows past this
+_MAX_EXPONENT = 50.0
+
+
+class _RankedScores:
+    """
+    Scores that only ever increase, with a lazy max-heap for top-N.
+
+    Every increase pushes a new heap entry; entries whose score is no
+    longer current are dropped when they reach the top. Ties rank the
+    item seen first higher.
+    """
+
+    def __init__(self, order):
+        self.scores = {}
+        self._order = order
+        self._heap = []
+
+    def add(self, item, amount):
+        score = self.scores.get(item, 0.0) + amount
+        if score == self.scores.get(item):
+            # Too small to register (a decayed weight that underflowed)
+            return
+        self.scores[item] = score
+        heapq.heappush(self._heap, (-score, self._order[item], item))
+        if len(self._heap) > 4 * len(self.scores) + 64:
+            self.rebuild()
+
+    def rebuild(self):
+        self._heap = [(-score, self._order[item], item) for item, score in self.scores.items()]
+        heapq.heapify(self._heap)
+
+    def scale(self, factor):
+        """Multiply every score (ranking is unchanged)"""
+        self.scores = {item: score * factor for item, score in self.scores.items()}
+        self.rebuild()
+
+    def top(self, top_n):
+        """(item, score) pairs, highest first"""
+        best = []
+        seen = set()
+        while self._heap and len(best) < top_n:
+            entry = heapq.heappop(self._heap)
+            if self.scores.get(entry[2]) == -entry[0] and entry[2] not in seen:
+                seen.add(entry[2])
+                best.append(entry)
+        for entry in best:
+            heapq.heappush(self._heap, entry)
+        return [(item, -negative_score) for negative_score, _, item in best]
+
+
+class PopularityTracker:
+    """
+    Running order counts and exponentially time-decayed trending scores per item.
+
+    Each order line adds 1 to its item's count and exp(-age / window) to its
+    trending score for every window (in days), so an order `window` days old
+    weighs 1/e of one placed today. Scores are stored relative to a reference
+    day and rescaled only when that day is far behind, so an order costs
+    O(items in it × windows) plus O(log n) heap pushes. Windows first asked
+    for later are replayed from per-day counts.
+    """
+
+    def __init__(self, windows=(7, 30)):
+        self._order = {}
+        self.counts = _RankedScores(self._order)
+        self._daily = defaultdict(Counter)
+        self._trending = {}
+        self._reference = {}
+        for window in windows:
+            self._add_window(window)
+
+    @classmethod
+    def from_order_manager(cls, order_manager, windows=(7, 30)):
+        """Build from the current orders and keep the counters updated on add_order"""
+        tracker = cls(windows)
+        tracker.add_orders(order_manager.orders_data)
+        order_manager.add_listener(tracker.add_order)
+        return tracker
+
+    @staticmethod
+    def _day(date):
+        return datetime.strptime(date, '%Y-%m-%d').toordinal()
+
+    def _add_window(self, window):
+        scores = _RankedScores(self._order)
+        self._trending[window] = scores
+        self._reference[window] = None
+        for day in sorted(self._daily):
+            for item, count in self._daily[day].items():
+                self._add_decayed(window, item, count, day)
+
+    def _add_decayed(self, window, item, count, day):
+        if self._reference[window] is None:
+            self._reference[window] = day
+        exponent = (day - self._reference[window]) / window
+        if exponent > _MAX_EXPONENT:
+            # Move the reference day forward; every stored score shrinks alike
+            self._trending[window].scale(math.exp(-exponent))
+            self._reference[window] = day
+            exponent = 0.0
+        self._trending[window].add(item, count * math.exp(exponent))
+
+    def add_order(self, order):
+        """Count the lines of a single order"""
+        self.add_orders([order])
+
+    def add_orders(self, orders):
+        """Count the lines of several orders"""
+        for order in orders:
+            day = self._day(order['Order Date'])
+            for name, _, _ in parse_items(order['Items']):
+                self._order.setdefault(name, len(self._order))
+                self._daily[day][name] += 1
+                self.counts.add(name, 1)
+                for window in self._trending:
+                    self._add_decayed(window, name, 1, day)
+
+    def top_popular(self, top_n=5):
+        """
+        Returns:
+            list: (item, order count) pairs, most ordered first
+        """
+        return [(item, int(count)) for item, count in self.counts.top(top_n)]
+
+    def top_trending(self, days=30, top_n=5, now=None):
+        """
+        Items with the highest decayed order counts for a window
+
+        Args:
+            days (int): Decay window; orders `days` old count 1/e as much as today's
+            now (datetime, optional): Day the scores are reported for; defaults to today
+
+        Returns:
+            list: (item, trending score) pairs, highest first
+        """
+        if days not in self._trending:
+            self._add_window(days)
+        if self._reference[days] is None:
+            return []
+        today = (now or datetime.now()).toordinal()
+        decay = math.exp(-(today - self._reference[days]) / days)
+        return [(item, score * decay) for item, score in self._trending[days].top(top_n)]
@@ -0,0 +1,386 @@
+import bisect
+import difflib
+import heapq
+import re
+from collections import defaultdict
+from itertools import islice
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Fuzzy matches for words up to this length must be within one edit
+SHORT_WORD_LENGTH = 5
+
+# Common Hindi/Hinglish product names mapped to catalog vocabulary
+DEFAULT_PRODUCT_ALIASES = {
+    'atta': 'flour',
+    'aata': 'flour',
+    'maida': 'flour',
+    'gehu': 'wheat',
+    'gehun': 'wheat',
+    'chawal': 'rice',
+    'chaawal': 'rice',
+    'cheeni': 'sugar',
+    'chini': 'sugar',
+    'shakkar': 'sugar',
+    'tel': 'oil',
+    'chai': 'tea',
+    'chaay': 'tea',
+    'namak': 'salt',
+    'masala': 'spices',
+}
+
+
+def normalize_name(name):
+    """Lowercase a product name and collapse whitespace"""
+    return ' '.join(str(name).lower().split())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _short_grams(text):
+    """Every one- and two-character substring, for queries too short for trigrams"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent swap"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    prefix = 0
+    while prefix < min(len(a), len(b)) and a[prefix] == b[prefix]:
+        prefix += 1
+    a, b = a[prefix:], b[prefix:]
+    return (a[1:] == b[1:] or a[1:] == b or a == b[1:]
+            or (len(a) == len(b) >= 2 and a[0] == b[1] and a[1] == b[0] and a[2:] == b[2:]))
+
+
+def _padded_bigrams(term):
+    padded = f" {term} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class ProductNameIndex:
+    """
+    Resolve free-text product names to product keys without scanning the catalog.
+
+    Lookups try, in order: exact name, name prefix, all query tokens present in
+    the name, and plain substring (answered from trigram postings, or one- and
+    two-character postings for shorter queries). Within a tier, products are
+    returned in the order they were added, so the result matches what a
+    linear scan over the catalog would have picked first.
+
+    Misspelled and Hinglish names are handled by fuzzy_search, which scores
+    name tokens and aliases through a bigram candidate index.
+    """
+
+    def __init__(self, products=None, aliases=None):
+        self._names = {}
+        self._order = {}
+        self._next_order = 0
+        self._exact = defaultdict(set)
+        self._sorted_names = []
+        # Token postings are dicts so iteration follows insertion (catalog) order
+        self._tokens = defaultdict(dict)
+        self._trigrams = defaultdict(set)
+        self._short_grams = defaultdict(set)
+
+        self.aliases = {}
+        for alias, target in (aliases or {}).items():
+            self.add_alias(alias, target)
+
+        # Bigram index over name tokens and aliases, rebuilt lazily when the vocabulary changes
+        self._fuzzy_terms = []
+        self._fuzzy_postings = {}
+        self._fuzzy_sizes = None
+        self._fuzzy_dirty = True
+
+        for key, name in products or []:
+            self.add(key, name)
+
+    @classmethod
+    def from_inventory(cls, inventory_manager, aliases=None):
+        """Build an index over an InventoryManager and keep it updated on add_product"""
+        index = cls(((item['ID'], item['Name']) for item in inventory_manager.inventory_data), aliases)
+        inventory_manager.add_listener(index.add_record)
+        return index
+
+    def add_record(self, product):
+        """Index an inventory record (the InventoryManager listener)"""
+        self.add(product['ID'], product['Name'])
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, key):
+        return key in self._names
+
+    def name(self, key):
+        """Return the normalized name stored for a key"""
+        return self._names.get(key)
+
+    def add(self, key, name):
+        """Add or rename a product"""
+        normalized = normalize_name(name)
+        if key in self._names:
+            if self._names[key] == normalized:
+                return
+            self.remove(key)
+
+        order = self._next_order
+        self._next_order += 1
+
+        self._names[key] = normalized
+        self._order[key] = order
+        self._exact[normalized].add(key)
+        bisect.insort(self._sorted_names, (normalized, order, key))
+        for token in TOKEN_PATTERN.findall(normalized):
+            if token not in self._tokens:
+                self._fuzzy_dirty = True
+            self._tokens[token][key] = None
+        for trigram in _trigrams(normalized):
+            self._trigrams[trigram].add(key)
+        for gram in _short_grams(normalized):
+            self._short_grams[gram].add(key)
+
+    def remove(self, key):
+        """Remove a product, returning True if it was indexed"""
+        normalized = self._names.pop(key, None)
+        if normalized is None:
+            return False
+        order = self._order.pop(key)
+
+        self._exact[normalized].discard(key)
+        if not self._exact[normalized]:
+            del self._exact[normalized]
+
+        position = bisect.bisect_left(self._sorted_names, (normalized, order))
+        del self._sorted_names[position]
+
+        for token in TOKEN_PATTERN.findall(normalized):
+            self._tokens[token].pop(key, None)
+            if not self._tokens[token]:
+                del self._tokens[token]
+                self._fuzzy_dirty = True
+        for trigram in _trigrams(normalized):
+            self._trigrams[trigram].discard(key)
+            if not self._trigrams[trigram]:
+                del self._trigrams[trigram]
+        for gram in _short_grams(normalized):
+            self._short_grams[gram].discard(key)
+            if not self._short_grams[gram]:
+                del self._short_grams[gram]
+        return True
+
+    def add_alias(self, alias, target):
+        """Map an alternative name (e.g. 'chawal') to a name the index can resolve (e.g. 'rice')"""
+        self.aliases[normalize_name(alias)] = normalize_name(target)
+        self._fuzzy_dirty = True
+
+    def sync(self, products):
+        """Make the index match the given (key, name) pairs, touching only what changed"""
+        products = dict(products)
+        for key in [key for key in self._names if key not in products]:
+            self.remove(key)
+        for key, name in products.items():
+            self.add(key, name)
+
+    def _in_order(self, keys):
+        return sorted(keys, key=self._order.__getitem__)
+
+    def _in_order_limited(self, keys, limit):
+        if limit is None:
+            return self._in_order(keys)
+        return heapq.nsmallest(limit, keys, key=self._order.__getitem__)
+
+    def _exact_matches(self, query, limit=None):
+        return self._in_order_limited(self._exact.get(query, ()), limit)
+
+    def _prefix_matches(self, query, limit=None):
+        keys = []
+        position = bisect.bisect_left(self._sorted_names, (query,))
+        while position < len(self._sorted_names):
+            name, _, key = self._sorted_names[position]
+            if not name.startswith(query):
+                break
+            keys.append(key)
+            position += 1
+        return self._in_order_limited(keys, limit)
+
+    def _token_matches(self, query, limit=None):
+        tokens = TOKEN_PATTERN.findall(query)
+        if not tokens:
+            return []
+        if len(tokens) == 1:
+            # Postings are already in catalog order
+            return list(islice(self._tokens.get(tokens[0], {}), limit))
+        postings = sorted((self._tokens.get(token, {}).keys() for token in tokens), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return self._in_order_limited(candidates, limit)
+
+    def _substring_matches(self, query, limit=None):
+        trigrams = _trigrams(query)
+        if not trigrams:
+            # One- and two-character queries are answered exactly by their own posting
+            return self._in_order_limited(self._short_grams.get(query, ()), limit)
+        postings = sorted((self._trigrams.get(t, set()) for t in trigrams), key=len)
+        candidates = set.intersection(*postings)
+        return self._in_order_limited((key for key in candidates if query in self._names[key]), limit)
+
+    def search(self, query, limit=None):
+        """
+        Find products matching a name
+
+        Args:
+            query (str): Product name or fragment
+            limit (int, optional): Maximum number of keys to return
+
+        Returns:
+            list: Product keys, best match tier first
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        results = []
+        seen = set()
+        for tier in (self._exact_matches, self._prefix_matches,
+                     self._token_matches, self._substring_matches):
+            # A tier's first `limit` keys always contain enough unseen ones
+            for key in tier(query, limit):
+                if key not in seen:
+                    seen.add(key)
+                    results.append(key)
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def lookup(self, query):
+        """Return the best matching product key, or None"""
+        query = normalize_name(query)
+        if not query:
+            return None
+
+        for tier in (self._exact_matches, self._prefix_matches,
+                     self._token_matches, self._substring_matches):
+            keys = tier(query, 1)
+            if keys:
+                return keys[0]
+        return None
+
+    def _build_fuzzy_index(self):
+        """Index every name token and alias by its padded bigrams"""
+        terms = sorted(set(self._tokens) | set(self.aliases))
+        postings = defaultdict(list)
+        sizes = np.empty(len(terms), dtype=np.float64)
+        for term_id, term in enumerate(terms):
+            grams = _padded_bigrams(term)
+            sizes[term_id] = len(grams)
+            for gram in grams:
+                postings[gram].append(term_id)
+
+        self._fuzzy_terms = terms
+        self._fuzzy_postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._fuzzy_sizes = sizes
+        self._fuzzy_dirty = False
+
+    def fuzzy_terms(self, word, limit=5, min_score=0.8):
+        """
+        Find vocabulary terms (name tokens and aliases) similar to a single word
+
+        Candidates are shortlisted by bigram Dice overlap from the postings, then
+        scored with difflib's similarity ratio. Words and terms shorter than
+        four characters (e.g. 'oil', 'tel', 'hai') only ever match exactly,
+        since one edit already turns them into unrelated words. A fuzzy match
+        must keep the first letter (so 'looking' is not 'cooking'), and words of
+        SHORT_WORD_LENGTH letters or fewer may differ by a single edit at most
+        ('suger' is 'sugar', 'whats' is not 'wheat').
+
+        Returns:
+            list: (term, score) pairs, best first
+        """
+        if self._fuzzy_dirty:
+            self._build_fuzzy_index()
+
+        word = normalize_name(word)
+        if len(word) < 4:
+            return []
+        grams = _padded_bigrams(word)
+        arrays = [self._fuzzy_postings[gram] for gram in grams if gram in self._fuzzy_postings]
+        if not arrays:
+            return []
+
+        overlap = np.bincount(np.concatenate(arrays), minlength=len(self._fuzzy_terms))
+        dice = 2.0 * overlap / (self._fuzzy_sizes + len(grams))
+
+        # Dice is a loose lower bound on closeness; keep a generous shortlist
+        shortlist = max(limit * 4, 16)
+        if len(dice) > shortlist:
+            candidates = np.argpartition(dice, -shortlist)[-shortlist:]
+        else:
+            candidates = np.arange(len(dice))
+        candidates = candidates[dice[candidates] >= min_score / 2]
+
+        scored = []
+        for term_id in candidates:
+            term = self._fuzzy_terms[term_id]
+            if len(term) < 4 or term[0] != word[0]:
+                continue
+            if len(word) <= SHORT_WORD_LENGTH and not _within_one_edit(word, term):
+                continue
+            score = difflib.SequenceMatcher(None, word, term).ratio()
+            if score >= min_score:
+                scored.append((term, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def _term_keys(self, term, limit=None):
+        """Product keys a vocabulary term points to (following aliases), in catalog order"""
+        if term in self.aliases:
+            return self.search(self.aliases[term], limit)
+        return list(islice(self._tokens.get(term, {}), limit))
+
+    def fuzzy_search(self, query, limit=5, min_score=0.8):
+        """
+        Find products for a possibly misspelled or Hinglish name
+
+        Each query word is matched exactly or fuzzily against name tokens and
+        aliases; a product's confidence is the mean of its best word scores.
+
+        Args:
+            query (str): Product name as typed by the user
+            limit (int): Maximum number of products to return
+            min_score (float): Minimum confidence between 0 and 1
+
+        Returns:
+            list: (key, confidence) pairs, best first
+        """
+        words = TOKEN_PATTERN.findall(normalize_name(query))
+        if not words:
+            return []
+
+        # With a single word every product's score comes from one term, so each
+        # term's first `limit` keys are enough; multi-word queries need them all
+        term_limit = limit if len(words) == 1 else None
+
+        scores = defaultdict(float)
+        for word in words:
+            if word in self.aliases or word in self._tokens:
+                matches = [(word, 1.0)]
+            else:
+                matches = self.fuzzy_terms(word, limit=3, min_score=min_score)
+
+            best = {}
+            for term, score in matches:
+                for key in self._term_keys(term, term_limit):
+                    best[key] = max(best.get(key, 0.0), score)
+            for key, score in best.items():
+                scores[key] += score / len(words)
+
+        ranked = sorted(
+            ((key, score) for key, score in scores.items() if score >= min_score),
+            key=lambda item: (-item[1], self._order[item[0]])
+        )
+        return ranked[:limit]
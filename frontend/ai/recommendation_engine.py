@@ -1,16 +1,46 @@
-import pandas as pd
-import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from collections import defaultdict
-import json
+import os
+from .product_index import ProductNameIndex
+from .similarity_index import RandomProjectionLSH, TopKNeighbors
+from .interaction_matrix import CustomerProductMatrix
+from .basket_model import CoOccurrenceModel
+from .popularity import PopularityTracker
+
+# Rebuild the neighbor index (refitting TF-IDF) once this share of the catalog was patched in
+NEIGHBOR_REBUILD_SHARE = 0.1
+
+# Similar customers whose orders feed collaborative recommendations
+COLLABORATIVE_NEIGHBORS = 3
 
 class RecommendationEngine:
-    def __init__(self, inventory_manager, order_manager):
+    def __init__(self, inventory_manager, order_manager, product_index=None, similarity_mode=None,
+                 order_lines=None):
         self.inventory_manager = inventory_manager
         self.order_manager = order_manager
-        self.product_similarity_matrix = None
+        # Similar-product index, built on first use: 'exact' keeps the top k
+        # per product, 'lsh' answers approximately from random-projection buckets
+        self.similarity_mode = similarity_mode or os.getenv('RECOMMENDATION_SIMILARITY', 'exact')
+        if self.similarity_mode not in ('exact', 'lsh'):
+            raise ValueError(f"Unknown similarity mode {self.similarity_mode!r}; expected 'exact' or 'lsh'")
+        self.neighbor_index = None
+        self.neighbors_k = int(os.getenv('RECOMMENDATION_NEIGHBORS', 20))
         self.product_ids = None
+        self._product_rows = {}
+        self._tfidf = None
+        self._indexed_at_build = 0
+        
+        if product_index is None:
+            product_index = ProductNameIndex.from_inventory(inventory_manager)
+        self.product_index = product_index
+        
+        inventory_manager.add_listener(self._add_to_neighbor_index)
+        
+        # Customer × item purchases, kept current by add_order
+        self.interactions = CustomerProductMatrix.from_order_manager(order_manager)
+        # Items ordered together, kept current by add_order
+        self.basket_model = CoOccurrenceModel.from_order_manager(order_manager, order_lines)
+        # Order counts and decayed trending scores, kept current by add_order
+        self.popularity = PopularityTracker.from_order_manager(order_manager)
         
     def _prepare_product_features(self):
         """Prepare product features for content-based filtering"""
@@ -22,185 +52,133 @@ class RecommendationEngine:
         return inventory_df
     
     def _compute_product_similarities(self):
-        """Compute similarity matrix between products based on features"""
+        """Index the most similar products of every product based on features"""
         inventory_df = self._prepare_product_features()
         
         # Use TF-IDF to vectorize product features
         tfidf = TfidfVectorizer(stop_words='english')
         tfidf_matrix = tfidf.fit_transform(inventory_df['features'])
         
-        # Compute cosine similarity
-        similarity_matrix = cosine_similarity(tfidf_matrix)
-        
-        self.product_similarity_matrix = similarity_matrix
+        # Cosine similarity, computed in blocks and reduced to the top k per product,
+        # or hashed into LSH buckets and computed per query among bucket mates
+        if self.similarity_mode == 'lsh':
+            self.neighbor_index = RandomProjectionLSH().build(tfidf_matrix)
+        else:
+            self.neighbor_index = TopKNeighbors(self.neighbors_k).build(tfidf_matrix)
         self.product_ids = inventory_df['ID'].tolist()
+        self._product_rows = {product_id: row for row, product_id in enumerate(self.product_ids)}
+        self._tfidf = tfidf
+        self._indexed_at_build = len(self.product_ids)
         
-        return similarity_matrix
+        return self.neighbor_index
+    
+    def _add_to_neighbor_index(self, product):
+        """Patch a new product into the neighbor index, or drop the index if much of it is patched"""
+        if self.neighbor_index is None:
+            return
+        
+        if len(self.product_ids) + 1 - self._indexed_at_build > self._indexed_at_build * NEIGHBOR_REBUILD_SHARE:
+            # The TF-IDF vocabulary and weights have drifted; rebuild on next use
+            self.neighbor_index = None
+            return
+        
+        # Words the vectorizer has not seen are ignored until the next rebuild
+        features = self._tfidf.transform([f"{product['Category']} {product['Description']}"])
+        row = self.neighbor_index.add(features)[0]
+        self.product_ids.append(product['ID'])
+        self._product_rows[product['ID']] = row
     
     def get_content_based_recommendations(self, product_id, top_n=5):
-        """Get content-based recommendations for a product"""
-        if self.product_similarity_matrix is None:
+        """Get content-based recommendations for a product, most similar first"""
+        if self.neighbor_index is None:
             self._compute_product_similarities()
         
         # Find the index of the product
-        try:
-            idx = self.product_ids.index(product_id)
-        except ValueError:
+        row = self._product_rows.get(product_id)
+        if row is None:
             return []
         
-        # Get similarity scores for this product
-        sim_scores = list(enumerate(self.product_similarity_matrix[idx]))
-        
-        # Sort products based on similarity scores
-        sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-        
-        # Get top N similar products (excluding the product itself)
-        sim_scores = sim_scores[1:top_n+1]
-        
-        # Get product indices
-        product_indices = [i[0] for i in sim_scores]
-        
-        # Get product IDs
-        recommended_ids = [self.product_ids[i] for i in product_indices]
+        # Stored neighbors, excluding the product itself
+        recommended_ids = [self.product_ids[neighbor] for neighbor, _ in self.neighbor_index.query(row, top_n)]
         
         # Get product details
-        inventory_df = self.inventory_manager.get_inventory_df()
-        recommendations = inventory_df[inventory_df['ID'].isin(recommended_ids)].to_dict('records')
-        
-        return recommendations
+        recommendations = [self.inventory_manager.get_product(i) for i in recommended_ids]
+        return [product for product in recommendations if product is not None]
     
     def get_collaborative_recommendations(self, customer_name, top_n=5):
         """Get collaborative filtering recommendations based on similar customers"""
-        orders_df = self.order_manager.get_orders_df()
-        
-        # Create a customer-product matrix
-        # First, we need to parse the items in each order
-        customer_product_data = []
-        
-        for _, order in orders_df.iterrows():
-            # Parse items string (simplified parsing)
-            items = order['Items']
-            # In a real implementation, you would parse this more robustly
-            # For now, we'll just use the items as a string
-            customer_product_data.append({
-                'Customer': order['Customer'],
-                'Items': items
-            })
-        
-        # For collaborative filtering, we'll use a simple approach:
-        # Find customers with similar order patterns
-        
-        # Get the target customer's orders
-        target_customer_orders = orders_df[orders_df['Customer'] == customer_name]
-        
-        if target_customer_orders.empty:
+        if customer_name not in self.interactions.customers:
             # If no history, return popular items
             return self.get_popular_products(top_n)
         
-        # Find other customers
-        other_customers = orders_df[orders_df['Customer'] != customer_name]['Customer'].unique()
-        
-        # Simple similarity based on item overlap
-        similarities = []
-        
-        target_items = set()
-        for _, order in target_customer_orders.iterrows():
-            # Parse items (simplified)
-            items = order['Items']
-            target_items.update(items.split(','))
-        
-        for customer in other_customers:
-            customer_orders = orders_df[orders_df['Customer'] == customer]
-            customer_items = set()
-            
-            for _, order in customer_orders.iterrows():
-                items = order['Items']
-                customer_items.update(items.split(','))
-            
-            # Calculate Jaccard similarity
-            intersection = len(target_items.intersection(customer_items))
-            union = len(target_items.union(customer_items))
-            
-            if union > 0:
-                similarity = intersection / union
-                similarities.append((customer, similarity))
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Get products from similar customers that the target customer hasn't bought
-        recommended_products = []
-        inventory_df = self.inventory_manager.get_inventory_df()
+        # Products the customer already ordered, however the item was spelled
+        bought_ids = {self.product_index.lookup(item) for item in self.interactions.bought(customer_name)}
         
-        for customer, similarity in similarities[:3]:  # Top 3 similar customers
-            customer_orders = orders_df[orders_df['Customer'] == customer]
-            
-            for _, order in customer_orders.iterrows():
-                items = order['Items']
-                # Parse and recommend items (simplified)
-                item_names = [item.split(' (')[0] for item in items.split(', ')]
-                
-                for item_name in item_names:
-                    # Find product in inventory
-                    product = inventory_df[inventory_df['Name'].str.contains(item_name, case=False, na=False)]
-                    if not product.empty:
-                        product_record = product.iloc[0].to_dict()
-                        # Check if target customer already bought this
-                        already_bought = False
-                        for _, target_order in target_customer_orders.iterrows():
-                            if item_name in target_order['Items']:
-                                already_bought = True
-                                break
-                        
-                        if not already_bought and product_record not in recommended_products:
-                            recommended_products.append(product_record)
-                            
-                            if len(recommended_products) >= top_n:
-                                break
-                
-                if len(recommended_products) >= top_n:
-                    break
-            
+        # Items of the most similar customers (Jaccard over item sets), best first;
+        # extra candidates cover items that are not in the catalog or already bought
+        recommended_products = []
+        for item_name, _ in self.interactions.recommend(customer_name, top_n * 3 + len(bought_ids),
+                                                         COLLABORATIVE_NEIGHBORS):
+            product_id = self.product_index.lookup(item_name)
+            if product_id is None or product_id in bought_ids:
+                continue
+            bought_ids.add(product_id)
+            recommended_products.append(self.inventory_manager.get_product(product_id))
             if len(recommended_products) >= top_n:
                 break
         
-        return recommended_products[:top_n]
+        if not recommended_products:
+            # No customer shares an item with this one
+            return self.get_popular_products(top_n)
+        return recommended_products
     
-    def get_popular_products(self, top_n=5):
-        """Get popular products based on order frequency"""
-        orders_df = self.order_manager.get_orders_df()
-        inventory_df = self.inventory_manager.get_inventory_df()
-        
-        # Count product occurrences
-        product_counts = defaultdict(int)
-        
-        for _, order in orders_df.iterrows():
-            items = order['Items']
-            # Parse items (simplified)
-            item_names = [item.split(' (')[0] for item in items.split(', ')]
-            
-            for item_name in item_names:
-                product_counts[item_name] += 1
+    def get_frequently_bought_together(self, product_id, top_n=5):
+        """Get products most often ordered together with a product, highest lift first"""
+        product = self.inventory_manager.get_product(product_id)
+        if product is None:
+            return []
         
-        # Sort by count
-        sorted_products = sorted(product_counts.items(), key=lambda x: x[1], reverse=True)
+        recommendations = []
+        seen = {product_id}
+        # Extra candidates cover items that are not in the catalog
+        for pair in self.basket_model.frequently_bought_with(product['Name'], top_n * 2):
+            partner_id = self.product_index.lookup(pair['item'])
+            if partner_id is None or partner_id in seen:
+                continue
+            seen.add(partner_id)
+            partner = self.inventory_manager.get_product(partner_id)
+            partner['confidence'] = pair['confidence']
+            partner['lift'] = pair['lift']
+            recommendations.append(partner)
+            if len(recommendations) >= top_n:
+                break
         
-        # Get product details
-        popular_products = []
-        for product_name, count in sorted_products[:top_n]:
-            product = inventory_df[inventory_df['Name'].str.contains(product_name, case=False, na=False)]
-            if not product.empty:
-                product_record = product.iloc[0].to_dict()
-                product_record['order_count'] = count
-                popular_products.append(product_record)
-        
-        return popular_products
+        return recommendations
+    
+    def _ranked_products(self, ranked_items, top_n, score_key):
+        """Catalog records for ranked (item name, score) pairs, skipping unknown and repeated products"""
+        products = []
+        seen = set()
+        for item_name, score in ranked_items:
+            product_id = self.product_index.lookup(item_name)
+            if product_id is None or product_id in seen:
+                continue
+            seen.add(product_id)
+            product_record = self.inventory_manager.get_product(product_id)
+            product_record[score_key] = score
+            products.append(product_record)
+            if len(products) >= top_n:
+                break
+        return products
+    
+    def get_popular_products(self, top_n=5):
+        """Get popular products based on order frequency"""
+        # Running per-item order counts; extra candidates cover items not in the catalog
+        return self._ranked_products(self.popularity.top_popular(top_n * 2), top_n, 'order_count')
     
     def get_trending_products(self, days=30, top_n=5):
-        """Get trending products based on recent orders"""
-        # In a real implementation with a proper database, we would filter by date
-        # For now, we'll return popular products as a proxy
-        return self.get_popular_products(top_n)
+        """Get trending products: order counts decayed exponentially over `days`"""
+        return self._ranked_products(self.popularity.top_trending(days, top_n * 2), top_n, 'trend_score')
 
 if __name__ == "__main__":
     # This is just for testing
@@ -0,0 +1,253 @@
+import os
+import numpy as np
+from scipy import sparse
+
+
+class TopKNeighbors:
+    """
+    The k most similar rows of every row of an L2-normalized sparse matrix
+    (cosine similarity, e.g. TF-IDF vectors), kept as two N×k arrays.
+
+    Similarities are computed a block of rows at a time, so the full N×N
+    matrix never exists; a block holds at most max_block_cells scores.
+    Rows added later are patched in: they get their own neighbors, and
+    existing rows take them in where they beat their current k-th neighbor.
+    Only positive similarities are kept; missing neighbors are -1.
+    """
+
+    def __init__(self, k=20, max_block_cells=None):
+        self.k = k
+        self.max_block_cells = int(max_block_cells or os.getenv('SIMILARITY_BLOCK_CELLS', 4000000))
+        self.vectors = None
+        self.neighbors = np.full((0, k), -1, dtype=np.int64)
+        self.scores = np.zeros((0, k))
+
+    def __len__(self):
+        return len(self.neighbors)
+
+    def _block_rows(self, n_columns):
+        return max(1, self.max_block_cells // max(n_columns, 1))
+
+    def _select(self, scores, indices, k):
+        """
+        Best k candidates per row, highest score first (ties by lower index)
+
+        Args:
+            scores (np.ndarray): Candidate scores with shape (rows, candidates)
+            indices (np.ndarray): Row number of each candidate, same shape
+
+        Returns:
+            tuple: (indices, scores) with shape (rows, k), -1 and 0 where fewer than k are positive
+        """
+        width = min(k, scores.shape[1])
+        if scores.shape[1] > width:
+            part = np.argpartition(-scores, width - 1, axis=1)[:, :width]
+            scores = np.take_along_axis(scores, part, axis=1)
+            indices = np.take_along_axis(indices, part, axis=1)
+        order = np.lexsort((indices, -scores), axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+        indices = np.where(scores > 0, np.take_along_axis(indices, order, axis=1), -1)
+        scores = np.where(scores > 0, scores, 0.0)
+
+        if width < k:
+            indices = np.pad(indices, ((0, 0), (0, k - width)), constant_values=-1)
+            scores = np.pad(scores, ((0, 0), (0, k - width)))
+        return indices, scores
+
+    def _rows_against_all(self, rows, k):
+        """Top-k neighbors of the given rows among all rows, excluding themselves"""
+        n = self.vectors.shape[0]
+        similarities = (self.vectors[rows] @ self.vectors.T).toarray()
+        similarities[np.arange(len(rows)), rows] = 0.0
+        return self._select(similarities, np.broadcast_to(np.arange(n), similarities.shape), k)
+
+    def build(self, vectors):
+        """
+        Index every row of a sparse matrix
+
+        Args:
+            vectors: L2-normalized rows, e.g. TfidfVectorizer output
+
+        Returns:
+            TopKNeighbors: self
+        """
+        self.vectors = sparse.csr_matrix(vectors)
+        n = self.vectors.shape[0]
+        neighbors, scores = [], []
+        step = self._block_rows(n)
+        for start in range(0, n, step):
+            block_neighbors, block_scores = self._rows_against_all(np.arange(start, min(start + step, n)), self.k)
+            neighbors.append(block_neighbors)
+            scores.append(block_scores)
+
+        self.neighbors = np.vstack(neighbors) if neighbors else np.full((0, self.k), -1, dtype=np.int64)
+        self.scores = np.vstack(scores) if scores else np.zeros((0, self.k))
+        return self
+
+    def add(self, vectors):
+        """
+        Append rows and patch the neighbor lists
+
+        Args:
+            vectors: L2-normalized rows in the same feature space as the index
+
+        Returns:
+            range: Row numbers of the added rows
+        """
+        new = sparse.csr_matrix(vectors)
+        old_n = len(self)
+        self.vectors = new if self.vectors is None else sparse.vstack([self.vectors, new]).tocsr()
+        n = self.vectors.shape[0]
+        added = np.arange(old_n, n)
+
+        # Existing rows: merge the new rows into their current top k
+        step = self._block_rows(len(added) + self.k)
+        for start in range(0, old_n, step):
+            rows = slice(start, min(start + step, old_n))
+            similarities = (self.vectors[rows] @ new.T).toarray()
+            candidates = np.hstack([self.scores[rows], similarities])
+            indices = np.hstack([self.neighbors[rows], np.broadcast_to(added, similarities.shape)])
+            self.neighbors[rows], self.scores[rows] = self._select(candidates, indices, self.k)
+
+        # New rows: full search against everything
+        neighbors, scores = [self.neighbors], [self.scores]
+        step = self._block_rows(n)
+        for start in range(0, len(added), step):
+            block_neighbors, block_scores = self._rows_against_all(added[start:start + step], self.k)
+            neighbors.append(block_neighbors)
+            scores.append(block_scores)
+        self.neighbors = np.vstack(neighbors)
+        self.scores = np.vstack(scores)
+        return range(old_n, n)
+
+    def query(self, row, top_n=None):
+        """
+        Most similar rows to one row
+
+        Returns:
+            list: (row, similarity) pairs, most similar first
+        """
+        top_n = self.k if top_n is None else top_n
+        if top_n <= self.k:
+            neighbors, scores = self.neighbors[row, :top_n], self.scores[row, :top_n]
+        else:
+            # More than the stored k: search this one row exactly
+            neighbors, scores = self._rows_against_all(np.array([row]), top_n)
+            neighbors, scores = neighbors[0], scores[0]
+        return [(int(i), float(s)) for i, s in zip(neighbors, scores) if i >= 0]
+
+
+class RandomProjectionLSH:
+    """
+    Approximate nearest neighbors by random-projection (SimHash) LSH.
+
+    Each of n_tables hash tables signs n_bits random projections of a vector;
+    rows that agree on every bit of a table share its bucket. A query is
+    rescored exactly, but only against the rows sharing at least one of its
+    buckets, so its cost depends on bucket sizes rather than catalog size.
+    More tables raise recall and latency; each extra bit halves bucket sizes,
+    lowering both. Unless n_bits is set, it is derived from the catalog size
+    as log2(rows / bucket_size), so a query scans about n_tables * bucket_size
+    candidates however large the catalog grows; the index is rehashed with
+    more bits when added rows call for them.
+    Has the same build/add/query interface as TopKNeighbors.
+    """
+
+    def __init__(self, n_tables=None, n_bits=None, seed=0, max_block_cells=None, bucket_size=None):
+        self.n_tables = int(n_tables or os.getenv('LSH_TABLES', 32))
+        n_bits = n_bits or os.getenv('LSH_BITS')
+        self.auto_bits = not n_bits
+        self.n_bits = int(n_bits) if n_bits else 1
+        self.bucket_size = int(bucket_size or os.getenv('LSH_BUCKET_SIZE', 32))
+        self.seed = seed
+        self.max_block_cells = int(max_block_cells or os.getenv('SIMILARITY_BLOCK_CELLS', 4000000))
+        self.vectors = None
+        self.projections = None
+        self.codes = np.zeros((0, self.n_tables), dtype=np.int64)
+        self.buckets = [{} for _ in range(self.n_tables)]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _bits_for(self, n_rows):
+        """Bits that split n_rows into buckets of about bucket_size rows"""
+        return max(1, int(round(np.log2(max(n_rows, 1) / self.bucket_size))))
+
+    def _hash(self, vectors):
+        """Bucket code of each row in each table, with shape (rows, n_tables)"""
+        powers = 1 << np.arange(self.n_bits, dtype=np.int64)
+        codes = []
+        step = max(1, self.max_block_cells // (self.n_tables * self.n_bits))
+        for start in range(0, vectors.shape[0], step):
+            signs = np.asarray(vectors[start:start + step] @ self.projections) > 0
+            codes.append(signs.reshape(-1, self.n_tables, self.n_bits) @ powers)
+        return np.vstack(codes) if codes else np.zeros((0, self.n_tables), dtype=np.int64)
+
+    def _add_to_buckets(self, codes, offset):
+        for table, buckets in enumerate(self.buckets):
+            order = np.argsort(codes[:, table], kind='stable')
+            keys, starts = np.unique(codes[order, table], return_index=True)
+            for key, rows in zip(keys.tolist(), np.split(order + offset, starts[1:])):
+                existing = buckets.get(key)
+                buckets[key] = rows if existing is None else np.concatenate([existing, rows])
+
+    def build(self, vectors):
+        """
+        Hash every row of a sparse matrix
+
+        Returns:
+            RandomProjectionLSH: self
+        """
+        self.vectors = sparse.csr_matrix(vectors)
+        if self.auto_bits:
+            self.n_bits = self._bits_for(self.vectors.shape[0])
+        rng = np.random.default_rng(self.seed)
+        self.projections = rng.standard_normal((self.vectors.shape[1], self.n_tables * self.n_bits))
+        self.buckets = [{} for _ in range(self.n_tables)]
+        self.codes = self._hash(self.vectors)
+        self._add_to_buckets(self.codes, 0)
+        return self
+
+    def add(self, vectors):
+        """
+        Append rows (in the feature space the index was built on) to their buckets
+
+        Returns:
+            range: Row numbers of the added rows
+        """
+        new = sparse.csr_matrix(vectors)
+        old_n = len(self)
+        self.vectors = sparse.vstack([self.vectors, new]).tocsr()
+        if self.auto_bits and self._bits_for(self.vectors.shape[0]) > self.n_bits:
+            # Buckets have outgrown bucket_size: rehash everything with more bits
+            self.build(self.vectors)
+            return range(old_n, len(self))
+        codes = self._hash(new)
+        self.codes = np.vstack([self.codes, codes])
+        self._add_to_buckets(codes, old_n)
+        return range(old_n, len(self))
+
+    def candidates(self, row):
+        """Rows sharing at least one bucket with the row, itself excluded"""
+        rows = np.unique(np.concatenate([self.buckets[table][code]
+                                         for table, code in enumerate(self.codes[row].tolist())]))
+        return rows[rows != row]
+
+    def query(self, row, top_n=20):
+        """
+        Approximately most similar rows to one row
+
+        Returns:
+            list: (row, similarity) pairs, most similar first
+        """
+        candidates = self.candidates(row)
+        if len(candidates) == 0:
+            return []
+        scores = (self.vectors[candidates] @ self.vectors[row].T).toarray().ravel()
+        keep = scores > 0
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > top_n:
+            best = np.argpartition(-scores, top_n - 1)[:top_n]
+            candidates, scores = candidates[best], scores[best]
+        order = np.lexsort((candidates, -scores))
+        return [(int(candidates[i]), float(scores[i])) for i in order]
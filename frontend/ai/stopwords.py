@@ -0,0 +1,37 @@
+# English stopword list bundled from the NLTK stopwords corpus so the chat
+# service never has to download corpora at startup.
+ENGLISH_STOP_WORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your
+yours yourself yourselves he him his himself she she's her hers herself it
+it's its itself they them their theirs themselves what which who whom this
+that that'll these those am is are was were be been being have has had
+having do does did doing a an the and but if or because as until while of
+at by for with about against between into through during before after
+above below to from up down in out on off over under again further then
+once here there when where why how all any both each few more most other
+some such no nor not only own same so than too very s t can will just don
+don't should should've now d ll m o re ve y ain aren aren't couldn couldn't
+didn didn't doesn doesn't hadn hadn't hasn hasn't haven haven't isn isn't
+ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn
+shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+""".split())
+
+# Everyday English words from shop chat that are never product names. The
+# fuzzy product matcher skips them, since several are one or two edits away
+# from catalog words (looking/cooking, price/rice, whats/wheat).
+COMMON_CHAT_WORDS = frozenset("""
+able about add added also amount another anything ask available back bag
+bags bill book booked booking bottle bottles bought box boxes bring buy
+call cancel cart cash cheap check cheaper cost costs could customer
+customers daily day days deliver delivered delivery dozen each else even
+every extra fast find fine get give given go going good got great help
+hello hey hi item items keep kilo kilos know last later let like list
+little look looked looking lot make many market may maybe might money
+month monthly morning much need needed needs new next night number offer
+okay ok one order ordered orders packet packets pay payment per place
+please price prices quick quickly rate rates ready really receive
+received remaining request right same say see sell selling send sent
+shop show small sold soon start still stock store supplier suppliers
+sure take thank thanks thing things think today tomorrow total track
+two want wanted week weekly well whats what's would year yes yesterday
+""".split())
@@ -210,7 +210,7 @@ def show_ai_insights():
     
     # Product Recommendations
     st.subheader("Product Recommendations")
-    trending_tab, seasonal_tab = st.tabs(["Trending Products", "Seasonal Trends"])
+    trending_tab, seasonal_tab, basket_tab = st.tabs(["Trending Products", "Seasonal Trends", "Bought Together"])
     
     with trending_tab:
         trending_products = ai_insights['trending_products']
@@ -230,7 +230,8 @@ def show_ai_insights():
                     seasonal_data.append({
                         'Product': product,
                         'Peak Month': data['peak_month'],
-                        'Low Month': data['low_month']
+                        'Low Month': data['low_month'],
+                        'Peak Index': round(data['seasonality_index'][data['peak_month']], 2)
                     })
             
             if seasonal_data:
@@ -241,6 +242,19 @@ def show_ai_insights():
         else:
             st.info("No seasonal trend data available.")
     
+    with basket_tab:
+        product_names = st.session_state.inventory_manager.get_inventory_df()['Name'].tolist()
+        selected_product = st.selectbox("Product", product_names, key="bought_together_product")
+        bought_together = st.session_state.ai_service.get_frequently_bought_together(selected_product)
+        if bought_together:
+            basket_df = pd.DataFrame(bought_together)
+            basket_df['confidence'] = basket_df['confidence'].round(2)
+            basket_df['lift'] = basket_df['lift'].round(2)
+            st.dataframe(basket_df[['Name', 'Category', 'confidence', 'lift']],
+                        use_container_width=True, hide_index=True)
+        else:
+            st.info(f"Not enough orders yet to tell what is bought with {selected_product}.")
+    
     # Inventory Recommendations
     st.subheader("Inventory Recommendations")
     inventory_recs = ai_insights['inventory_recommendations']
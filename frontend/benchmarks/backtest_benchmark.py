@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Forecast backtest benchmark on synthetic stores of increasing size
+
+Runs a rolling-origin backtest of every forecasting mode and prints
+accuracy (MAE, MAPE, bias) next to fit/predict time and peak memory.
+"""
+
+import os
+import sys
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.backtest import DEFAULT_MODES, ForecastBacktester
+from forecast_benchmark import build_store
+
+# The per-product sklearn pipeline is only timed on small catalogs
+SKLEARN_MAX_PRODUCTS = 500
+
+
+def main(sizes=(100, 500, 2000), horizon=7, n_origins=4):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Forecast Backtest Benchmark")
+    print("=" * 96)
+    print(f"{'SKUs':>6} {'mode':<20}{'MAE':>8}{'MAPE %':>9}{'bias':>8}"
+          f"{'fit s':>10}{'predict s':>11}{'peak MB':>10}")
+
+    for size in sizes:
+        inventory, orders, names = build_store(size)
+        backtester = ForecastBacktester(orders, inventory, horizon=horizon, n_origins=n_origins)
+
+        modes = dict(DEFAULT_MODES)
+        if size <= SKLEARN_MAX_PRODUCTS:
+            modes['polynomial (sklearn)'] = {'backend': 'polynomial', 'batch_training': False}
+
+        for result in backtester.run(modes, names):
+            print(f"{size:>6} {result['mode']:<20}{result['mae']:>8.2f}{result['mape']:>9.1f}{result['bias']:>8.2f}"
+                  f"{result['fit_s']:>10.3f}{result['predict_s']:>11.3f}{result['peak_mb']:>10.1f}")
+        print("-" * 96)
+
+    print(f"Rolling origin: {n_origins} origins, {horizon}-day horizon; MAPE over days with demand")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    main()
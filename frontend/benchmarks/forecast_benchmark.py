@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Demand forecasting benchmark on a synthetic store
+
+Trains DemandForecaster models for every SKU one product at a time (sklearn
+pipeline per product) and in batch mode (one vectorized solve), and checks
+that both produce the same forecasts. Tiny differences remain where
+LinearRegression keeps a rounding-noise singular value that the batch
+solver treats as zero.
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.inventory import InventoryManager
+from models.orders import OrderManager
+from ai.demand_forecasting import DemandForecaster
+
+UNITS = ["kg", "L", " pack", ""]
+
+
+def build_store(n_products, days=120, orders_per_day=40, seed=11):
+    """Create inventory and order managers with synthetic history"""
+    rng = random.Random(seed)
+    inventory = InventoryManager()
+    names = [f"Product {i:05d}" for i in range(n_products)]
+    for name in names:
+        inventory.add_product(name, "Grocery", 50, 100, "Supplier", "")
+
+    orders = OrderManager()
+    # History runs up to today, after OrderManager's sample orders
+    start = datetime.now() - timedelta(days=days)
+    for day in range(days):
+        date = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        for _ in range(orders_per_day):
+            items = ", ".join(f"{rng.choice(names)} ({rng.randint(1, 9)}{rng.choice(UNITS)})"
+                              for _ in range(rng.randint(1, 4)))
+            orders.orders_data.append({
+                "Order ID": f"SYN{len(orders.orders_data):07d}",
+                "Customer": f"Store {rng.randint(1, 200)}",
+                "Items": items,
+                "Total (₹)": 0.0,
+                "Status": "Delivered",
+                "Order Date": date,
+                "Delivery Date": date
+            })
+    return inventory, orders, names
+
+
+def main(sizes=(100, 500, 2000), days_ahead=7):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Demand Forecasting Benchmark")
+    print("=" * 72)
+    print(f"{'SKUs':>8}{'per-product s':>16}{'batch s':>12}{'speedup':>10}{'max rel diff':>14}")
+
+    for size in sizes:
+        inventory, orders, names = build_store(size)
+
+        sequential = DemandForecaster(orders, inventory, batch_training=False)
+        started = time.perf_counter()
+        expected = {name: sequential.forecast_demand(name, days_ahead) for name in names}
+        sequential_s = time.perf_counter() - started
+
+        batch = DemandForecaster(orders, inventory, batch_training=True)
+        started = time.perf_counter()
+        actual = batch.forecast_all(names, days_ahead)
+        batch_s = time.perf_counter() - started
+
+        # Relative to the forecast size (at least one unit)
+        max_diff = max(np.max(np.abs(np.array(expected[name]) - np.array(actual[name]))
+                              / np.maximum(np.abs(expected[name]), 1)) for name in names)
+        print(f"{size:>8}{sequential_s:>16.2f}{batch_s:>12.3f}{sequential_s / batch_s:>9.0f}x{max_diff:>14.2e}")
+
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Fuzzy product lookup benchmark on a synthetic catalog
+
+Builds a ProductNameIndex over generated SKU names and times fuzzy_search
+for misspelled and Hinglish queries.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.product_index import DEFAULT_PRODUCT_ALIASES, ProductNameIndex
+
+BRANDS = ["aashirvaad", "fortune", "tata", "saffola", "patanjali", "india gate", "daawat",
+          "everest", "mdh", "catch", "amul", "britannia", "parle", "haldiram", "dhara"]
+PRODUCTS = ["wheat flour", "basmati rice", "sona masoori rice", "sugar", "sunflower oil",
+            "mustard oil", "tea", "coffee", "salt", "turmeric powder", "chilli powder",
+            "toor dal", "moong dal", "chana dal", "poha", "besan", "ghee", "biscuits", "namkeen"]
+SIZES = ["100g", "250g", "500g", "1kg", "2kg", "5kg", "10kg", "500ml", "1l", "5l"]
+
+QUERIES = ["aata", "chawal", "suger", "basmti", "sunflwer", "musterd", "turmerik", "biscuts",
+           "cheeni", "haldirams", "corfee", "namkin"]
+
+
+def build_catalog(size, seed=7):
+    rng = random.Random(seed)
+    names = []
+    for i in range(size):
+        # A numeric variant code keeps names distinct at large sizes
+        names.append(f"{rng.choice(BRANDS)} {rng.choice(PRODUCTS)} {rng.choice(SIZES)} v{i % 997}")
+    return names
+
+
+def main(sizes=(1000, 10000, 50000), rounds=200):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Fuzzy Product Lookup Benchmark")
+    print("=" * 64)
+    print(f"{'SKUs':>8}{'build ms':>12}{'mean us':>12}{'p95 us':>12}{'hit rate':>12}")
+
+    for size in sizes:
+        names = build_catalog(size)
+        started = time.perf_counter()
+        index = ProductNameIndex(enumerate(names), DEFAULT_PRODUCT_ALIASES)
+        index.fuzzy_search("warmup")
+        build_ms = (time.perf_counter() - started) * 1000
+
+        timings = []
+        hits = 0
+        for i in range(rounds):
+            query = QUERIES[i % len(QUERIES)]
+            started = time.perf_counter()
+            results = index.fuzzy_search(query, limit=5)
+            timings.append((time.perf_counter() - started) * 1e6)
+            hits += bool(results)
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{size:>8}{build_ms:>12.1f}{statistics.mean(timings):>12.1f}{p95:>12.1f}{hits / rounds:>12.0%}")
+
+    print("-" * 64)
+    index_names = dict(enumerate(names))
+    for query in QUERIES[:4]:
+        top = index.fuzzy_search(query, limit=1)
+        label = f"{index_names[top[0][0]]} ({top[0][1]:.2f})" if top else "-"
+        print(f"{query:<12} -> {label}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
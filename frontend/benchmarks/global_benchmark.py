@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Global (pooled) forecasting model benchmark
+
+Builds stores whose categories differ in popularity and order size, with a
+share of new SKUs that are only ordered after the forecast origin. Compares
+the per-product polynomial models with the global model on fit time and on
+backtest error, separately for established and cold-start SKUs.
+"""
+
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.inventory import InventoryManager
+from models.orders import OrderManager
+from ai.backtest import ForecastBacktester
+
+# The per-product sklearn pipeline is only timed on small catalogs
+SKLEARN_MAX_PRODUCTS = 500
+
+MODES = {
+    'polynomial (sklearn)': {'backend': 'polynomial', 'batch_training': False},
+    'polynomial': {'backend': 'polynomial'},
+    'global': {'backend': 'global'}
+}
+
+
+def build_category_store(n_products, n_categories=10, days=120, orders_per_day=40, cold_share=0.1,
+                         horizon=7, seed=3):
+    """Synthetic store; returns (inventory, orders, established names, cold-start names)"""
+    rng = random.Random(seed)
+    inventory = InventoryManager()
+    names = [f"Product {i:05d}" for i in range(n_products)]
+    category = {name: i % n_categories for i, name in enumerate(names)}
+    for name in names:
+        inventory.add_product(name, f"Category {category[name]}", 50, 100, "Supplier", "")
+
+    n_cold = int(n_products * cold_share)
+    cold, warm = names[:n_cold], names[n_cold:]
+    # Higher categories sell more often and in bigger packs
+    weights = [1 + category[name] for name in names]
+
+    orders = OrderManager()
+    start = datetime.now() - timedelta(days=days)
+    for day in range(days):
+        date = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        # Cold-start SKUs only appear in the last horizon
+        candidates = names if day >= days - horizon else warm
+        candidate_weights = weights if day >= days - horizon else weights[n_cold:]
+        for _ in range(orders_per_day):
+            chosen = rng.choices(candidates, candidate_weights, k=rng.randint(1, 4))
+            items = ", ".join(f"{name} ({rng.randint(1, 3 + category[name])}kg)" for name in chosen)
+            orders.orders_data.append({
+                "Order ID": f"SYN{len(orders.orders_data):07d}",
+                "Customer": f"Store {rng.randint(1, 200)}",
+                "Items": items,
+                "Total (₹)": 0.0,
+                "Status": "Delivered",
+                "Order Date": date,
+                "Delivery Date": date
+            })
+    return inventory, orders, warm, cold
+
+
+def main(sizes=(100, 500, 2000), horizon=7):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Global Forecast Model Benchmark")
+    print("=" * 80)
+    print(f"{'SKUs':>6} {'mode':<22}{'fit s':>9}{'predict s':>11}{'MAE':>9}{'cold MAE':>10}{'cold bias':>11}")
+
+    for size in sizes:
+        inventory, orders, warm, cold = build_category_store(size, horizon=horizon)
+        # One origin, just before the cold-start SKUs' first orders
+        backtester = ForecastBacktester(orders, inventory, horizon=horizon, n_origins=1)
+
+        for label, kwargs in MODES.items():
+            if kwargs.get('batch_training') is False and size > SKLEARN_MAX_PRODUCTS:
+                continue
+            established = backtester.evaluate(label, warm, measure_memory=False, **kwargs)
+            new = backtester.evaluate(label, cold, measure_memory=False, **kwargs)
+            print(f"{size:>6} {label:<22}{established['fit_s']:>9.3f}{established['predict_s']:>11.3f}"
+                  f"{established['mae']:>9.2f}{new['mae']:>10.2f}{new['bias']:>11.2f}")
+        print("-" * 80)
+
+    print(f"{horizon}-day horizon; cold-start SKUs have no orders before the origin")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
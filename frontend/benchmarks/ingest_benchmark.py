@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Order history ingestion benchmark
+
+Writes synthetic order histories to CSV and loads them two ways: reading
+every order into an OrderLinesTable (the in-memory path), and streaming
+the file in chunks straight to daily demand. Prints time and peak memory.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.history_import import import_order_history
+from ai.order_lines import OrderLinesTable
+from forecast_benchmark import UNITS
+
+# Orders generated and written per CSV chunk
+WRITE_CHUNK = 50000
+
+
+def write_history(path, n_orders, names, days=730, seed=5):
+    """Write a synthetic orders CSV without holding it all in memory"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    for offset in range(0, n_orders, WRITE_CHUNK):
+        rows = []
+        for i in range(offset, min(offset + WRITE_CHUNK, n_orders)):
+            items = ", ".join(f"{rng.choice(names)} ({rng.randint(1, 9)}{rng.choice(UNITS)})"
+                              for _ in range(rng.randint(1, 4)))
+            date = (start + timedelta(days=i * days // n_orders)).strftime("%Y-%m-%d")
+            rows.append({"Order ID": f"HIS{i:08d}", "Customer": f"Store {rng.randint(1, 500)}",
+                         "Items": items, "Order Date": date})
+        pd.DataFrame(rows).to_csv(path, mode="a", header=offset == 0, index=False)
+
+
+def measure(load):
+    """Run load() under tracemalloc; returns (result, seconds, peak MB)"""
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - started
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak_mb
+
+
+def load_in_memory(path, names):
+    table = OrderLinesTable(pd.read_csv(path, dtype=str).to_dict("records"))
+    table.track_products(names)
+    return table.daily_demand()
+
+
+def load_streaming(path, names, chunk_rows):
+    table = OrderLinesTable()
+    table.track_products(names)
+    import_order_history(path, table, chunk_rows)
+    return table.daily_demand()
+
+
+def main(sizes=(100000, 500000), n_products=1000, chunk_rows=100000):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Order History Ingestion Benchmark")
+    print("=" * 78)
+    print(f"{'orders':>9}{'in-memory s':>13}{'peak MB':>10}{'streaming s':>13}{'peak MB':>10}{'same totals':>14}")
+
+    names = [f"Product {i:05d}" for i in range(n_products)]
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"orders_{size}.csv")
+            write_history(path, size, names)
+
+            expected, memory_s, memory_mb = measure(lambda: load_in_memory(path, names))
+            actual, stream_s, stream_mb = measure(lambda: load_streaming(path, names, chunk_rows))
+            same = bool(((expected - actual).abs() < 1e-9).all()) and len(expected) == len(actual)
+            print(f"{size:>9}{memory_s:>13.2f}{memory_mb:>10.1f}{stream_s:>13.2f}{stream_mb:>10.1f}{str(same):>14}")
+
+    print("-" * 78)
+    print(f"Streaming reads {chunk_rows} rows at a time; peak memory is Python allocations (tracemalloc)")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Product similarity benchmark: exact top-k index vs random-projection LSH
+
+Builds TF-IDF vectors for a synthetic catalog (products grouped in
+categories with their own vocabulary) and compares build time, per-query
+latency and recall@10 of LSH settings against the exact top-k neighbors.
+The exact per-query row is what a query costs without a prebuilt index.
+The scanned column is the share of the catalog each LSH query rescores:
+it stays flat for fixed bits, and shrinks with size for the "auto"
+settings, whose bits grow with the catalog.
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.similarity_index import RandomProjectionLSH, TopKNeighbors
+
+# (tables, bits) settings: more tables raise recall, more bits cut latency;
+# None derives the bits from the catalog size
+LSH_SETTINGS = [(8, 4), (16, 4), (32, 6), (32, 8), (64, 8), (64, 10), (32, None), (64, None)]
+QUERIES = 200
+TOP_N = 10
+
+
+def build_catalog(n_products, n_categories=200, seed=7):
+    """Category + description texts, as RecommendationEngine builds them"""
+    rng = random.Random(seed)
+    shared = [f"common{i}" for i in range(300)]
+    topics = [[f"c{c}w{i}" for i in range(25)] for c in range(n_categories)]
+    texts = []
+    for _ in range(n_products):
+        category = rng.randrange(n_categories)
+        words = rng.sample(topics[category], 4) + rng.sample(shared, 3)
+        texts.append(f"Category{category} " + " ".join(words))
+    return texts
+
+
+def recall(index, exact, rows):
+    """Share of the exact top-N neighbors (by similarity) that the index also returns"""
+    found = total = 0
+    for row in rows:
+        expected = {neighbor for neighbor, _ in exact.query(row, TOP_N)}
+        got = {neighbor for neighbor, _ in index.query(row, TOP_N)}
+        found += len(expected & got)
+        total += len(expected)
+    return found / max(total, 1)
+
+
+def query_time(index, rows, top_n=TOP_N):
+    started = time.perf_counter()
+    for row in rows:
+        index.query(row, top_n)
+    return (time.perf_counter() - started) / len(rows) * 1000
+
+
+def main(sizes=(5000, 20000, 50000)):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - Product Similarity Benchmark")
+    print("=" * 82)
+    print(f"{'SKUs':>7} {'index':<20}{'build s':>10}{'query ms':>11}{'recall@10':>11}{'candidates':>12}"
+          f"{'scanned':>10}")
+
+    for size in sizes:
+        vectors = TfidfVectorizer(stop_words='english').fit_transform(build_catalog(size))
+        rows = random.Random(1).sample(range(size), QUERIES)
+
+        started = time.perf_counter()
+        exact = TopKNeighbors(TOP_N).build(vectors)
+        build_s = time.perf_counter() - started
+        print(f"{size:>7} {'exact top-k':<20}{build_s:>10.2f}{query_time(exact, rows):>11.3f}{1:>11.3f}"
+              f"{'-':>12}{'-':>10}")
+        # Asking for more than the stored k searches the row exactly, as a query without an index would
+        print(f"{size:>7} {'exact per query':<20}{0:>10.2f}{query_time(exact, rows, TOP_N + 1):>11.3f}{1:>11.3f}"
+              f"{size:>12}{1:>10.1%}")
+
+        for n_tables, n_bits in LSH_SETTINGS:
+            started = time.perf_counter()
+            lsh = RandomProjectionLSH(n_tables, n_bits).build(vectors)
+            build_s = time.perf_counter() - started
+            candidates = np.mean([len(lsh.candidates(row)) for row in rows])
+            label = f"lsh {n_tables}x{lsh.n_bits} bits" + (" auto" if n_bits is None else "")
+            print(f"{size:>7} {label:<20}{build_s:>10.2f}{query_time(lsh, rows):>11.3f}"
+                  f"{recall(lsh, exact, rows):>11.3f}{candidates:>12.0f}{candidates / size:>10.1%}")
+        print("-" * 82)
+
+    print(f"Recall against the exact top {TOP_N}; query time averaged over {QUERIES} products")
+    print("=" * 82)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the chat NLP module
+
+Each measurement runs in a fresh interpreter so nothing is served from an
+already-warm import cache. Outbound socket connections are counted to show
+that importing and building the service needs no network access.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import socket, sys, time
+sys.path.insert(0, {frontend_dir!r})
+
+connections = []
+_connect = socket.socket.connect
+def counting_connect(self, address):
+    connections.append(address)
+    return _connect(self, address)
+socket.socket.connect = counting_connect
+
+{setup}
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(f"{{elapsed * 1000:.3f}} {{len(connections)}}")
+"""
+
+# (name, untimed setup, timed statement)
+SCENARIOS = [
+    ("import ai.nlp_service", "", "import ai.nlp_service"),
+    ("import ui.chat_interface", "", "import ui.chat_interface"),
+    # Inside the app Streamlit is already loaded, so only our own import cost remains
+    ("  with streamlit loaded", "import streamlit", "import ui.chat_interface"),
+    ("first get_nlp_service()", "",
+     "from ai.nlp_service import get_nlp_service\nget_nlp_service()"),
+    ("first reply (greeting)", "",
+     "from ai.nlp_service import get_nlp_service\nget_nlp_service().generate_response('hello')"),
+    ("first reply (tokenized)", "",
+     "from ai.nlp_service import get_nlp_service\nget_nlp_service().classify_intent('zzz qqq')"),
+]
+
+
+def run_probe(setup, statement):
+    """Run a statement in a fresh interpreter, returning (milliseconds, connections)"""
+    code = PROBE.format(frontend_dir=FRONTEND_DIR, setup=setup, statement=statement)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1]
+    elapsed, connections = result.stdout.strip().splitlines()[-1].split()
+    return float(elapsed), int(connections)
+
+
+def main(repeats=5):
+    """Main benchmark function"""
+    print("Mini Bharat AI Store - NLP Startup Benchmark")
+    print("=" * 60)
+    print(f"{'scenario':<28}{'median ms':>12}{'min ms':>10}{'sockets':>10}")
+
+    for name, setup, statement in SCENARIOS:
+        timings = []
+        connections = 0
+        error = None
+        for _ in range(repeats):
+            elapsed, info = run_probe(setup, statement)
+            if elapsed is None:
+                error = info
+                break
+            timings.append(elapsed)
+            connections = max(connections, info)
+
+        if error:
+            print(f"{name:<28}  skipped: {error}")
+        else:
+            print(f"{name:<28}{statistics.median(timings):>12.1f}{min(timings):>10.1f}{connections:>10}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
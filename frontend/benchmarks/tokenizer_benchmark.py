@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tokenizer benchmark: NLTK word tokenizer vs the precompiled regex tokenizer
+
+Reports per-message tokenization time for each backend and how often the
+two agree on the word tokens that intent classification actually uses.
+"""
+
+import os
+import sys
+import time
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.nlp_service import NLPService
+
+SAMPLE_MESSAGES = [
+    "Hello",
+    "How much wheat flour do I have in stock?",
+    "Show me my inventory",
+    "Place an order for 10kg of rice",
+    "order 5kg rice, 2kg sugar and 1L oil",
+    "Is 2.5kg atta available for ₹120?",
+    "When will my delivery arrive?",
+    "I don't see the tea packs, can you check?",
+    "what can you do",
+    "chawal 5 kg aur cheeni 2 kg bhejo",
+]
+
+
+def time_tokenizer(service, messages, rounds):
+    """Return the mean microseconds per message"""
+    # Warm up (the NLTK backend imports nltk on first use)
+    for message in messages:
+        service.process_text(message)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            service.process_text(message)
+    elapsed = time.perf_counter() - started
+    return elapsed / (rounds * len(messages)) * 1e6
+
+
+def keyword_agreement(nltk_service, regex_service, messages):
+    """Fraction of messages where both backends yield the same alphabetic keywords"""
+    agree = 0
+    for message in messages:
+        nltk_words = [t for t in nltk_service.process_text(message) if t.isalpha()]
+        regex_words = [t for t in regex_service.process_text(message) if t.isalpha()]
+        agree += nltk_words == regex_words
+    return agree / len(messages)
+
+
+def main(rounds=2000):
+    """Main benchmark function"""
+    nltk_service = NLPService(tokenizer='nltk')
+    regex_service = NLPService(tokenizer='regex')
+
+    print("Mini Bharat AI Store - Tokenizer Benchmark")
+    print("=" * 50)
+    nltk_us = time_tokenizer(nltk_service, SAMPLE_MESSAGES, rounds)
+    regex_us = time_tokenizer(regex_service, SAMPLE_MESSAGES, rounds)
+    print(f"{'nltk':<10}{nltk_us:>10.1f} us/message")
+    print(f"{'regex':<10}{regex_us:>10.1f} us/message ({nltk_us / regex_us:.1f}x faster)")
+    print(f"Keyword agreement: {keyword_agreement(nltk_service, regex_service, SAMPLE_MESSAGES):.0%}")
+
+    print("-" * 50)
+    for message in SAMPLE_MESSAGES[4:6]:
+        print(message)
+        print(f"  nltk:  {nltk_service.process_text(message)}")
+        print(f"  regex: {regex_service.process_text(message)}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,17 @@ class InventoryManager:
                 "Last Updated": datetime.now().strftime("%Y-%m-%d")
             }
         ]
+        self._products_by_id = {item["ID"]: item for item in self.inventory_data}
+        self._listeners = []
+    
+    def add_listener(self, callback):
+        """Register a callback that is called with each newly added product"""
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """Unregister a callback added with add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
     
     def get_inventory_df(self):
         """Return inventory as a pandas DataFrame"""
@@ -77,6 +88,15 @@ class InventoryManager:
         }
         
         self.inventory_data.append(new_product)
+        self._products_by_id[new_id] = new_product
+        
+        for listener in self._listeners:
+            listener(new_product)
+    
+    def get_product(self, product_id):
+        """Return a copy of a product record by ID, or None"""
+        product = self._products_by_id.get(product_id)
+        return dict(product) if product is not None else None
     
     def update_quantity(self, product_id, new_quantity):
         """Update the quantity of a product"""
@@ -33,6 +33,16 @@ class OrderManager:
                 "Delivery Date": (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
             }
         ]
+        self._listeners = []
+    
+    def add_listener(self, callback):
+        """Register a callback that is called with each newly added order"""
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """Unregister a callback added with add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
     
     def get_orders_df(self):
         """Return orders as a pandas DataFrame"""
@@ -53,6 +63,9 @@ class OrderManager:
         }
         
         self.orders_data.append(new_order)
+        
+        for listener in self._listeners:
+            listener(new_order)
         return new_id
     
     def update_order_status(self, order_id, status):
@@ -7,8 +7,8 @@ import os
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import the NLP service
-from ai.nlp_service import nlp_service
+# Import the NLP service (built lazily on the first message)
+from ai.nlp_service import get_nlp_service
 
 def chat_interface():
     # Create a container for the chat interface
@@ -60,7 +60,7 @@ def process_and_respond(user_input):
     })
     
     # Process the user input with NLP and generate response
-    response = nlp_service.generate_response(user_input)
+    response = get_nlp_service().generate_response(user_input)
     bot_timestamp = datetime.now().strftime("%H:%M")
     
     # Add bot response to chat history
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Focused checks for the chat and forecasting features that need no backend.
+Runs under pytest or as a script.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+import requests
+
+# Add the frontend directory to the path so we can import our modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend'))
+
+from ai.backend_client import BackendClient, CircuitOpenError
+from ai.calendar_features import CalendarFeatures, FESTIVAL_DATES
+from ai.catalog_cache import CatalogCache
+from ai.demand_forecasting import DemandForecaster
+from ai.nlp_service import NLPService
+from models.inventory import InventoryManager
+from models.orders import OrderManager
+
+CATALOG = [
+    {'id': 1, 'name': 'Wheat Flour', 'quantity': 100, 'price': 45},
+    {'id': 2, 'name': 'Rice', 'quantity': 50, 'price': 60},
+    {'id': 3, 'name': 'Sugar', 'quantity': 30, 'price': 42},
+    {'id': 4, 'name': 'Cooking Oil', 'quantity': 30, 'price': 120},
+    {'id': 5, 'name': 'Tea', 'quantity': 20, 'price': 180},
+]
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+def fake_backend(deducted):
+    """Stand-in for BackendClient.request that serves CATALOG and records deductions"""
+    def request(method, path, **kwargs):
+        if path == '/inventory/products':
+            return FakeResponse(200, {'success': True, 'data': CATALOG})
+        product_id = int(path.split('/')[3])
+        product = dict(next(p for p in CATALOG if p['id'] == product_id))
+        product['quantity'] -= kwargs['json']['quantity']
+        deducted.append((product['name'], kwargs['json']['quantity']))
+        return FakeResponse(200, {'success': True, 'data': product})
+    return request
+
+
+def make_service(deducted=None):
+    service = NLPService(tokenizer='regex')
+    service.update_product_vocabulary(product['name'] for product in CATALOG)
+    service.client.request = fake_backend([] if deducted is None else deducted)
+    return service
+
+
+class StubClient:
+    """Stand-in for BackendClient that replays canned responses and records request headers"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def get(self, path, headers=None):
+        self.headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+def scripted_session(client, *outcomes):
+    """Replace the client's session.request with canned responses or exceptions; returns the call log"""
+    calls = []
+    outcomes = list(outcomes)
+
+    def request(method, url, **kwargs):
+        calls.append(method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    client.session.request = request
+    return calls
+
+
+def make_store(n_products=30, days=60, orders_per_day=15, seed=3):
+    """Inventory and order managers with synthetic order history up to yesterday"""
+    rng = random.Random(seed)
+    inventory = InventoryManager()
+    names = [f"Product {i:03d}" for i in range(n_products)]
+    for name in names:
+        inventory.add_product(name, "Grocery", 50, 100, "Supplier", "")
+
+    orders = OrderManager()
+    start = datetime.now() - timedelta(days=days)
+    for day in range(days):
+        date = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        for _ in range(orders_per_day):
+            items = ", ".join(f"{rng.choice(names)} ({rng.randint(1, 9)}kg)" for _ in range(rng.randint(1, 3)))
+            orders.orders_data.append({
+                "Order ID": f"SYN{len(orders.orders_data):05d}",
+                "Customer": f"Store {rng.randint(1, 50)}",
+                "Items": items,
+                "Total (₹)": 0.0,
+                "Status": "Delivered",
+                "Order Date": date,
+                "Delivery Date": date
+            })
+    return inventory, orders, names
+
+
+def products_in(service, text):
+    _, entities = service._analyze(text)
+    return [entity['text'] for entity in entities['custom_entities'] if entity['label'] == 'PRODUCT']
+
+
+def test_everyday_words_are_not_products():
+    service = make_service()
+    assert products_in(service, "I am looking to order 2kg sugar") == ['sugar']
+    assert products_in(service, "booking a delivery for tomorrow") == []
+    assert products_in(service, "whats the price of rice") == ['rice']
+    assert products_in(service, "what is the price today") == []
+    assert service._order_lines(service._analyze("I am looking to order 2kg sugar")[1]) == [('sugar', '2kg')]
+
+
+def test_misspelt_and_hinglish_names_still_match():
+    service = make_service()
+    assert products_in(service, "order 2kg suger") == ['sugar']
+    assert products_in(service, "send 5kg chawal") == ['rice']
+    assert products_in(service, "I need cheeni 2kg") == ['sugar']
+    # 'hi' inside "chini" is not a greeting and must not block the alias lookup
+    assert products_in(service, "I need chini 2kg") == ['sugar']
+
+
+def test_multi_line_order_pairing():
+    service = make_service()
+
+    def lines(text):
+        return service._order_lines(service._analyze(text)[1])
+
+    assert lines("order 5kg rice, 2kg sugar and 1l oil") == [('rice', '5kg'), ('sugar', '2kg'), ('oil', '1l')]
+    assert lines("order rice, 2kg sugar") == [('rice', None), ('sugar', '2kg')]
+    # A misspelt product without a quantity is dropped, not asked about
+    assert lines("order 2kg sugar and cookng") == [('sugar', '2kg')]
+
+
+def test_multi_line_order_from_running_event_loop():
+    deducted = []
+    service = make_service(deducted)
+
+    async def handler():
+        single = service.generate_response("order 1kg rice and 2kg sugar")
+        batch = await service.generate_responses_async(["order 3kg tea", "hello"])
+        return single, batch
+
+    single, batch = asyncio.run(handler())
+    assert single.startswith("Placed 2 of 2 order lines")
+    assert batch[0].startswith("Successfully placed order for 3kg of Tea")
+    assert sorted(deducted) == [('Rice', 1), ('Sugar', 2), ('Tea', 3)]
+
+
+def test_festival_flags_cover_default_years():
+    calendar = CalendarFeatures()
+    columns = calendar.columns
+    for name, dates in FESTIVAL_DATES.items():
+        years = {int(date[:4]) for date in dates}
+        assert set(range(2020, 2031)) <= years, name
+        flags = calendar.lookup(dates)
+        assert flags[:, columns.index(name)].all(), name
+        assert flags[:, columns.index('festival')].all(), name
+
+
+def test_festival_data_gap_warns():
+    calendar = CalendarFeatures()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        calendar.lookup(['2031-06-01'])
+    assert any('2031' in str(warning.message) for warning in caught)
+
+
+def test_catalog_cache_ttl_and_etag():
+    updated = dict(CATALOG[1], quantity=45)
+    client = StubClient(FakeResponse(200, {'data': CATALOG}, {'ETag': 'W/"1"'}),
+                        FakeResponse(304, None),
+                        FakeResponse(200, {'data': [updated]}, {'ETag': 'W/"2"'}))
+    cache = CatalogCache(client, ttl=60)
+
+    def expire():
+        cache._fetched_at -= 61
+
+    assert cache.products() == CATALOG
+    assert cache.products() == CATALOG
+    assert len(client.headers) == 1 and 'If-None-Match' not in client.headers[0]
+
+    # Expired: revalidated with the ETag, and a 304 keeps the cached list
+    expire()
+    assert cache.products() == CATALOG
+    assert client.headers[1] == {'If-None-Match': 'W/"1"'}
+    assert cache.is_fresh()
+
+    # A deduct-stock response updates the copy in place, so the ETag no longer applies
+    cache.apply_update(updated)
+    assert cache.get(2)['quantity'] == 45
+    expire()
+    assert cache.products() == [updated]
+    assert 'If-None-Match' not in client.headers[2]
+    assert cache.find('rice') == updated
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['stale'], stats['revalidated'], stats['updates']) == (1, 1, 2, 1, 1)
+    assert stats['products'] == 1
+
+
+def test_backend_client_retries_only_gets():
+    client = BackendClient(base_url='http://backend.test/api', retries=2, backoff=0)
+
+    calls = scripted_session(client, FakeResponse(503, None), requests.exceptions.ConnectionError(),
+                             FakeResponse(200, {}))
+    assert client.get('/inventory/products').status_code == 200
+    assert calls == ['GET', 'GET', 'GET']
+
+    # Stock deductions are never sent twice
+    calls = scripted_session(client, FakeResponse(503, None))
+    assert client.post('/inventory/products/1/deduct-stock', json={'quantity': 1}).status_code == 503
+    calls = scripted_session(client, requests.exceptions.Timeout())
+    try:
+        client.post('/inventory/products/1/deduct-stock', json={'quantity': 1})
+        assert False, "timeout was not raised"
+    except requests.exceptions.Timeout:
+        pass
+    assert calls == ['POST']
+    assert client.latency_stats()['POST /inventory/products/:id/deduct-stock']['count'] == 2
+
+
+def test_backend_client_circuit_breaker():
+    client = BackendClient(base_url='http://backend.test/api', retries=0, failure_threshold=2, reset_timeout=30)
+
+    calls = scripted_session(client, requests.exceptions.ConnectionError(), FakeResponse(503, None))
+    for _ in range(2):
+        try:
+            client.get('/health')
+        except requests.exceptions.ConnectionError:
+            pass
+    assert client.breaker.state == 'open'
+
+    # Open: fails fast without touching the network
+    try:
+        client.get('/health')
+        assert False, "open circuit did not raise"
+    except CircuitOpenError:
+        pass
+    assert len(calls) == 2
+
+    # Half-open after the reset timeout: one failed probe opens it again
+    client.breaker.opened_at -= 31
+    assert client.breaker.state == 'half_open'
+    calls = scripted_session(client, FakeResponse(503, None))
+    assert client.get('/health').status_code == 503
+    assert client.breaker.state == 'open'
+
+    # ...and a successful probe closes it
+    client.breaker.opened_at -= 31
+    calls = scripted_session(client, FakeResponse(200, {}))
+    assert client.get('/health').status_code == 200
+    assert client.breaker.state == 'closed' and client.breaker.failures == 0
+    assert calls == ['GET']
+
+
+def test_batch_training_matches_sklearn():
+    inventory, orders, names = make_store()
+    reference_date = datetime.now()
+    batch = DemandForecaster(orders, inventory, batch_training=True)
+    sequential = DemandForecaster(orders, inventory, batch_training=False)
+    batch.reference_date = sequential.reference_date = reference_date
+    try:
+        actual = batch.forecast_all(names)
+        for name in names:
+            expected = np.array(sequential.forecast_demand(name))
+            # Relative to the forecast size (at least one unit), as in the forecast benchmark
+            assert np.max(np.abs(np.array(actual[name]) - expected) / np.maximum(np.abs(expected), 1)) < 1e-6, name
+    finally:
+        batch.close()
+        sequential.close()
+
+
+def test_online_updates_match_retraining():
+    inventory, orders, names = make_store()
+    online = DemandForecaster(orders, inventory)
+    online.train_all_models()
+
+    # A new day for both products, then a second order on that same day for one
+    orders.add_order("Store 1", f"{names[0]} (3kg), {names[1]} (2kg)", 0)
+    orders.add_order("Store 2", f"{names[0]} (4kg)", 0)
+
+    fresh = DemandForecaster(orders, inventory, online_updates=False)
+    fresh.train_all_models()
+    try:
+        for name in names[:2]:
+            expected = np.append(fresh.models[name]['model'].coef, fresh.models[name]['model'].intercept)
+            actual = np.append(online.models[name]['model'].coef, online.models[name]['model'].intercept)
+            np.testing.assert_allclose(actual, expected, rtol=1e-7, atol=1e-7 * np.abs(expected).max())
+    finally:
+        online.close()
+        fresh.close()
+
+
+def test_parallel_forecasts_match_serial():
+    inventory, orders, names = make_store()
+    reference_date = datetime.now()
+    results = {}
+    for workers in (1, 2):
+        for backend in ('polynomial', 'auto'):
+            forecaster = DemandForecaster(orders, inventory, workers=workers, chunk_size=8, backend=backend)
+            forecaster.reference_date = reference_date
+            try:
+                results[workers, backend] = forecaster.forecast_all(names)
+            finally:
+                forecaster.close()
+
+    for backend in ('polynomial', 'auto'):
+        assert results[2, backend] == results[1, backend], backend
+
+
+def main():
+    """Main test function"""
+    print("Mini Bharat AI Store - AI Feature Tests")
+    print("=" * 40)
+
+    tests = [
+        test_everyday_words_are_not_products,
+        test_misspelt_and_hinglish_names_still_match,
+        test_multi_line_order_pairing,
+        test_multi_line_order_from_running_event_loop,
+        test_festival_flags_cover_default_years,
+        test_festival_data_gap_warns,
+        test_catalog_cache_ttl_and_etag,
+        test_backend_client_retries_only_gets,
+        test_backend_client_circuit_breaker,
+        test_batch_training_matches_sklearn,
+        test_online_updates_match_retraining,
+        test_parallel_forecasts_match_serial
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+
+    print("=" * 40)
+    print(f"{len(tests) - failed} of {len(tests)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
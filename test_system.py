@@ -5,18 +5,22 @@ Test script to verify the Mini Bharat AI Store system
 
 import sys
 import os
-import requests
 import time
 
 # Add the current directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend'))
+
+from ai.backend_client import BackendClient
+
+# One pooled client for every backend check
+backend_client = BackendClient()
 
 def test_backend_api():
     """Test backend API connectivity"""
     try:
         print("Testing backend API connectivity...")
-        backend_base_url = os.getenv("BACKEND_URL", "http://localhost:3001/api")
-        response = requests.get(f"{backend_base_url}/health", timeout=5)
+        response = backend_client.get("/health")
         if response.status_code == 200 and response.json().get("status") == "OK":
             print("✅ Backend API: RUNNING")
             return True
@@ -31,8 +35,7 @@ def test_database_connection():
     """Test database connection through API"""
     try:
         print("Testing database connection...")
-        backend_base_url = os.getenv("BACKEND_URL", "http://localhost:3001/api")
-        response = requests.get(f"{backend_base_url}/inventory/products", timeout=5)
+        response = backend_client.get("/inventory/products")
         if response.status_code == 200:
             data = response.json()
             if data.get("success") and "data" in data:
@@ -53,8 +56,7 @@ def test_nlp_service():
     try:
         print("Testing NLP service...")
         # Import and test NLP service
-        sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend'))
-        from frontend.ai.nlp_service import nlp_service
+        from ai.nlp_service import nlp_service
         
         # Test intent classification
         test_sentence = "How much wheat flour do I have in stock?"
@@ -75,10 +77,9 @@ def test_ai_service():
     try:
         print("Testing AI service...")
         # Import and test AI service
-        sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend'))
-        from frontend.models.inventory import InventoryManager
-        from frontend.models.orders import OrderManager
-        from frontend.ai.ai_service import AIService
+        from models.inventory import InventoryManager
+        from models.orders import OrderManager
+        from ai.ai_service import AIService
         
         # Initialize managers
         inventory_manager = InventoryManager()
@@ -3,18 +3,22 @@
 Final verification script for Mini Bharat AI Store integration
 """
 
-import requests
 import sys
 import os
 
 # Add the current directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend'))
+
+from ai.backend_client import BackendClient
+
+# One pooled client for every backend check
+backend_client = BackendClient()
 
 def verify_backend_api():
     """Verify backend API is running and accessible"""
     try:
-        backend_base_url = os.getenv("BACKEND_URL", "http://localhost:3001/api")
-        response = requests.get(f"{backend_base_url}/health")
+        response = backend_client.get("/health")
         if response.status_code == 200 and response.json().get("status") == "OK":
             print("Backend API: RUNNING")
             return True
@@ -28,8 +32,7 @@ def verify_backend_api():
 def verify_database_connection():
     """Verify database connection through API"""
     try:
-        backend_base_url = os.getenv("BACKEND_URL", "http://localhost:3001/api")
-        response = requests.get(f"{backend_base_url}/inventory/products")
+        response = backend_client.get("/inventory/products")
         if response.status_code == 200:
             data = response.json()
             if data.get("success") and "data" in data: